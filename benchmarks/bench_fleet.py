@@ -0,0 +1,273 @@
+"""Scale benchmark of polling and discovery against a simulated fleet.
+
+For each fleet size, starts ``benchmarks/simulator.py`` in a subprocess,
+so serving the miners does not count against the event loop being
+measured, and runs the real ``BitaxeCoordinator`` and
+``BitaxeDiscovery`` against it. Reports:
+
+- poll cycle wall time: the first cycle (new connections, static tier)
+  and the steady cycles after it
+- event loop blocking: longest lag of a 1 ms ticker while polling, and
+  the total of lags over 5 ms (shorter ones are mostly timer slack)
+- memory per miner: bytes allocated by the integration's code and still
+  held after polling (tracemalloc, in a separate pass so tracing does
+  not skew the timings)
+- full-sweep discovery time, miners found and the concurrency it tuned
+  itself to
+
+Simulated miners get one loopback address each on port 80, so run it as
+root (or with CAP_NET_BIND_SERVICE) on Linux, from the repository root
+inside the Home Assistant Python environment:
+
+    python benchmarks/bench_fleet.py --miners 10 100 1000 [--cycles 5]
+    python benchmarks/bench_fleet.py --miners 100 --latency 0.2 --timeout-rate 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import ipaddress
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+SIMULATOR = ROOT / "benchmarks" / "simulator.py"
+
+
+class LoopLagMonitor:
+    """Measures how late a short periodic sleep wakes up."""
+
+    def __init__(self, interval: float = 0.001, threshold: float = 0.005) -> None:
+        """Initialize the monitor; lags over threshold count as blocking."""
+        self.interval = interval
+        self.threshold = threshold
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start ticking."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop ticking."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """Sleep for the interval over and over, recording the overshoot."""
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - started - self.interval
+            self.max_lag = max(self.max_lag, lag)
+            if lag > self.threshold:
+                self.total_lag += lag
+
+
+@asynccontextmanager
+async def simulated_fleet(
+    miners: int, simulator_args: list[str]
+) -> AsyncIterator[tuple[list[str], str]]:
+    """Run the simulator and yield its miner addresses and scan target."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(SIMULATOR),
+        "--miners",
+        str(miners),
+        *simulator_args,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    try:
+        line = (await process.stdout.readline()).decode().strip()
+        if not line.startswith("READY "):
+            raise RuntimeError(f"Simulator did not start: {line!r}")
+        target = line.split(" ", 1)[1]
+        first, last = target.split("-")
+        yield _address_range(first, last), target
+    finally:
+        process.terminate()
+        await process.wait()
+
+
+def _address_range(first: str, last: str) -> list[str]:
+    """Return the addresses from first to last inclusive."""
+    start = int(ipaddress.IPv4Address(first))
+    end = int(ipaddress.IPv4Address(last))
+    return [str(ipaddress.IPv4Address(value)) for value in range(start, end + 1)]
+
+
+def _coordinator(hass: Any, addresses: list[str], args: argparse.Namespace) -> Any:
+    """Return a coordinator polling the simulated miners."""
+    from custom_components.bitaxe.coordinator import BitaxeCoordinator
+
+    return BitaxeCoordinator(
+        hass,
+        {
+            "miners": addresses,
+            "scan_interval": 0,
+            "poll_interval": 30,
+            "poll_deadline": args.deadline,
+            "poll_concurrency": args.poll_concurrency,
+        },
+    )
+
+
+async def bench_polling(
+    hass: Any, addresses: list[str], args: argparse.Namespace
+) -> dict[str, Any]:
+    """Time poll cycles and the event loop lag while they run."""
+    from custom_components.bitaxe.const import EVENT_BLOCK_FOUND
+
+    coordinator = _coordinator(hass, addresses, args)
+    blocks = 0
+
+    def _count_block(event: Any) -> None:
+        nonlocal blocks
+        blocks += 1
+
+    unsubscribe = hass.bus.async_listen(EVENT_BLOCK_FOUND, _count_block)
+    monitor = LoopLagMonitor()
+    monitor.start()
+    cycles: list[float] = []
+    try:
+        for _ in range(args.cycles):
+            started = time.perf_counter()
+            await coordinator.async_refresh()
+            cycles.append(time.perf_counter() - started)
+    finally:
+        await monitor.stop()
+        unsubscribe()
+        await coordinator.async_shutdown()
+
+    steady = cycles[1:] or cycles
+    online = sum(snapshot.available for snapshot in coordinator.miners.values())
+    return {
+        "first_cycle_ms": cycles[0] * 1000,
+        "steady_cycle_ms": statistics.mean(steady) * 1000,
+        "max_cycle_ms": max(cycles) * 1000,
+        "loop_max_lag_ms": monitor.max_lag * 1000,
+        "loop_blocked_ms": monitor.total_lag * 1000,
+        "online": online,
+        "timeouts": coordinator.poll_stats.timeouts,
+        "errors": coordinator.poll_stats.errors,
+        "blocks": blocks,
+    }
+
+
+async def bench_memory(
+    hass: Any, addresses: list[str], args: argparse.Namespace
+) -> dict[str, Any]:
+    """Measure memory the integration holds per miner after polling."""
+    tracemalloc.start(25)
+    try:
+        coordinator = _coordinator(hass, addresses, args)
+        for _ in range(2):
+            await coordinator.async_refresh()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    held = snapshot.filter_traces(
+        [tracemalloc.Filter(True, "*custom_components/bitaxe/*", all_frames=True)]
+    )
+    total = sum(stat.size for stat in held.statistics("filename"))
+    await coordinator.async_shutdown()
+    return {"bytes_per_miner": total / len(addresses)}
+
+
+async def bench_discovery(target: str, args: argparse.Namespace) -> dict[str, Any]:
+    """Time a full sweep of the simulated address range."""
+    from custom_components.bitaxe.const import STRATEGY_FULL
+    from custom_components.bitaxe.discovery import BitaxeDiscovery
+
+    discovery = BitaxeDiscovery(
+        target,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        strategy=STRATEGY_FULL,
+    )
+    started = time.perf_counter()
+    found = await discovery.discover()
+    return {
+        "sweep_s": time.perf_counter() - started,
+        "found": len(found),
+        "final_concurrency": discovery.concurrency,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run every benchmark for every fleet size and print a table."""
+    sys.path.insert(0, str(ROOT))
+    # Importing the core first avoids a circular import in some versions
+    from homeassistant.core import HomeAssistant
+
+    simulator_args = [
+        "--latency", str(args.latency),
+        "--jitter", str(args.jitter),
+        "--timeout-rate", str(args.timeout_rate),
+        "--not-found-rate", str(args.not_found_rate),
+        "--block-rate", str(args.block_rate),
+    ]
+    columns = (
+        ("miners", "{:>7}"),
+        ("online", "{:>7}"),
+        ("first_cycle_ms", "{:>15.1f}"),
+        ("steady_cycle_ms", "{:>16.1f}"),
+        ("loop_max_lag_ms", "{:>16.1f}"),
+        ("loop_blocked_ms", "{:>16.1f}"),
+        ("bytes_per_miner", "{:>16.0f}"),
+        ("sweep_s", "{:>8.2f}"),
+        ("found", "{:>6}"),
+        ("timeouts", "{:>9}"),
+        ("blocks", "{:>7}"),
+    )
+    print("".join(f"{name:>{len(fmt.format(0))}}" for name, fmt in columns))
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for miners in args.miners:
+            async with simulated_fleet(miners, simulator_args) as (addresses, target):
+                result: dict[str, Any] = {"miners": miners}
+                result.update(await bench_polling(hass, addresses, args))
+                result.update(await bench_memory(hass, addresses, args))
+                if not args.skip_discovery:
+                    result.update(await bench_discovery(target, args))
+            print(
+                "".join(
+                    fmt.format(result[name])
+                    if name in result
+                    else " " * len(fmt.format(0))
+                    for name, fmt in columns
+                )
+            )
+
+
+def main() -> None:
+    """Parse the command line and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--deadline", type=float, default=3.0)
+    parser.add_argument("--poll-concurrency", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=1.5)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--not-found-rate", type=float, default=0.0)
+    parser.add_argument("--block-rate", type=float, default=0.0)
+    parser.add_argument("--skip-discovery", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
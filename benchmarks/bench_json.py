@@ -0,0 +1,70 @@
+"""Micro-benchmark for decoding AxeOS API responses.
+
+Compares the old decode path (text decode + stdlib json, as done by
+aiohttp's ``response.json()``) with ``decode_json`` using orjson and the
+stdlib fallback, with and without the field whitelist, and the full
+decode + ``MinerSnapshot`` parse done per miner per poll.
+
+Run from the repository root inside the Home Assistant Python
+environment, e.g. on the HA host itself:
+
+    python benchmarks/bench_json.py [--number 20000]
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+from pathlib import Path
+import sys
+import timeit
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+PAYLOADS = ROOT / "benchmarks" / "payloads"
+
+
+def _cases(body: bytes, is_info: bool) -> dict[str, Callable[[], Any]]:
+    """Return the decode variants to time for one payload."""
+    from custom_components.bitaxe import api
+    from custom_components.bitaxe.models import INFO_FIELDS, MinerSnapshot
+
+    cases: dict[str, Callable[[], Any]] = {
+        "stdlib text decode (old)": lambda: json.loads(body.decode("utf-8")),
+        # What decode_json does when orjson is not installed
+        "stdlib bytes decode (fallback)": lambda: json.loads(body),
+        "decode_json": lambda: api.decode_json(body),
+    }
+    if is_info:
+        cases["decode_json + whitelist"] = lambda: api.decode_json(body, INFO_FIELDS)
+        cases["old decode + snapshot"] = lambda: MinerSnapshot.from_api(
+            "192.0.2.1", json.loads(body.decode("utf-8"))
+        )
+        cases["decode_json + snapshot"] = lambda: MinerSnapshot.from_api(
+            "192.0.2.1", api.decode_json(body)
+        )
+    return cases
+
+
+def main() -> None:
+    """Run the benchmark and print a table of per-call timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    from custom_components.bitaxe import api
+
+    print(f"orjson available: {api.orjson is not None}")
+    print(f"{'payload':<28}{'case':<34}{'us/call':>10}")
+
+    for path in sorted(PAYLOADS.glob("*.json")):
+        cases = _cases(path.read_bytes(), path.stem.endswith("_info"))
+        for name, func in cases.items():
+            seconds = min(timeit.repeat(func, number=args.number, repeat=3))
+            per_call = seconds / args.number * 1_000_000
+            print(f"{path.stem:<28}{name:<34}{per_call:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Replay a capture of raw miner responses through the integration.
+
+Reads a log written with the "Capture Raw Responses" option and feeds it
+back through ``BitaxeCoordinator._async_update_data`` one recorded poll
+cycle at a time, with the coordinator's clock following the capture so
+rolling windows, baselines and backoff behave as they did live. After
+each cycle every sensor's ``value_fn`` (and ``attr_fn``) is evaluated
+against the resulting snapshots, and the fleet sensors against the
+coordinator, so a capture of a misbehaving miner reproduces the failure
+without the hardware.
+
+Each cycle answers a miner's requests with the latest response it gave
+by the end of the recorded cycle; timeouts and connection errors replay
+as such. Run from the repository root inside the Home Assistant Python
+environment:
+
+    python benchmarks/replay.py bitaxe_captures/<entry>-<time>.jsonl.gz
+    python benchmarks/replay.py capture.jsonl.gz --speed 60 --repeat 3
+
+``--speed`` replays that many times faster than recorded; the default 0
+replays as fast as possible and reports the speedup.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+import traceback
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class ReplayClock:
+    """Stands in for the time module inside the coordinator.
+
+    ``monotonic`` returns the capture time being replayed, everything
+    else is the real time module. Requests are answered with what the
+    miners had said by ``until``.
+    """
+
+    def __init__(self) -> None:
+        """Start at capture time 0."""
+        self.now = 0.0
+        self.until = 0.0
+
+    def monotonic(self) -> float:
+        """Return the replayed capture time."""
+        return self.now
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate to the time module."""
+        return getattr(time, name)
+
+
+def _replay_coordinator(hass: Any, log: Any, clock: ReplayClock) -> Any:
+    """Return a coordinator that answers its requests from the capture."""
+    from custom_components.bitaxe.coordinator import BitaxeCoordinator
+
+    class ReplayCoordinator(BitaxeCoordinator):
+        """Coordinator whose miners answer from a capture log."""
+
+        async def _fetch_api(
+            self, ip: str, endpoint: str
+        ) -> dict[str, Any] | None:
+            """Answer a request with the captured response."""
+            record = log.response(ip, endpoint, clock.until)
+            if record is None:
+                return None
+            if record["error"] is not None:
+                self._failure_reasons[ip] = record["error"]
+                if record["error"] == "timeout":
+                    self.poll_stats.record_timeout(ip)
+                else:
+                    self.poll_stats.record_error(ip)
+                return None
+            try:
+                data = self._decode_response(
+                    ip,
+                    f"http://{ip}{endpoint}",
+                    record["status"],
+                    record["body"].encode(),
+                )
+            except ValueError:
+                self.poll_stats.record_error(ip)
+                return None
+            if data is not None:
+                self.poll_stats.record_request(ip, None, record["elapsed"], 0.0)
+            return data
+
+    gaps = [b - a for a, b in zip(log.cycles, log.cycles[1:])]
+    return ReplayCoordinator(
+        hass,
+        {
+            "miners": log.miners,
+            "scan_interval": 0,
+            "poll_interval": statistics.median(gaps) if gaps else 30,
+            # Answers are instant, wait for all of them
+            "poll_deadline": 0,
+        },
+    )
+
+
+class SensorCheck:
+    """Evaluates every sensor description against replayed data."""
+
+    def __init__(self) -> None:
+        """Collect the sensor descriptions."""
+        from custom_components.bitaxe.sensor import (
+            FLEET_SENSOR_TYPES,
+            SENSOR_TYPES,
+        )
+
+        self._miner_types = SENSOR_TYPES
+        self._fleet_types = FLEET_SENSOR_TYPES
+        self.evaluated = 0
+        self.failures: Counter[str] = Counter()
+        # First traceback per failing sensor
+        self.tracebacks: dict[str, str] = {}
+
+    def check(self, coordinator: Any) -> None:
+        """Compute every sensor value the entities would publish."""
+        for snapshot in coordinator.miners.values():
+            for description in self._miner_types:
+                if snapshot.available:
+                    self._call(description.key, description.value_fn, snapshot)
+                if description.attr_fn is not None:
+                    self._call(description.key, description.attr_fn, snapshot)
+        for description in self._fleet_types:
+            self._call(f"fleet {description.key}", description.value_fn, coordinator)
+
+    def _call(self, key: str, function: Any, argument: Any) -> None:
+        """Call one value function, recording what it raises."""
+        self.evaluated += 1
+        try:
+            function(argument)
+        except Exception:  # pylint: disable=broad-except
+            self.failures[key] += 1
+            self.tracebacks.setdefault(key, traceback.format_exc())
+
+
+async def replay(args: argparse.Namespace) -> int:
+    """Replay the capture and print a report; return the exit status."""
+    sys.path.insert(0, str(ROOT))
+    # Importing the core first avoids a circular import in some versions
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.bitaxe import coordinator as coordinator_module
+    from custom_components.bitaxe.capture import CaptureLog
+
+    log = CaptureLog.load(args.capture)
+    if not log.cycles:
+        print(f"{args.capture} has no poll cycles")
+        return 1
+    recorded = log.cycles[-1] - log.cycles[0]
+    ends = [*log.cycles[1:], float("inf")]
+    print(
+        f"{args.capture}: {len(log.miners)} miners, {len(log.cycles)} cycles, "
+        f"{log.responses} responses over {recorded:.0f} s"
+    )
+
+    clock = ReplayClock()
+    sensors = SensorCheck()
+    coordinator_module.time = clock
+    elapsed = 0.0
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            for _ in range(args.repeat):
+                coordinator = _replay_coordinator(hass, log, clock)
+                started = time.perf_counter()
+                for index, start in enumerate(log.cycles):
+                    if args.speed and index:
+                        await asyncio.sleep(
+                            (start - log.cycles[index - 1]) / args.speed
+                        )
+                    # Answers recorded before the next cycle belong to this one
+                    clock.now = start
+                    clock.until = ends[index]
+                    await coordinator._async_update_data()
+                    sensors.check(coordinator)
+                elapsed += time.perf_counter() - started
+                await coordinator.async_shutdown()
+    finally:
+        coordinator_module.time = time
+
+    cycles = len(log.cycles) * args.repeat
+    online = sum(snapshot.available for snapshot in coordinator.miners.values())
+    print(
+        f"replayed {cycles} cycles in {elapsed:.2f} s: "
+        f"{cycles / elapsed:.0f} cycles/s, "
+        f"{recorded * args.repeat / elapsed:.0f}x recorded speed"
+    )
+    print(
+        f"{online}/{len(coordinator.miners)} miners online at the end, "
+        f"{coordinator.poll_stats.timeouts} timeouts, "
+        f"{coordinator.poll_stats.errors} errors"
+    )
+    print(
+        f"{sensors.evaluated} sensor values evaluated, "
+        f"{sum(sensors.failures.values())} failed"
+    )
+    for key, count in sensors.failures.most_common():
+        print(f"\n{key}: failed {count} times\n{sensors.tracebacks[key]}")
+    return 1 if sensors.failures else 0
+
+
+def main() -> None:
+    """Parse the command line and replay the capture."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", help="capture file (.jsonl.gz)")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="times faster than recorded, 0 for as fast as possible",
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    sys.exit(asyncio.run(replay(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""Simulated fleet of AxeOS miners for benchmarks.
+
+Serves ``/api/system/info``, ``/api/system/metrics`` and the ``/api/ws``
+log stream for many miners from one process, built from the payloads in
+``benchmarks/payloads``.
+Each miner either gets its own loopback address on port 80, which is
+what the integration polls and discovery sweeps (Linux routes all of
+127.0.0.0/8 to loopback; binding port 80 needs root or
+CAP_NET_BIND_SERVICE), or its own port on 127.0.0.1, which works for
+polling only.
+
+Latency, jitter, requests that never answer in time, older firmware
+without the metrics and websocket endpoints, block finds and the log
+line rate are configurable. Prints one
+``READY <addresses>`` line once listening and runs until interrupted:
+
+    python benchmarks/simulator.py --miners 100 --latency 0.02 --jitter 0.01
+    python benchmarks/simulator.py --miners 50 --port-base 8000 --timeout-rate 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import ipaddress
+import json
+from pathlib import Path
+import random
+import time
+from typing import Any
+
+from aiohttp import web
+
+PAYLOADS = Path(__file__).resolve().parent / "payloads"
+
+
+@dataclass
+class SimulatorConfig:
+    """Shape and behavior of the simulated fleet."""
+
+    miners: int = 10
+    # First miner address; the others follow it
+    first_address: str = "127.1.0.1"
+    # One port per miner on 127.0.0.1 instead of one address per miner
+    port_base: int | None = None
+    # Seconds before each response, +/- a uniform jitter
+    latency: float = 0.02
+    jitter: float = 0.01
+    # Share of requests that stall for hang seconds instead of answering
+    timeout_rate: float = 0.0
+    hang: float = 30.0
+    # Share of miners whose firmware has no metrics or websocket endpoint
+    not_found_rate: float = 0.0
+    # Chance per info request or log line that the miner finds a block
+    block_rate: float = 0.0
+    # Seconds between log lines sent to each websocket client
+    log_interval: float = 1.0
+    seed: int = 0
+
+
+class SimulatedMiner:
+    """State of one simulated miner."""
+
+    def __init__(
+        self,
+        index: int,
+        info: dict[str, Any],
+        metrics: dict[str, Any] | None,
+        rng: random.Random,
+    ) -> None:
+        """Initialize the miner from template payloads."""
+        self._rng = rng
+        self._started = time.monotonic()
+        self._hashrate = info["hashRate"]
+        self.info = dict(info)
+        self.info["macAddr"] = "24:58:7C:{:02X}:{:02X}:{:02X}".format(
+            *(index + 1).to_bytes(3, "big")
+        )
+        self.info["hostname"] = f"bitaxe-sim-{index + 1}"
+        self.metrics = json.dumps(metrics).encode() if metrics is not None else None
+        self._lines = 0
+
+    def info_body(self, block_rate: float) -> bytes:
+        """Advance the miner's counters and return its system info."""
+        info = self.info
+        info["uptimeSeconds"] = int(time.monotonic() - self._started) + 60
+        info["hashRate"] = round(self._hashrate * self._rng.uniform(0.97, 1.03), 3)
+        info["sharesAccepted"] = info.get("sharesAccepted", 0) + self._rng.randrange(4)
+        if self._rng.random() < 0.01:
+            info["sharesRejected"] = info.get("sharesRejected", 0) + 1
+        if self._rng.random() < block_rate:
+            info["foundBlocks"] = info.get("foundBlocks", 0) + 1
+            info["totalFoundBlocks"] = info.get("totalFoundBlocks", 0) + 1
+        return json.dumps(info).encode()
+
+    def log_line(self, block_rate: float) -> str:
+        """Advance the miner's counters and return its next log line.
+
+        Lines are in the ESP-IDF format AxeOS streams, with color codes:
+        share results, a temperature reading every fifth line, nonces and
+        the occasional block.
+        """
+        info = self.info
+        self._lines += 1
+        uptime = int((time.monotonic() - self._started) * 1000)
+        if self._rng.random() < block_rate:
+            info["foundBlocks"] = info.get("foundBlocks", 0) + 1
+            info["totalFoundBlocks"] = info.get("totalFoundBlocks", 0) + 1
+            message = "I", "system", "FOUND BLOCK!!!!!!!!!!!!!!!!!!!!!!"
+        elif self._lines % 5 == 0:
+            info["temp"] = round(info.get("temp", 60) + self._rng.uniform(-0.5, 0.5), 1)
+            message = (
+                "I",
+                "power_management",
+                f"Temp: {info['temp']:.1f} °C, SetPoint: 60.0 °C, Output: 35.0%",
+            )
+        elif self._lines % 3 == 0:
+            nonce = self._rng.getrandbits(32)
+            diff = self._rng.uniform(500, 5000)
+            message = "I", "asic_result", f"Nonce {nonce:08X} diff {diff:.1f} of 512."
+        elif self._rng.random() < 0.01:
+            info["sharesRejected"] = info.get("sharesRejected", 0) + 1
+            message = "W", "stratum_task", "message result rejected: Above target"
+        else:
+            info["sharesAccepted"] = info.get("sharesAccepted", 0) + 1
+            message = "I", "stratum_task", "message result accepted"
+        level, tag, text = message
+        color = "0;33" if level == "W" else "0;32"
+        return f"\x1b[{color}m{level} ({uptime}) {tag}: {text}\x1b[0m\n"
+
+
+class AxeOSSimulator:
+    """aiohttp server answering as a fleet of AxeOS miners."""
+
+    def __init__(self, config: SimulatorConfig) -> None:
+        """Build the fleet; call start to listen."""
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self._runner: web.AppRunner | None = None
+        # HTTP requests answered, for comparing polling and push modes
+        self.requests = 0
+        self._websockets: set[web.WebSocketResponse] = set()
+
+        templates = [
+            (
+                json.loads(path.read_text()),
+                _load(path.with_name(path.name.replace("_info", "_metrics"))),
+            )
+            for path in sorted(PAYLOADS.glob("*_info.json"))
+        ]
+
+        self._endpoints: list[tuple[str, int]] = []
+        self._miners: dict[tuple[str, int], SimulatedMiner] = {}
+        first = ipaddress.IPv4Address(config.first_address)
+        for index in range(config.miners):
+            if config.port_base is None:
+                endpoint = (str(first + index), 80)
+            else:
+                endpoint = ("127.0.0.1", config.port_base + index)
+            info, metrics = templates[index % len(templates)]
+            if self._rng.random() < config.not_found_rate:
+                metrics = None
+            elif metrics is None:
+                metrics = {}
+            self._endpoints.append(endpoint)
+            self._miners[endpoint] = SimulatedMiner(index, info, metrics, self._rng)
+
+    @property
+    def addresses(self) -> list[str]:
+        """Return the miner addresses as the integration's config takes them."""
+        if self.config.port_base is None:
+            return [host for host, _ in self._endpoints]
+        return [f"{host}:{port}" for host, port in self._endpoints]
+
+    @property
+    def scan_target(self) -> str | None:
+        """Return an address range covering the fleet, for discovery."""
+        if self.config.port_base is not None or not self._endpoints:
+            return None
+        return f"{self._endpoints[0][0]}-{self._endpoints[-1][0]}"
+
+    async def start(self) -> None:
+        """Start listening on every miner address."""
+        app = web.Application()
+        app.router.add_get("/api/system/info", self._handle_info)
+        app.router.add_get("/api/system/metrics", self._handle_metrics)
+        app.router.add_get("/api/ws", self._handle_ws)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        for host, port in self._endpoints:
+            await web.TCPSite(self._runner, host, port, backlog=16).start()
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        for websocket in list(self._websockets):
+            await websocket.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_info(self, request: web.Request) -> web.Response:
+        """Answer /api/system/info."""
+        miner = await self._respond_as(request)
+        return web.Response(
+            body=miner.info_body(self.config.block_rate),
+            content_type="application/json",
+        )
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        """Answer /api/system/metrics, or 404 on firmware without it."""
+        miner = await self._respond_as(request)
+        if miner.metrics is None:
+            return web.Response(status=404)
+        return web.Response(body=miner.metrics, content_type="application/json")
+
+    async def _handle_ws(self, request: web.Request) -> web.StreamResponse:
+        """Stream log lines over a websocket, or 404 on firmware without it."""
+        miner = self._miner_for(request)
+        if miner.metrics is None:
+            return web.Response(status=404)
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+
+        async def _send_logs() -> None:
+            while not websocket.closed:
+                await asyncio.sleep(self.config.log_interval)
+                await websocket.send_str(miner.log_line(self.config.block_rate))
+
+        sender = asyncio.create_task(_send_logs())
+        self._websockets.add(websocket)
+        try:
+            # Reading is what notices the client going away
+            async for _ in websocket:
+                pass
+        finally:
+            self._websockets.discard(websocket)
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+        return websocket
+
+    def _miner_for(self, request: web.Request) -> SimulatedMiner:
+        """Return the miner a request was sent to."""
+        host, port = request.transport.get_extra_info("sockname")[:2]
+        return self._miners[(host, port)]
+
+    async def _respond_as(self, request: web.Request) -> SimulatedMiner:
+        """Return the miner a request was sent to, after its delay."""
+        miner = self._miner_for(request)
+        self.requests += 1
+
+        config = self.config
+        if self._rng.random() < config.timeout_rate:
+            await asyncio.sleep(config.hang)
+        delay = config.latency + self._rng.uniform(-config.jitter, config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return miner
+
+
+def _load(path: Path) -> dict[str, Any] | None:
+    """Return a payload file's JSON, or None if there is none."""
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def parse_args(argv: list[str] | None = None) -> SimulatorConfig:
+    """Return the simulator config from the command line."""
+    defaults = SimulatorConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, default=defaults.miners)
+    parser.add_argument("--first-address", default=defaults.first_address)
+    parser.add_argument("--port-base", type=int, default=defaults.port_base)
+    parser.add_argument("--latency", type=float, default=defaults.latency)
+    parser.add_argument("--jitter", type=float, default=defaults.jitter)
+    parser.add_argument("--timeout-rate", type=float, default=defaults.timeout_rate)
+    parser.add_argument("--hang", type=float, default=defaults.hang)
+    parser.add_argument(
+        "--not-found-rate", type=float, default=defaults.not_found_rate
+    )
+    parser.add_argument("--block-rate", type=float, default=defaults.block_rate)
+    parser.add_argument("--log-interval", type=float, default=defaults.log_interval)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    return SimulatorConfig(**vars(parser.parse_args(argv)))
+
+
+async def _serve(config: SimulatorConfig) -> None:
+    """Run the simulator until cancelled."""
+    simulator = AxeOSSimulator(config)
+    await simulator.start()
+    target = simulator.scan_target or ",".join(simulator.addresses)
+    print(f"READY {target}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+def main() -> None:
+    """Run the simulator from the command line."""
+    try:
+        asyncio.run(_serve(parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
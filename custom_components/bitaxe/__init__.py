@@ -19,11 +19,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Bitaxe from a config entry."""
     _LOGGER.debug("Setting up Bitaxe integration")
     
-    coordinator = BitaxeCoordinator(hass, entry.data)
+    coordinator = BitaxeCoordinator(hass, {**entry.data, **entry.options})
     coordinator._config_entry_id = entry.entry_id
     
     try:
-        # Perform initial refresh and start periodic tasks
+        # Restore last-known state and start polling in the background
         await coordinator.async_config_entry_first_refresh()
     except Exception as err:  # pylint: disable=broad-except
         _LOGGER.error("Failed to set up Bitaxe: %s", err)
@@ -39,9 +39,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register cleanup on unload
     entry.async_on_unload(coordinator.async_shutdown)
     
+    # Reload when polling options change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload config entry after its options change."""
+    # The coordinator updates the miner list itself when a miner's IP changes
+    coordinator: BitaxeCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        entry.entry_id
+    )
+    if coordinator is not None and coordinator.config == {
+        **entry.data,
+        **entry.options,
+    }:
+        return
+    
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
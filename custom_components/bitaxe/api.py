@@ -0,0 +1,93 @@
+"""HTTP client helpers for the Bitaxe integration."""
+from __future__ import annotations
+
+from collections.abc import Collection
+import json
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+
+def create_client_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Create the HTTP session a config entry talks to its miners with.
+
+    One session is shared by polling and discovery for a config entry so
+    pooled keep-alive connections are reused instead of being rebuilt for
+    every request. It is made by Home Assistant's helper, on its shared
+    connection pool, and is detached when the entry unloads or Home
+    Assistant stops; it must not be closed.
+    """
+    return async_create_clientsession(
+        hass, trace_configs=[_connect_timing_trace()]
+    )
+
+
+def _connect_timing_trace() -> aiohttp.TraceConfig:
+    """Return a trace that times new connections.
+    
+    Requests made with a dict as trace_request_ctx get the seconds spent
+    opening a new connection stored under "connect". Requests served by a
+    pooled keep-alive connection get no entry.
+    """
+    trace = aiohttp.TraceConfig()
+
+    async def on_connection_create_start(
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateStartParams,
+    ) -> None:
+        """Note when a new connection starts opening."""
+        context.connect_started = time.perf_counter()
+
+    async def on_connection_create_end(
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        """Store how long opening the connection took."""
+        if isinstance(context.trace_request_ctx, dict):
+            context.trace_request_ctx["connect"] = (
+                time.perf_counter() - context.connect_started
+            )
+
+    trace.on_connection_create_start.append(on_connection_create_start)
+    trace.on_connection_create_end.append(on_connection_create_end)
+    trace.freeze()
+    return trace
+
+
+def decode_json(
+    body: bytes,
+    fields: Collection[str] | None = None,
+) -> Any:
+    """Decode a JSON response body.
+    
+    Uses orjson when it is installed and falls back to the stdlib json
+    module otherwise. If fields is given and the body is an object, only
+    those top-level keys are kept. Raises ValueError on invalid JSON.
+    """
+    if orjson is not None:
+        data = orjson.loads(body)
+    else:
+        data = json.loads(body)
+    
+    if fields is not None and isinstance(data, dict):
+        return {key: data[key] for key in fields if key in data}
+    return data
+
+
+async def async_read_json(
+    response: aiohttp.ClientResponse,
+    fields: Collection[str] | None = None,
+) -> Any:
+    """Read a response body once and decode it without a content-type check."""
+    return decode_json(await response.read(), fields)
@@ -0,0 +1,171 @@
+"""Record raw miner responses for offline replay."""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterator
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CAPTURE_FLUSH_INTERVAL, CAPTURE_FLUSH_RECORDS, CAPTURE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ResponseCapture:
+    """Raw miner responses written to a gzip-compressed JSON lines log.
+
+    Each poll cycle writes a {"t", "cycle"} marker, and each request a
+    record with its time since the capture started, address, endpoint,
+    HTTP status, duration and undecoded body (or the error it failed
+    with). Records are buffered and appended from the executor, one gzip
+    member per flush. Capturing stops once CAPTURE_MAX_BYTES of records
+    have been written.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize a capture writing to path."""
+        self._hass = hass
+        self.path = path
+        self._started = time.monotonic()
+        self._buffer: list[bytes] = []
+        self._last_flush = self._started
+        self._flush_task: Any = None
+        self.written = 0
+        self.stopped = False
+
+    @callback
+    def record_cycle(self) -> None:
+        """Mark the start of a poll cycle, flushing if one is due."""
+        self._append({"t": self._elapsed(), "cycle": True})
+        if self._buffer and (
+            len(self._buffer) >= CAPTURE_FLUSH_RECORDS
+            or time.monotonic() - self._last_flush >= CAPTURE_FLUSH_INTERVAL
+        ):
+            self._async_schedule_flush()
+
+    @callback
+    def record(
+        self,
+        ip: str,
+        endpoint: str,
+        elapsed: float,
+        status: int | None = None,
+        body: bytes | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Record one request and its raw answer."""
+        self._append(
+            {
+                "t": self._elapsed(),
+                "ip": ip,
+                "endpoint": endpoint,
+                "status": status,
+                "elapsed": round(elapsed, 4),
+                "body": body.decode("utf-8", "replace") if body is not None else None,
+                "error": error,
+            }
+        )
+
+    async def async_close(self) -> None:
+        """Write what is still buffered."""
+        if self._flush_task is not None:
+            await self._flush_task
+        await self._async_flush()
+
+    def _elapsed(self) -> float:
+        """Return seconds since the capture started."""
+        return round(time.monotonic() - self._started, 3)
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """Buffer a record unless the capture reached its size limit."""
+        if self.stopped:
+            return
+        line = json.dumps(record, separators=(",", ":")).encode() + b"\n"
+        self.written += len(line)
+        if self.written > CAPTURE_MAX_BYTES:
+            _LOGGER.warning(
+                "Response capture %s reached %d bytes, stopping",
+                self.path,
+                CAPTURE_MAX_BYTES,
+            )
+            self.stopped = True
+            self._async_schedule_flush()
+            return
+        self._buffer.append(line)
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Flush in the background unless a flush is running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._hass.async_create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        """Append the buffered records to the log."""
+        lines, self._buffer = self._buffer, []
+        self._last_flush = time.monotonic()
+        if lines:
+            await self._hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[bytes]) -> None:
+        """Append lines as a new gzip member (runs in the executor)."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with gzip.open(self.path, "ab") as file:
+            file.writelines(lines)
+
+
+def read_capture(path: str) -> Iterator[dict[str, Any]]:
+    """Yield the records of a capture log in order."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+class CaptureLog:
+    """A capture log indexed for replay.
+
+    Responses are looked up by address, endpoint and capture time, so a
+    replay can ask what a miner answered as of any point in the capture
+    regardless of when its own poll cycles ask.
+    """
+
+    def __init__(self, records: Iterator[dict[str, Any]]) -> None:
+        """Index the records."""
+        self.cycles: list[float] = []
+        self.responses = 0
+        self._times: dict[tuple[str, str], list[float]] = {}
+        self._records: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for record in records:
+            if record.get("cycle"):
+                self.cycles.append(record["t"])
+                continue
+            key = (record["ip"], record["endpoint"])
+            self._times.setdefault(key, []).append(record["t"])
+            self._records.setdefault(key, []).append(record)
+            self.responses += 1
+
+    @classmethod
+    def load(cls, path: str) -> CaptureLog:
+        """Load and index a capture file."""
+        return cls(read_capture(path))
+
+    @property
+    def miners(self) -> list[str]:
+        """Return the captured miner addresses."""
+        return sorted({ip for ip, _ in self._records})
+
+    def response(self, ip: str, endpoint: str, at: float) -> dict[str, Any] | None:
+        """Return the latest record for a request made by capture time at."""
+        times = self._times.get((ip, endpoint))
+        if not times:
+            return None
+        index = bisect_right(times, at) - 1
+        if index < 0:
+            return None
+        return self._records[(ip, endpoint)][index]
@@ -9,23 +9,41 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.components.dhcp import DhcpServiceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import format_mac
 
 from .const import (
+    CONF_CAPTURE,
     CONF_CONCURRENCY,
+    CONF_DISCOVERY_STRATEGY,
+    CONF_ESPRESSIF_ONLY,
     CONF_MINERS,
+    CONF_POLL_CONCURRENCY,
+    CONF_POLL_DEADLINE,
+    CONF_POLL_INTERVAL,
+    CONF_POLL_SLOTS,
+    CONF_PUSH,
     CONF_SCAN_INTERVAL,
     CONF_SUBNET,
     CONF_TIMEOUT,
     DEFAULT_CONCURRENCY,
+    DEFAULT_DISCOVERY_STRATEGY,
+    DEFAULT_POLL_CONCURRENCY,
+    DEFAULT_POLL_DEADLINE,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_POLL_SLOTS,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SUBNET,
     DEFAULT_TIMEOUT,
+    DISCOVERY_STRATEGIES,
     DOMAIN,
 )
-from .discovery import discover_miners
+from .coordinator import BitaxeCoordinator
+from .discovery import BitaxeDiscovery, discover_miners, parse_scan_targets
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +67,102 @@ class BitaxeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.discovered_miners: list[str] = []
         self.discovery_config: dict[str, Any] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> BitaxeOptionsFlow:
+        """Get the options flow for this handler."""
+        return BitaxeOptionsFlow(config_entry)
+
+    async def async_step_dhcp(self, discovery_info: DhcpServiceInfo) -> FlowResult:
+        """Handle a miner announced by DHCP.
+        
+        The miner is confirmed with a single API probe and, if an entry's
+        subnets cover it, added to its active miners without any sweep.
+        """
+        ip = discovery_info.ip
+        mac = format_mac(discovery_info.macaddress)
+        await self.async_set_unique_id(mac)
+        
+        coordinator = self._coordinator_for(ip)
+        if coordinator is not None and ip in coordinator.active_miners:
+            return self.async_abort(reason="already_configured")
+        
+        discovery = BitaxeDiscovery(
+            ip,
+            timeout=DEFAULT_TIMEOUT,
+            session=(
+                coordinator.session
+                if coordinator is not None
+                else async_get_clientsession(self.hass)
+            ),
+        )
+        if not await discovery.verify([ip]):
+            return self.async_abort(reason="not_bitaxe")
+        
+        # A known miner on a new lease, move it instead of adding a new one
+        for known in self.hass.data.get(DOMAIN, {}).values():
+            old_ip = known.mac_to_ip.get(mac)
+            if old_ip is not None and old_ip != ip:
+                known.async_move_miner(old_ip, ip, mac)
+                await known.async_request_refresh()
+                return self.async_abort(reason="already_configured")
+        
+        if coordinator is not None:
+            _LOGGER.debug("Adding miner %s announced by DHCP", ip)
+            await coordinator.async_add_miner(ip)
+            return self.async_abort(reason="miner_added")
+        
+        # No entry covers this address, offer to create one for the miner
+        self.discovered_miners = [ip]
+        self.discovery_config = {
+            CONF_SUBNET: str(ipaddress.IPv4Network(f"{ip}/24", strict=False)),
+            CONF_CONCURRENCY: DEFAULT_CONCURRENCY,
+            CONF_TIMEOUT: DEFAULT_TIMEOUT,
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_DISCOVERY_STRATEGY: DEFAULT_DISCOVERY_STRATEGY,
+            CONF_ESPRESSIF_ONLY: False,
+        }
+        self.context["title_placeholders"] = {
+            "name": discovery_info.hostname or ip
+        }
+        return await self.async_step_dhcp_confirm()
+
+    async def async_step_dhcp_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Confirm setting up the integration with a DHCP-discovered miner."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title="Bitaxe (1 miner)",
+                data={**self.discovery_config, CONF_MINERS: self.discovered_miners},
+            )
+        
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="dhcp_confirm",
+            description_placeholders={
+                "name": self.context["title_placeholders"]["name"],
+                "ip": self.discovered_miners[0],
+            },
+        )
+
+    def _coordinator_for(self, ip: str) -> BitaxeCoordinator | None:
+        """Return the loaded entry whose subnets cover ip, if any."""
+        coordinators: list[BitaxeCoordinator] = list(
+            self.hass.data.get(DOMAIN, {}).values()
+        )
+        address = int(ipaddress.IPv4Address(ip))
+        for coordinator in coordinators:
+            try:
+                ranges = parse_scan_targets(coordinator.subnet)
+            except ValueError:
+                continue
+            if any(first <= address <= last for first, last in ranges):
+                return coordinator
+        return None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -56,13 +170,14 @@ class BitaxeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         
         if user_input is not None:
-            # Validate subnet
+            # Validate subnets and ranges
             try:
-                ipaddress.IPv4Network(user_input[CONF_SUBNET], strict=False)
+                parse_scan_targets(user_input[CONF_SUBNET])
             except ValueError:
                 errors[CONF_SUBNET] = "invalid_subnet"
             
-            # Validate concurrency
+            # Validate the starting concurrency, which scans tune themselves
+            user_input.setdefault(CONF_CONCURRENCY, DEFAULT_CONCURRENCY)
             if not 1 <= user_input[CONF_CONCURRENCY] <= 100:
                 errors[CONF_CONCURRENCY] = "invalid_concurrency"
             
@@ -86,7 +201,7 @@ class BitaxeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_SUBNET, default=DEFAULT_SUBNET
                     ): str,
-                    vol.Required(
+                    vol.Optional(
                         CONF_CONCURRENCY, default=DEFAULT_CONCURRENCY
                     ): int,
                     vol.Required(
@@ -95,6 +210,10 @@ class BitaxeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
                     ): int,
+                    vol.Required(
+                        CONF_DISCOVERY_STRATEGY, default=DEFAULT_DISCOVERY_STRATEGY
+                    ): vol.In(DISCOVERY_STRATEGIES),
+                    vol.Required(CONF_ESPRESSIF_ONLY, default=False): bool,
                 }
             ),
             errors=errors,
@@ -120,6 +239,8 @@ class BitaxeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     subnet=self.discovery_config[CONF_SUBNET],
                     concurrency=self.discovery_config[CONF_CONCURRENCY],
                     timeout=self.discovery_config[CONF_TIMEOUT],
+                    strategy=self.discovery_config[CONF_DISCOVERY_STRATEGY],
+                    espressif_only=self.discovery_config[CONF_ESPRESSIF_ONLY],
                 )
                 
                 if not self.discovered_miners:
@@ -213,3 +334,83 @@ class BitaxeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "count": str(len(self.discovered_miners)),
             },
         )
+
+
+class BitaxeOptionsFlow(config_entries.OptionsFlow):
+    """Handle polling options for Bitaxe."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize."""
+        self.entry = config_entry
+
+    def _current(self, key: str, default: Any) -> Any:
+        """Return the current value of a setting."""
+        return self.entry.options.get(key, self.entry.data.get(key, default))
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage polling options."""
+        errors: dict[str, str] = {}
+        
+        if user_input is not None:
+            # Validate poll interval
+            if not 5 <= user_input[CONF_POLL_INTERVAL] <= 3600:
+                errors[CONF_POLL_INTERVAL] = "invalid_poll_interval"
+            
+            # Validate deadline (0 waits for every miner)
+            if not 0 <= user_input[CONF_POLL_DEADLINE] <= 10:
+                errors[CONF_POLL_DEADLINE] = "invalid_poll_deadline"
+            
+            # Validate slots
+            if not 1 <= user_input[CONF_POLL_SLOTS] <= 30:
+                errors[CONF_POLL_SLOTS] = "invalid_poll_slots"
+            
+            # Validate poll concurrency
+            if not 1 <= user_input[CONF_POLL_CONCURRENCY] <= 100:
+                errors[CONF_POLL_CONCURRENCY] = "invalid_poll_concurrency"
+            
+            if not errors:
+                return self.async_create_entry(
+                    title="",
+                    data={**self.entry.options, **user_input},
+                )
+        
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_POLL_INTERVAL,
+                        default=self._current(
+                            CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
+                        ),
+                    ): int,
+                    vol.Required(
+                        CONF_POLL_DEADLINE,
+                        default=self._current(
+                            CONF_POLL_DEADLINE, DEFAULT_POLL_DEADLINE
+                        ),
+                    ): vol.All(vol.Coerce(float)),
+                    vol.Required(
+                        CONF_POLL_SLOTS,
+                        default=self._current(CONF_POLL_SLOTS, DEFAULT_POLL_SLOTS),
+                    ): int,
+                    vol.Required(
+                        CONF_POLL_CONCURRENCY,
+                        default=self._current(
+                            CONF_POLL_CONCURRENCY, DEFAULT_POLL_CONCURRENCY
+                        ),
+                    ): int,
+                    vol.Required(
+                        CONF_PUSH,
+                        default=self._current(CONF_PUSH, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_CAPTURE,
+                        default=self._current(CONF_CAPTURE, False),
+                    ): bool,
+                }
+            ),
+            errors=errors,
+        )
@@ -8,7 +8,11 @@ DEFAULT_SUBNET: Final = "192.168.1.0/24"
 DEFAULT_CONCURRENCY: Final = 20
 DEFAULT_TIMEOUT: Final = 1.5
 DEFAULT_SCAN_INTERVAL: Final = 3600  # 1 hour
+DEFAULT_DISCOVERY_STRATEGY: Final = "neighbor"
 DEFAULT_POLL_INTERVAL: Final = 30  # 30 seconds
+DEFAULT_POLL_DEADLINE: Final = 3.0  # Seconds to wait for miners each poll cycle
+DEFAULT_POLL_SLOTS: Final = 1  # Time slots the fleet is spread across (1 = all at once)
+DEFAULT_POLL_CONCURRENCY: Final = 20  # Max in-flight poll requests
 
 # Config flow keys
 CONF_SUBNET: Final = "subnet"
@@ -16,13 +20,124 @@ CONF_CONCURRENCY: Final = "concurrency"
 CONF_TIMEOUT: Final = "timeout"
 CONF_SCAN_INTERVAL: Final = "scan_interval"
 CONF_POLL_INTERVAL: Final = "poll_interval"
+CONF_POLL_DEADLINE: Final = "poll_deadline"
+CONF_POLL_SLOTS: Final = "poll_slots"
+CONF_POLL_CONCURRENCY: Final = "poll_concurrency"
 CONF_MINERS: Final = "miners"  # List of manually added miner IPs
+CONF_DISCOVERY_STRATEGY: Final = "discovery_strategy"
+CONF_ESPRESSIF_ONLY: Final = "espressif_only"
+CONF_CAPTURE: Final = "capture_responses"
+CONF_PUSH: Final = "push_updates"
+
+# Refresh tiers for sensors
+TIER_FAST: Final = "fast"  # Telemetry, written every poll
+TIER_STATIC: Final = "static"  # Device facts, written on static refresh only
+STATIC_REFRESH_INTERVAL: Final = 300  # Seconds between static refreshes
 
 # Discovery
 DISCOVERY_SIGNATURE: Final = "NerdQAxe"
 DISCOVERY_ENDPOINT: Final = "/"
 API_INFO_ENDPOINT: Final = "/api/system/info"
-API_STATS_ENDPOINT: Final = "/api/system/metrics"
+DISCOVERY_PORT: Final = 80
+DISCOVERY_CONNECT_CONCURRENCY_MAX: Final = 128  # Most parallel TCP pre-filter connects
+
+# Discovery strategies
+STRATEGY_FULL: Final = "full"  # Sweep the whole subnet
+STRATEGY_NEIGHBOR: Final = "neighbor"  # Neighbor table hosts first, then the rest
+STRATEGY_QUICK: Final = "quick"  # Neighbor table hosts only
+DISCOVERY_STRATEGIES: Final = [STRATEGY_NEIGHBOR, STRATEGY_QUICK, STRATEGY_FULL]
+
+# Linux neighbor (ARP) table used to seed discovery
+NEIGHBOR_TABLE_PATH: Final = "/proc/net/arp"
+
+# MAC prefixes (OUIs) registered to Espressif, whose ESP32 chips power AxeOS miners
+ESPRESSIF_OUIS: Final = frozenset(
+    {
+        "08:3a:f2", "08:b6:1f", "0c:b8:15", "10:52:1c", "18:fe:34", "24:0a:c4",
+        "24:58:7c", "24:62:ab", "24:6f:28", "24:a1:60", "24:b2:de", "24:d7:eb",
+        "24:dc:c3", "2c:3a:e8", "2c:f4:32", "30:83:98", "30:ae:a4", "30:c6:f7",
+        "30:c9:22", "34:85:18", "34:86:5d", "34:94:54", "34:ab:95", "34:b4:72",
+        "3c:61:05", "3c:71:bf", "3c:84:27", "40:22:d8", "40:4c:ca", "40:91:51",
+        "44:17:93", "48:27:e2", "48:3f:da", "48:55:19", "48:e7:29", "4c:11:ae",
+        "4c:75:25", "4c:eb:d6", "50:02:91", "54:32:04", "54:43:b2", "58:bf:25",
+        "58:cf:79", "5c:cf:7f", "60:01:94", "60:55:f9", "64:b7:08", "64:e8:33",
+        "68:67:25", "68:b6:b3", "68:c6:3a", "70:03:9f", "70:04:1d", "70:b8:f6",
+        "74:4d:bd", "78:21:84", "78:e3:6d", "7c:87:ce", "7c:9e:bd", "7c:df:a1",
+        "80:64:6f", "80:7d:3a", "84:0d:8e", "84:cc:a8", "84:f3:eb", "84:f7:03",
+        "84:fc:e6", "8c:4b:14", "8c:aa:b5", "8c:ce:4e", "90:38:0c", "94:3c:c6",
+        "94:b5:55", "94:b9:7e", "94:e6:86", "98:cd:ac", "98:f4:ab", "9c:9c:1f",
+        "a0:20:a6", "a0:76:4e", "a0:a3:b3", "a4:7b:9d", "a4:cf:12", "a8:03:2a",
+        "a8:42:e3", "ac:0b:fb", "ac:67:b2", "b0:a7:32", "b0:b2:1c", "b4:8a:0a",
+        "b4:e6:2d", "b8:d6:1a", "b8:f0:09", "bc:dd:c2", "bc:ff:4d", "c0:49:ef",
+        "c0:4e:30", "c4:4f:33", "c4:5b:be", "c4:dd:57", "c8:2b:96", "c8:2e:18",
+        "c8:c9:a3", "c8:f0:9e", "cc:50:e3", "cc:7b:5c", "cc:db:a7", "d4:8a:fc",
+        "d4:d4:da", "d4:f9:8d", "d8:13:2a", "d8:a0:1d", "d8:bf:c0", "dc:06:75",
+        "dc:4f:22", "dc:54:75", "dc:da:0c", "e0:5a:1b", "e0:98:06", "e4:65:b8",
+        "e8:06:90", "e8:31:cd", "e8:68:e7", "e8:9f:6d", "e8:db:84", "ec:62:60",
+        "ec:64:c9", "ec:94:cb", "ec:c9:ff", "ec:da:3b", "ec:fa:bc", "f0:08:d1",
+        "f0:9e:9e", "f4:12:fa", "f4:cf:a2", "fc:b4:67", "fc:f5:c4",
+    }
+)
+
+# Discovery probe concurrency, tuned during each scan (AIMD)
+DISCOVERY_CONCURRENCY_MAX: Final = 100
+AIMD_MIN_WINDOW: Final = 8  # Fewest probe outcomes judged at once
+AIMD_ERROR_THRESHOLD: Final = 0.1  # Error share in a window that halves the limit
+AIMD_DECREASE: Final = 0.5  # Multiplier applied to the limit on congestion
+AIMD_TIMELINE_MAX: Final = 100  # Limit changes kept for diagnostics
+
+# Incremental rescans: each scan interval sweeps one of this many slices
+DISCOVERY_SWEEP_SLICES: Final = 8
+
+# Persistent discovery cache
+STORAGE_VERSION: Final = 1
+CACHE_MAX_AGE: Final = 7 * 24 * 3600  # Forget miners not seen for a week
+CACHE_SEEN_RESOLUTION: Final = 3600  # Granularity of stored last-seen times
+CACHE_SAVE_DELAY: Final = 30  # Seconds to batch cache changes before writing
+SNAPSHOT_SAVE_DELAY: Final = 300  # Most often last-known snapshots are written
+
+# Finding a miner again after its IP changed
+REACQUIRE_AFTER_FAILURES: Final = 2  # Failed polls before looking for its MAC
+REACQUIRE_WINDOW: Final = 16  # Addresses either side of the old IP to probe
+
+# Rolling hashrate and share statistics, in seconds
+ROLLING_WINDOW_1M: Final = 60
+ROLLING_WINDOW_10M: Final = 600
+ROLLING_WINDOW_1H: Final = 3600
+ROLLING_WINDOWS: Final = (ROLLING_WINDOW_1M, ROLLING_WINDOW_10M, ROLLING_WINDOW_1H)
+
+# Streaming anomaly detection
+ANOMALY_FAST_ALPHA: Final = 0.2  # Weight of each poll in a miner's current level
+ANOMALY_SLOW_ALPHA: Final = 0.005  # Weight of each poll in its baseline (~100 min)
+ANOMALY_WARMUP: Final = 20  # Polls before a metric is scored
+ANOMALY_Z_THRESHOLD: Final = 3.0  # z-score in the bad direction that fires an event
+ANOMALY_MIN_FLEET: Final = 5  # Miners needed to compare against the fleet
+
+# Upper bounds of the poll latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS: Final = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Push updates from the AxeOS websocket log stream
+PUSH_ENDPOINT: Final = "/api/ws"
+PUSH_RECONCILE_INTERVAL: Final = 120  # Seconds between HTTP polls of streaming miners
+PUSH_UPDATE_DELAY: Final = 1.0  # Seconds pushed changes are batched before publishing
+PUSH_HEARTBEAT: Final = 30  # Websocket ping interval, in seconds
+PUSH_MAX_LINE: Final = 2048  # Longest log line kept while waiting for its end
+PUSH_RECONNECT_BASE: Final = 5  # First reconnect delay, in seconds
+PUSH_RECONNECT_MAX: Final = 600  # Longest reconnect delay, in seconds
+
+# Capture of raw miner responses for replay
+CAPTURE_DIR: Final = "bitaxe_captures"  # Under the Home Assistant config directory
+CAPTURE_FLUSH_RECORDS: Final = 500  # Buffered records that trigger a write
+CAPTURE_FLUSH_INTERVAL: Final = 60  # Longest seconds between writes
+CAPTURE_MAX_BYTES: Final = 100 * 1024 * 1024  # Uncompressed size that ends a capture
+
+# Per-miner circuit breaker
+BREAKER_FAILURE_THRESHOLD: Final = 3  # Consecutive failures before backing off
+BREAKER_BACKOFF_MAX: Final = 600  # Longest wait between probes, in seconds
+BREAKER_JITTER: Final = 0.2  # +/- fraction applied to each backoff delay
+
+# HTTP client
+HTTP_REQUEST_TIMEOUT: Final = 5
 
 # Update intervals
 SCAN_INTERVAL: Final = DEFAULT_SCAN_INTERVAL
@@ -35,6 +150,7 @@ PLATFORMS: Final = ["sensor"]
 EVENT_MINER_DISCOVERED: Final = "bitaxe_miner_discovered"
 EVENT_MINER_LOST: Final = "bitaxe_miner_lost"
 EVENT_BLOCK_FOUND: Final = "bitaxe_block_found"
+EVENT_ANOMALY: Final = "bitaxe_anomaly"
 
 # Device info
 MANUFACTURER: Final = "Rigol"
@@ -2,37 +2,157 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from dataclasses import dataclass
 import logging
 from datetime import timedelta
+import ipaddress
+from functools import partial
+import math
+import random
+import re
+import time
 from typing import Any
 
 import aiohttp
 
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import async_get as async_get_device_registry
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import (
+    CONNECTION_NETWORK_MAC,
+    async_get as async_get_device_registry,
+    format_mac,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
+    ANOMALY_FAST_ALPHA,
+    ANOMALY_MIN_FLEET,
+    ANOMALY_SLOW_ALPHA,
+    ANOMALY_WARMUP,
+    ANOMALY_Z_THRESHOLD,
     API_INFO_ENDPOINT,
-    API_STATS_ENDPOINT,
+    BREAKER_BACKOFF_MAX,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_JITTER,
+    CAPTURE_DIR,
+    CONF_CAPTURE,
     CONF_MINERS,
+    CONF_POLL_CONCURRENCY,
+    CONF_POLL_DEADLINE,
+    CONF_POLL_INTERVAL,
+    CONF_POLL_SLOTS,
+    CONF_PUSH,
     CONF_SCAN_INTERVAL,
     CONF_SUBNET,
     CONF_CONCURRENCY,
+    CONF_DISCOVERY_STRATEGY,
+    CONF_ESPRESSIF_ONLY,
     CONF_TIMEOUT,
     DOMAIN,
+    DEFAULT_DISCOVERY_STRATEGY,
+    DEFAULT_POLL_CONCURRENCY,
+    DEFAULT_POLL_DEADLINE,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_POLL_SLOTS,
+    DISCOVERY_CONNECT_CONCURRENCY_MAX,
+    DISCOVERY_SWEEP_SLICES,
+    EVENT_ANOMALY,
     EVENT_MINER_DISCOVERED,
     EVENT_MINER_LOST,
     EVENT_BLOCK_FOUND,
+    HTTP_REQUEST_TIMEOUT,
+    LATENCY_BUCKETS_MS,
     MANUFACTURER,
     MODEL_BITAXE,
+    PUSH_RECONCILE_INTERVAL,
+    PUSH_UPDATE_DELAY,
+    REACQUIRE_AFTER_FAILURES,
+    REACQUIRE_WINDOW,
+    ROLLING_WINDOW_10M,
+    ROLLING_WINDOW_1H,
+    ROLLING_WINDOW_1M,
+    ROLLING_WINDOWS,
+    STATIC_REFRESH_INTERVAL,
+)
+from .api import create_client_session, decode_json
+from .capture import ResponseCapture
+from .discovery import (
+    BitaxeDiscovery,
+    async_read_neighbor_table,
+    parse_scan_targets,
 )
-from .discovery import discover_miners
+from .models import FleetStats, MinerSnapshot
+from .push import (
+    EVENT_BLOCK,
+    EVENT_SHARE_ACCEPTED,
+    EVENT_SHARE_REJECTED,
+    EVENT_TEMPERATURE,
+    EVENT_VR_TEMPERATURE,
+    LogEvent,
+    MinerStream,
+)
+from .stats import AnomalyDetector, PollStats, RollingStats
+from .storage import DiscoveryCache, SnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
+# Legacy IP-keyed unique_id: bitaxe_192_168_1_5_<sensor key>
+_IP_UNIQUE_ID = re.compile(r"^bitaxe_(\d+_\d+_\d+_\d+)_(.+)$")
+
+
+def unique_id_prefix(miner_id: str) -> str:
+    """Return the unique_id prefix of a miner's entities.
+    
+    miner_id is the miner's MAC, or its IP for firmware that reports none.
+    """
+    return f"bitaxe_{miner_id.replace('.', '_').replace(':', '')}"
+
+
+class EndpointNotFound(HomeAssistantError):
+    """Error to indicate a miner does not serve an API endpoint."""
+
+
+@dataclass
+class MinerBreaker:
+    """Circuit breaker state for a single miner.
+    
+    Closed while the miner answers. After BREAKER_FAILURE_THRESHOLD
+    consecutive failures it opens and the miner is skipped until
+    retry_at, twice the base delay at first; the next poll after that is
+    a half-open probe that either closes the breaker or doubles the
+    backoff. reacquiring marks an outage whose miner is already being
+    looked for at other addresses.
+    """
+
+    failures: int = 0
+    retry_at: float = 0.0
+    reacquiring: bool = False
+
+    def allow(self, now: float) -> bool:
+        """Return True if the miner should be polled now."""
+        return self.failures < BREAKER_FAILURE_THRESHOLD or now >= self.retry_at
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.retry_at = 0.0
+        self.reacquiring = False
+
+    def record_failure(self, now: float, base_delay: float) -> float | None:
+        """Count a failure and return the backoff delay if the breaker is open."""
+        self.failures += 1
+        if self.failures < BREAKER_FAILURE_THRESHOLD:
+            return None
+        
+        # A regular poll would come after base_delay anyway, so even the
+        # first backoff waits longer than that
+        exponent = self.failures - BREAKER_FAILURE_THRESHOLD + 1
+        delay = min(BREAKER_BACKOFF_MAX, base_delay * 2 ** min(exponent, 16))
+        delay *= random.uniform(1 - BREAKER_JITTER, 1 + BREAKER_JITTER)
+        self.retry_at = now + delay
+        return delay
+
 
 class BitaxeCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Bitaxe data."""
@@ -43,14 +163,29 @@ class BitaxeCoordinator(DataUpdateCoordinator):
         config: dict[str, Any],
     ) -> None:
         """Initialize."""
+        # With staggering, each tick polls one slot of the fleet
+        poll_interval = config.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
+        poll_slots = max(1, int(config.get(CONF_POLL_SLOTS, DEFAULT_POLL_SLOTS)))
+        
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_POLL_INTERVAL),
+            update_interval=timedelta(seconds=poll_interval / poll_slots),
         )
         self.config = config
         
+        # Polling settings (poll_interval is the fast telemetry tier)
+        self.poll_interval: float = poll_interval
+        self.poll_slots = poll_slots
+        self._poll_sem = asyncio.Semaphore(
+            config.get(CONF_POLL_CONCURRENCY, DEFAULT_POLL_CONCURRENCY)
+        )
+        
+        # Slot each miner is polled in, and the slot due next tick
+        self._slot_assignments: dict[str, int] = {}
+        self._next_slot = 0
+        
         # Known miners from config
         self.configured_miners: set[str] = set(
             config.get(CONF_MINERS, [])
@@ -59,8 +194,38 @@ class BitaxeCoordinator(DataUpdateCoordinator):
         # Currently active miners
         self.active_miners: set[str] = set(self.configured_miners)
         
-        # Miner data: {ip: {stats}}
-        self.miners: dict[str, dict[str, Any]] = {}
+        # Latest parsed snapshot per miner
+        self.miners: dict[str, MinerSnapshot] = {}
+        
+        # Fleet totals, kept in step with self.miners
+        self.fleet = FleetStats()
+        
+        # Last hour of hashrate and share samples per miner, sized to hold
+        # one sample per poll interval
+        self.rolling: dict[str, RollingStats] = {}
+        self._rolling_capacity = math.ceil(ROLLING_WINDOW_1H / poll_interval) + 1
+        
+        # Request latencies, failures and cycle times, for diagnostics
+        self.poll_stats = PollStats(LATENCY_BUCKETS_MS)
+        
+        # Websocket log stream per miner when push updates are enabled;
+        # streaming miners are only polled every PUSH_RECONCILE_INTERVAL
+        self.push: bool = config.get(CONF_PUSH, False)
+        self.streams: dict[str, MinerStream] = {}
+        self._push_update: asyncio.TimerHandle | None = None
+        
+        # Raw response log for offline replay, opened on first refresh
+        # when enabled in the options
+        self.capture: ResponseCapture | None = None
+        
+        # Per-miner baselines, scored against the fleet after each poll
+        self.anomalies = AnomalyDetector(
+            ANOMALY_FAST_ALPHA,
+            ANOMALY_SLOW_ALPHA,
+            ANOMALY_WARMUP,
+            ANOMALY_Z_THRESHOLD,
+            ANOMALY_MIN_FLEET,
+        )
         
         # Track block counts for detection
         self.previous_block_counts: dict[str, int] = {}
@@ -68,111 +233,721 @@ class BitaxeCoordinator(DataUpdateCoordinator):
         # Track block counts for detection
         self.previous_block_counts: dict[str, int] = {}
         
+        # In-flight poll per miner; may outlive a cycle if the miner is slow
+        self._poll_tasks: dict[str, asyncio.Task] = {}
+        
+        # Miners whose late poll result will be merged when it arrives
+        self._late_miners: set[str] = set()
+        
+        # Monotonic time of each miner's last good snapshot
+        self._last_success: dict[str, float] = {}
+        
+        # Seconds to wait for miners each cycle (None waits for all)
+        self.poll_deadline: float | None = config.get(
+            CONF_POLL_DEADLINE, DEFAULT_POLL_DEADLINE
+        ) or None
+        
+        # Static tier: bumped each time a miner's device facts are refreshed
+        self.static_generation: dict[str, int] = {}
+        self._static_refreshed_at: dict[str, float] = {}
+        self._static_requested: set[str] = set()
+        
+        # Circuit breaker per miner so offline miners back off
+        self._breakers: dict[str, MinerBreaker] = {}
+        
+        # Why each miner's last request failed, shown on its snapshot
+        self._failure_reasons: dict[str, str] = {}
+        
         # Periodic scan task
         self._scan_task: asyncio.Task | None = None
         
+        # Persistent discovery cache and last-known snapshots, loaded on
+        # first refresh
+        self.cache: DiscoveryCache | None = None
+        self.snapshots: SnapshotStore | None = None
+        
+        # First poll, run in the background so setup does not wait for it
+        self._refresh_task: asyncio.Task | None = None
+        
+        # Miners are identified by MAC so an IP change keeps their entities
+        self.ip_to_mac: dict[str, str] = {}
+        self.mac_to_ip: dict[str, str] = {}
+        
+        # Running searches for miners that stopped answering at their IP
+        self._reacquire_tasks: dict[str, asyncio.Task] = {}
+        
+        # Pooled HTTP session shared by polling and discovery
+        self._session = create_client_session(hass)
+        
         # Discovery settings
         self.subnet = config.get(CONF_SUBNET)
         self.concurrency = config.get(CONF_CONCURRENCY, 20)
+        self.connect_concurrency = DISCOVERY_CONNECT_CONCURRENCY_MAX
         self.timeout = config.get(CONF_TIMEOUT, 1.5)
         self.scan_interval = config.get(CONF_SCAN_INTERVAL, 3600)
+        self.discovery_strategy = config.get(
+            CONF_DISCOVERY_STRATEGY, DEFAULT_DISCOVERY_STRATEGY
+        )
+        self.espressif_only = config.get(CONF_ESPRESSIF_ONLY, False)
+        
+        # Stats of the last sweep and re-verification, for diagnostics
+        self.discovery_stats: dict[str, dict[str, Any]] = {}
 
     async def async_config_entry_first_refresh(self) -> None:
-        """Refresh data upon config entry setup.
+        """Prepare the coordinator upon config entry setup without polling.
         
-        Also starts periodic scanning and device registration.
+        Restores the configured miners' last-known snapshots so entities
+        have values right away, loads the discovery cache, starts the warm
+        start and periodic scanning, and registers devices. The first poll
+        runs in the background and replaces the restored snapshots as
+        miners answer.
         """
-        # Start periodic scan if configured
-        if self.scan_interval > 0:
-            self._scan_task = asyncio.create_task(self._periodic_scan())
+        self.cache = DiscoveryCache(self.hass, self.config_entry_id)
+        await self.cache.async_load()
+        
+        self.snapshots = SnapshotStore(self.hass, self.config_entry_id)
+        for ip, snapshot in (await self.snapshots.async_load()).items():
+            if ip in self.configured_miners:
+                self._set_snapshot(ip, snapshot)
+        self.previous_block_counts.update(self.snapshots.block_counts)
+        
+        # Known MACs, with entities from before MAC identity moved over
+        for ip, cached in self.cache.miners.items():
+            if cached.get("mac"):
+                mac = format_mac(cached["mac"])
+                self.ip_to_mac[ip] = mac
+                self.mac_to_ip[mac] = ip
+        self._async_migrate_registry(self.ip_to_mac)
+        
+        if self.config.get(CONF_CAPTURE):
+            self.capture = ResponseCapture(
+                self.hass,
+                self.hass.config.path(
+                    CAPTURE_DIR,
+                    f"{self.config_entry_id}-{time.strftime('%Y%m%d-%H%M%S')}"
+                    ".jsonl.gz",
+                ),
+            )
+            _LOGGER.info("Capturing raw miner responses to %s", self.capture.path)
+        
+        # Re-verify cached miners, then scan periodically if configured
+        self._scan_task = asyncio.create_task(self._periodic_scan())
         
         # Register devices in device registry
         await self._register_devices()
         
-        # Do initial data fetch
-        await self.async_refresh()
+        # Serve restored data until the first poll is in, which runs as a
+        # background task of the entry so unloading cancels it
+        self.async_set_updated_data(self.miners)
+        entry = self.hass.config_entries.async_get_entry(self.config_entry_id)
+        name = f"{DOMAIN} first refresh {self.config_entry_id}"
+        if entry is not None:
+            self._refresh_task = entry.async_create_background_task(
+                self.hass, self.async_refresh(), name
+            )
+        else:
+            self._refresh_task = self.hass.async_create_background_task(
+                self.async_refresh(), name
+            )
 
     async def async_shutdown(self) -> None:
         """Cleanup on shutdown."""
+        # Stop scheduled refreshes first so none restarts what is torn down
+        await super().async_shutdown()
+        
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        
+        if self.snapshots is not None:
+            await self.snapshots.async_save()
+        
         if self._scan_task:
             self._scan_task.cancel()
             try:
                 await self._scan_task
             except asyncio.CancelledError:
                 pass
+        
+        for task in self._poll_tasks.values():
+            task.cancel()
+        self._poll_tasks.clear()
+        self._late_miners.clear()
+        
+        for task in self._reacquire_tasks.values():
+            task.cancel()
+        self._reacquire_tasks.clear()
+        
+        await asyncio.gather(
+            *(stream.async_stop() for stream in self.streams.values())
+        )
+        self.streams.clear()
+        if self._push_update is not None:
+            self._push_update.cancel()
+            self._push_update = None
+        
+        if self.capture is not None:
+            await self.capture.async_close()
+        
+        # The session belongs to Home Assistant's pool, so it is detached
+        # rather than closed; requests made after this fail
+        self._session.detach()
 
-    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
-        """Fetch data from all active miners."""
-        tasks = [
-            self._fetch_miner_data(ip)
-            for ip in self.active_miners
-        ]
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session."""
+        return self._session
+
+    async def _async_update_data(self) -> dict[str, MinerSnapshot]:
+        """Fetch data from the miners due this tick.
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Without staggering every active miner is due every tick. Miners
+        with an open circuit breaker are skipped until their backoff
+        expires, and miners streaming push updates until they are due for
+        reconciliation. Waits at most poll_deadline seconds. Miners that
+        have not answered by then keep their last snapshot, marked with its
+        age in stale_seconds, and their result is merged in when it arrives.
+        """
+        if self.push:
+            self._async_sync_streams()
         
-        # Update miners dict and check for block hits
-        for ip, data in zip(self.active_miners, results):
-            if isinstance(data, dict):
-                self.miners[ip] = data
-                
-                # Check for block hits
-                total_blocks = data.get("totalFoundBlocks", 0)
-                previous_blocks = self.previous_block_counts.get(ip, 0)
-                
-                if total_blocks > previous_blocks:
-                    _LOGGER.info("Block found on miner %s! Total blocks: %s", ip, total_blocks)
-                    self.hass.bus.async_fire(
-                        EVENT_BLOCK_FOUND,
-                        {
-                            "miner_ip": ip,
-                            "total_blocks": total_blocks,
-                            "blocks_this_session": data.get("foundBlocks", 0),
-                            "device_model": data.get("deviceModel", "Unknown"),
-                            "hashrate": data.get("hashRate", 0),
-                            "total_best_diff": data.get("totalBestDiff", 0),
-                            "best_diff": data.get("bestDiff", 0),
-                            "temperature": data.get("temp", 0),
-                            "pool_connected": data.get("stratum", {}).get("pools", [{}])[0].get("connected", False),
-                            "ssid": data.get("ssid", "Unknown"),
-                            "stratum_url": data.get("stratumURL", "Unknown"),
-                            "stratum_port": data.get("stratumPort", 0),
-                        },
-                    )
+        now = time.monotonic()
+        tasks: dict[str, asyncio.Task] = {}
+        for ip in self._due_miners():
+            breaker = self._breakers.setdefault(ip, MinerBreaker())
+            if ip not in self._poll_tasks:
+                if not breaker.allow(now):
+                    # Miner is backing off, keep it marked unavailable
+                    continue
+                if self._push_current(ip, now):
+                    continue
                 
-                self.previous_block_counts[ip] = total_blocks
-            else:
-                # Error fetching data, mark as unavailable but keep entry
-                self.miners[ip] = {"available": False, "error": str(data)}
+                self._poll_tasks[ip] = asyncio.create_task(
+                    self._fetch_miner_data(ip)
+                )
+            tasks[ip] = self._poll_tasks[ip]
+        
+        if not tasks:
+            return self.miners
+        
+        if self.capture is not None:
+            self.capture.record_cycle()
+        
+        cycle_started = time.perf_counter()
+        done, _ = await asyncio.wait(tasks.values(), timeout=self.poll_deadline)
         
+        now = time.monotonic()
+        for ip, task in tasks.items():
+            if task in done:
+                # Late results are merged by _async_late_result instead
+                if ip not in self._late_miners:
+                    self._poll_tasks.pop(ip, None)
+                    if not task.cancelled():
+                        self._update_miner(ip, task.result())
+                continue
+            
+            # Miner missed the deadline, serve its last good snapshot
+            if ip in self._last_success and ip in self.miners:
+                self.miners[ip].stale_seconds = round(
+                    now - self._last_success[ip], 1
+                )
+            
+            if ip not in self._late_miners:
+                _LOGGER.debug("Miner %s missed the poll deadline", ip)
+                self._late_miners.add(ip)
+                task.add_done_callback(partial(self._async_late_result, ip))
+        
+        self._evaluate_anomalies()
+        self.poll_stats.record_cycle(time.perf_counter() - cycle_started)
         return self.miners
 
-    async def _fetch_miner_data(self, ip: str) -> dict[str, Any] | None:
-        """Fetch data from single miner."""
+    def _due_miners(self) -> set[str]:
+        """Return the miners whose poll slot is up this tick.
+        
+        New miners are placed in the least loaded slot so the fleet stays
+        spread evenly across the poll interval.
+        """
+        if self.poll_slots == 1:
+            return self.active_miners
+        
+        for ip in self._slot_assignments.keys() - self.active_miners:
+            del self._slot_assignments[ip]
+        
+        load = [0] * self.poll_slots
+        for slot in self._slot_assignments.values():
+            load[slot] += 1
+        for ip in sorted(self.active_miners - self._slot_assignments.keys()):
+            slot = load.index(min(load))
+            self._slot_assignments[ip] = slot
+            load[slot] += 1
+        
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.poll_slots
+        return {
+            ip for ip, assigned in self._slot_assignments.items() if assigned == slot
+        }
+
+    @callback
+    def _async_late_result(self, ip: str, task: asyncio.Task) -> None:
+        """Merge a poll result that arrived after the cycle deadline."""
+        self._late_miners.discard(ip)
+        if self._poll_tasks.get(ip) is task:
+            del self._poll_tasks[ip]
+        
+        if task.cancelled() or ip not in self.active_miners:
+            return
+        
+        self._update_miner(ip, task.result())
+        self.async_update_listeners()
+
+    def _push_current(self, ip: str, now: float) -> bool:
+        """Return True if a miner's log stream stands in for polling it."""
+        stream = self.streams.get(ip)
+        if stream is None or not stream.connected:
+            return False
+        return now - self._last_success.get(ip, -math.inf) < PUSH_RECONCILE_INTERVAL
+
+    @callback
+    def _async_sync_streams(self) -> None:
+        """Stream from every active miner that has answered a poll."""
+        for ip in self.streams.keys() - self.active_miners:
+            self.streams.pop(ip).stop()
+        for ip in self.active_miners - self.streams.keys():
+            if ip in self._last_success:
+                stream = self.streams[ip] = MinerStream(
+                    ip, self.session, self._async_handle_push
+                )
+                stream.start()
+
+    @callback
+    def _async_handle_push(self, ip: str, event: LogEvent) -> None:
+        """Apply a log stream event to the miner's snapshot."""
+        snapshot = self.miners.get(ip)
+        if snapshot is None or not snapshot.available:
+            return
+        
+        kind = event.kind
+        if kind == EVENT_SHARE_ACCEPTED:
+            snapshot.shares_accepted += 1
+        elif kind == EVENT_SHARE_REJECTED:
+            snapshot.shares_rejected += 1
+        elif kind == EVENT_BLOCK:
+            snapshot.found_blocks += 1
+            snapshot.total_found_blocks += 1
+            self._check_block_hits(ip, snapshot)
+        elif kind == EVENT_TEMPERATURE and snapshot.temperature != event.value:
+            snapshot.temperature = event.value
+            self.fleet.update(ip, snapshot)
+        elif kind == EVENT_VR_TEMPERATURE and snapshot.vr_temperature != event.value:
+            snapshot.vr_temperature = event.value
+            self.fleet.update(ip, snapshot)
+        else:
+            return
+        
+        # Publish changes in batches rather than once per log line
+        if self._push_update is None:
+            self._push_update = self.hass.loop.call_later(
+                PUSH_UPDATE_DELAY, self._async_publish_push
+            )
+
+    @callback
+    def _async_publish_push(self) -> None:
+        """Tell entities about the changes pushed since the last batch."""
+        self._push_update = None
+        self.async_update_listeners()
+
+    @callback
+    def async_request_static_refresh(self, ip: str) -> None:
+        """Refresh a miner's static tier on its next poll."""
+        self._static_requested.add(ip)
+
+    async def async_refresh_miner(self, ip: str) -> None:
+        """Poll one miner now, whatever its poll slot, and publish the result.
+        
+        Bypasses the circuit breaker, since the poll was asked for. If a
+        poll of the miner is already in flight, waits for that one instead;
+        its cycle merges the result.
+        """
+        if ip not in self.active_miners:
+            return
+        
+        if (task := self._poll_tasks.get(ip)) is not None:
+            await asyncio.wait([task])
+            return
+        
+        self._update_miner(ip, await self._fetch_miner_data(ip))
+        self.async_update_listeners()
+
+    def _static_due(self, ip: str, now: float) -> bool:
+        """Return True if a miner's static tier should be refreshed."""
+        if ip in self._static_requested or ip not in self._static_refreshed_at:
+            return True
+        return now - self._static_refreshed_at[ip] >= STATIC_REFRESH_INTERVAL
+
+    def _update_miner(self, ip: str, data: MinerSnapshot | None) -> None:
+        """Store a miner's poll result and check for block hits."""
+        breaker = self._breakers.setdefault(ip, MinerBreaker())
+        
+        reason = self._failure_reasons.pop(ip, None)
+        if data is not None:
+            if breaker.failures >= BREAKER_FAILURE_THRESHOLD:
+                _LOGGER.info("Miner %s is answering again", ip)
+            breaker.record_success()
+            
+            mac = format_mac(data.mac) if data.mac else None
+            if mac is not None and self.ip_to_mac.get(ip) != mac:
+                self._async_learn_mac(ip, mac)
+            
+            # Uptime going backwards means the miner rebooted, and settings
+            # such as frequency or pool may have changed with it
+            now = time.monotonic()
+            previous = self.miners.get(ip)
+            rebooted = previous is not None and data.uptime < previous.uptime
+            if rebooted or self._static_due(ip, now):
+                self._static_refreshed_at[ip] = now
+                self._static_requested.discard(ip)
+                self.static_generation[ip] = self.static_generation.get(ip, 0) + 1
+            
+            self._add_rolling_sample(ip, data, now)
+            self._set_snapshot(ip, data)
+            self._last_success[ip] = time.monotonic()
+            if self.cache is not None:
+                self.cache.async_seen(ip, mac, data.hostname, data.firmware)
+            
+            self._check_block_hits(ip, data)
+        else:
+            # Error fetching data, mark as unavailable but keep entry
+            self._set_snapshot(ip, MinerSnapshot.unavailable(ip, reason))
+            
+            delay = breaker.record_failure(
+                time.monotonic(), self.poll_interval
+            )
+            if delay is not None:
+                _LOGGER.debug(
+                    "Miner %s failed %d polls in a row, next probe in %.0f s",
+                    ip,
+                    breaker.failures,
+                    delay,
+                )
+            
+            # The miner may have a new DHCP lease, look for its MAC once
+            # per outage
+            mac = self.ip_to_mac.get(ip)
+            if (
+                mac is not None
+                and breaker.failures >= REACQUIRE_AFTER_FAILURES
+                and not breaker.reacquiring
+                and ip not in self._reacquire_tasks
+            ):
+                breaker.reacquiring = True
+                self._reacquire_tasks[ip] = asyncio.create_task(
+                    self._async_reacquire(ip, mac)
+                )
+
+    def _check_block_hits(self, ip: str, data: MinerSnapshot) -> None:
+        """Fire an event if a miner's block count went up."""
+        # Counted per miner rather than per IP
+        miner_id = self.ip_to_mac.get(ip, ip)
+        total_blocks = data.total_found_blocks
+        previous_blocks = self.previous_block_counts.get(miner_id, 0)
+        
+        if total_blocks > previous_blocks:
+            _LOGGER.info("Block found on miner %s! Total blocks: %s", ip, total_blocks)
+            self.hass.bus.async_fire(
+                EVENT_BLOCK_FOUND,
+                {
+                    "miner_ip": ip,
+                    "total_blocks": total_blocks,
+                    "blocks_this_session": data.found_blocks,
+                    "device_model": data.device_model,
+                    "hashrate": data.hashrate,
+                    "total_best_diff": data.total_best_diff,
+                    "best_diff": data.best_diff,
+                    "temperature": data.temperature,
+                    "pool_connected": data.pool_connected,
+                    "ssid": data.ssid,
+                    "stratum_url": data.stratum_url,
+                    "stratum_port": data.stratum_port,
+                },
+            )
+        
+        self.previous_block_counts[miner_id] = total_blocks
+        if self.snapshots is not None:
+            self.snapshots.async_update(data, self.previous_block_counts)
+
+    def _add_rolling_sample(
+        self, ip: str, data: MinerSnapshot, now: float
+    ) -> None:
+        """Add a snapshot to the miner's rolling window and copy the results."""
+        rolling = self.rolling.get(ip)
+        if rolling is None:
+            rolling = self.rolling[ip] = RollingStats(
+                self._rolling_capacity, ROLLING_WINDOWS
+            )
+        rolling.add(now, data.hashrate, data.shares_accepted, data.shares_rejected)
+        
+        data.hashrate_1m = rolling.average(ROLLING_WINDOW_1M)
+        data.hashrate_10m = rolling.average(ROLLING_WINDOW_10M)
+        data.hashrate_1h = rolling.average(ROLLING_WINDOW_1H)
+        if (share_rate := rolling.share_rate(ROLLING_WINDOW_1H)) is not None:
+            data.share_rate = round(share_rate, 2)
+        if (reject_ratio := rolling.reject_ratio(ROLLING_WINDOW_1H)) is not None:
+            data.reject_ratio = round(reject_ratio * 100, 2)
+        
+        self.anomalies.add(
+            ip,
+            {
+                "hashrate": data.hashrate,
+                # Watts per hash; only compared relative to its baseline
+                "efficiency": data.power / data.hashrate if data.hashrate > 0 else None,
+                "temperature": data.temperature,
+                "vr_temperature": data.vr_temperature,
+                "reject_ratio": data.reject_ratio,
+            },
+        )
+
+    def _evaluate_anomalies(self) -> None:
+        """Score the answering miners against the fleet in one pass.
+        
+        Uses only the snapshots already polled. Fires EVENT_ANOMALY for
+        each metric that just went out of line and copies the health
+        scores onto the snapshots.
+        """
+        answering = [
+            ip
+            for ip in self.active_miners
+            if (snapshot := self.miners.get(ip)) is not None and snapshot.available
+        ]
+        for anomaly in self.anomalies.evaluate(answering):
+            ip = anomaly["miner_ip"]
+            health = self.anomalies.health.get(ip)
+            _LOGGER.info(
+                "Miner %s %s is out of line (z-score %s against its %s)",
+                ip,
+                anomaly["metric"],
+                anomaly["z_score"],
+                anomaly["basis"],
+            )
+            self.hass.bus.async_fire(
+                EVENT_ANOMALY,
+                {**anomaly, "miner_id": self.miner_id(ip), "health_score": health},
+            )
+        
+        for ip in answering:
+            self.miners[ip].health_score = self.anomalies.health.get(ip)
+
+    def _set_snapshot(self, ip: str, snapshot: MinerSnapshot) -> None:
+        """Store a miner's snapshot and fold it into the fleet totals."""
+        self.miners[ip] = snapshot
+        self.fleet.update(ip, snapshot)
+
+    def miner_id(self, ip: str) -> str | None:
+        """Return the identity a miner's entities are keyed by.
+        
+        That is the miner's MAC, or its IP if it answered without one or
+        was configured by address. Returns None while neither is known.
+        """
+        if ip in self.ip_to_mac:
+            return self.ip_to_mac[ip]
+        if ip in self.configured_miners:
+            return ip
+        data = self.miners.get(ip)
+        if data is not None and data.available:
+            return ip
+        return None
+
+    def ip_for(self, miner_id: str) -> str:
+        """Return the current IP of a miner identity."""
+        return self.mac_to_ip.get(miner_id, miner_id)
+
+    @callback
+    def _async_learn_mac(self, ip: str, mac: str) -> None:
+        """Index a miner's MAC, handling a miner seen at a new IP."""
+        old_ip = self.mac_to_ip.get(mac)
+        if old_ip is not None and old_ip != ip and old_ip in self.active_miners:
+            # Found at its new address by a sweep or DHCP
+            self.async_move_miner(old_ip, ip, mac)
+            return
+        
+        self.ip_to_mac[ip] = mac
+        self.mac_to_ip[mac] = ip
+        self._async_migrate_registry({ip: mac})
+
+    @callback
+    def async_move_miner(self, old_ip: str, new_ip: str, mac: str) -> None:
+        """Point a miner identity at a new IP.
+        
+        Entities follow through the MAC index. State tied to the old
+        address is dropped and the new address is polled fresh.
+        """
+        _LOGGER.info("Miner %s moved from %s to %s", mac, old_ip, new_ip)
+        
+        task = self._poll_tasks.pop(old_ip, None)
+        if task is not None:
+            task.cancel()
+        self._late_miners.discard(old_ip)
+        for state in (
+            self.miners,
+            self._last_success,
+            self.static_generation,
+            self._static_refreshed_at,
+            self._breakers,
+            self._failure_reasons,
+            self._slot_assignments,
+            self.rolling,
+        ):
+            state.pop(old_ip, None)
+        self._static_requested.discard(old_ip)
+        stream = self.streams.pop(old_ip, None)
+        if stream is not None:
+            stream.stop()
+        self.fleet.remove(old_ip)
+        self.anomalies.remove(old_ip)
+        self.poll_stats.remove(old_ip)
+        if self.snapshots is not None:
+            self.snapshots.async_remove(old_ip)
+        if self.cache is not None:
+            self.cache.async_remove(old_ip)
+        
+        self.ip_to_mac.pop(old_ip, None)
+        self.ip_to_mac[new_ip] = mac
+        self.mac_to_ip[mac] = new_ip
+        self.active_miners.discard(old_ip)
+        self.active_miners.add(new_ip)
+        
+        if old_ip in self.configured_miners:
+            self.configured_miners.discard(old_ip)
+            self.configured_miners.add(new_ip)
+            self._async_save_configured_miners()
+
+    @callback
+    def _async_save_configured_miners(self) -> None:
+        """Write the configured miner list back to the config entry."""
+        miners = sorted(self.configured_miners)
+        self.config[CONF_MINERS] = miners
+        entry = self.hass.config_entries.async_get_entry(self.config_entry_id)
+        if entry is not None:
+            self.hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_MINERS: miners}
+            )
+
+    async def _async_reacquire(self, ip: str, mac: str) -> None:
+        """Look for a miner that stopped answering at a new address.
+        
+        The neighbor table is checked first. Failing that, addresses close
+        to the old one within the scan ranges are probed.
+        """
         try:
-            # Get system info
-            info = await self._fetch_api(ip, API_INFO_ENDPOINT)
+            discovery = self._create_discovery()
+            neighbors = await async_read_neighbor_table()
+            candidates = [
+                other for other, other_mac in neighbors.items()
+                if other_mac == mac and other != ip
+            ]
+            new_ip = await discovery.locate(mac, candidates)
+            if new_ip is None:
+                new_ip = await discovery.locate(mac, self._nearby_addresses(ip))
             
-            # Get stats/metrics
-            stats = await self._fetch_api(ip, API_STATS_ENDPOINT)
+            if new_ip is None:
+                _LOGGER.debug("Miner %s not found away from %s", mac, ip)
+                return
+            if ip not in self.active_miners:
+                return
             
-            if info is None:
+            self.async_move_miner(ip, new_ip, mac)
+            await self.async_request_refresh()
+        
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Error looking for miner %s: %s", mac, err)
+        finally:
+            self._reacquire_tasks.pop(ip, None)
+
+    def _nearby_addresses(self, ip: str) -> list[str]:
+        """Return unused addresses within REACQUIRE_WINDOW of ip."""
+        try:
+            ranges = parse_scan_targets(self.subnet or ip)
+        except ValueError:
+            return []
+        
+        address = int(ipaddress.IPv4Address(ip))
+        nearby = sorted(
+            range(address - REACQUIRE_WINDOW, address + REACQUIRE_WINDOW + 1),
+            key=lambda other: abs(other - address),
+        )
+        return [
+            str(ipaddress.IPv4Address(other))
+            for other in nearby
+            if other != address
+            and any(first <= other <= last for first, last in ranges)
+            and str(ipaddress.IPv4Address(other)) not in self.active_miners
+        ]
+
+    @callback
+    def _async_migrate_registry(self, macs: dict[str, str]) -> None:
+        """Re-key IP-keyed devices and entities of the given {ip: mac}.
+        
+        The entity IDs, and with them the history, stay the same.
+        """
+        if not macs or self.config_entry_id is None:
+            return
+        
+        entity_registry = er.async_get(self.hass)
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, self.config_entry_id
+        ):
+            match = _IP_UNIQUE_ID.match(entity.unique_id)
+            if match is None:
+                continue
+            mac = macs.get(match.group(1).replace("_", "."))
+            if mac is None:
+                continue
+            
+            new_unique_id = f"{unique_id_prefix(mac)}_{match.group(2)}"
+            if entity_registry.async_get_entity_id(
+                entity.domain, DOMAIN, new_unique_id
+            ):
+                continue
+            entity_registry.async_update_entity(
+                entity.entity_id, new_unique_id=new_unique_id
+            )
+        
+        device_registry = async_get_device_registry(self.hass)
+        for ip, mac in macs.items():
+            device = device_registry.async_get_device(identifiers={(DOMAIN, ip)})
+            if device is None or device_registry.async_get_device(
+                identifiers={(DOMAIN, mac)}
+            ):
+                continue
+            device_registry.async_update_device(
+                device.id,
+                new_identifiers={(DOMAIN, mac)},
+                merge_connections={(CONNECTION_NETWORK_MAC, mac)},
+            )
+            _LOGGER.debug("Moved device of miner %s to MAC %s", ip, mac)
+
+    async def _fetch_miner_data(self, ip: str) -> MinerSnapshot | None:
+        """Fetch data from single miner."""
+        try:
+            started = time.perf_counter()
+            try:
+                info = await self._fetch_api(ip, API_INFO_ENDPOINT)
+            except EndpointNotFound:
+                self._failure_reasons[ip] = "HTTP 404"
                 return None
+            latency = round((time.perf_counter() - started) * 1000, 1)
             
-            # Combine data
-            data = {
-                "available": True,
-                "ip": ip,
-                **info,
-            }
+            if info is None:
+                return None
             
-            if stats:
-                data["stats"] = stats
+            # Parse once into a compact snapshot
+            data = MinerSnapshot.from_api(ip, info)
+            data.latency = latency
             
             _LOGGER.debug("Updated miner %s: %s", ip, data)
             return data
         
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.warning("Error fetching data from %s: %s", ip, err)
+            self._failure_reasons[ip] = str(err) or type(err).__name__
             return None
 
     async def _fetch_api(
@@ -180,35 +955,112 @@ class BitaxeCoordinator(DataUpdateCoordinator):
         ip: str,
         endpoint: str,
     ) -> dict[str, Any] | None:
-        """Fetch JSON from miner API endpoint."""
+        """Fetch JSON from miner API endpoint.
+        
+        Raises EndpointNotFound if the miner answers 404.
+        """
         url = f"http://{ip}{endpoint}"
+        # Filled with the connect time by the session's trace
+        trace: dict[str, float] = {}
+        started = time.perf_counter()
         
         try:
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        _LOGGER.debug(
-                            "API request to %s returned %d",
-                            url,
+            timeout = aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT)
+            async with self._poll_sem:
+                started = time.perf_counter()
+                async with self.session.get(
+                    url, timeout=timeout, trace_request_ctx=trace
+                ) as response:
+                    first_byte = time.perf_counter()
+                    body = await response.read()
+                    if self.capture is not None:
+                        self.capture.record(
+                            ip,
+                            endpoint,
+                            time.perf_counter() - started,
                             response.status,
+                            body,
+                        )
+                    data = self._decode_response(ip, url, response.status, body)
+                    if data is not None:
+                        self.poll_stats.record_request(
+                            ip,
+                            trace.get("connect"),
+                            first_byte - started,
+                            time.perf_counter() - first_byte,
                         )
-                        return None
+                    return data
         
+        except EndpointNotFound:
+            raise
         except asyncio.TimeoutError:
             _LOGGER.debug("Timeout fetching %s", url)
+            self._failure_reasons[ip] = "timeout"
+            self.poll_stats.record_timeout(ip)
+            if self.capture is not None:
+                self.capture.record(
+                    ip, endpoint, time.perf_counter() - started, error="timeout"
+                )
             return None
         except aiohttp.ClientError as err:
             _LOGGER.debug("Connection error to %s: %s", url, type(err).__name__)
+            self._failure_reasons[ip] = type(err).__name__
+            self.poll_stats.record_error(ip)
+            if self.capture is not None:
+                self.capture.record(
+                    ip,
+                    endpoint,
+                    time.perf_counter() - started,
+                    error=type(err).__name__,
+                )
+            return None
+        except ValueError as err:
+            _LOGGER.debug("Invalid JSON from %s: %s", url, err)
+            self._failure_reasons[ip] = "invalid JSON"
+            self.poll_stats.record_error(ip)
             return None
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error("Error fetching %s: %s", url, err)
+            self._failure_reasons[ip] = str(err) or type(err).__name__
+            self.poll_stats.record_error(ip)
             return None
 
+    def _decode_response(
+        self,
+        ip: str,
+        url: str,
+        status: int,
+        body: bytes,
+    ) -> dict[str, Any] | None:
+        """Decode a miner's answer to an API request.
+        
+        Raises EndpointNotFound on 404 and ValueError on invalid JSON.
+        Other error statuses are counted and return None.
+        """
+        if status == 200:
+            return decode_json(body)
+        if status == 404:
+            raise EndpointNotFound(url)
+        _LOGGER.debug("API request to %s returned %d", url, status)
+        self._failure_reasons[ip] = f"HTTP {status}"
+        self.poll_stats.record_error(ip)
+        return None
+
     async def _periodic_scan(self) -> None:
-        """Periodically scan subnet for new miners."""
+        """Warm start from the cache, then scan incrementally.
+        
+        Each scan re-verifies known miners and sweeps one slice of the
+        subnet, so the whole subnet is covered every
+        DISCOVERY_SWEEP_SLICES scan intervals.
+        """
+        try:
+            await self._verify_known_miners()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Error re-verifying cached miners: %s", err)
+        
+        if self.scan_interval <= 0:
+            return
+        
         _LOGGER.info(
             "Starting periodic scan task (interval: %d seconds)",
             self.scan_interval,
@@ -219,35 +1071,21 @@ class BitaxeCoordinator(DataUpdateCoordinator):
                 await asyncio.sleep(self.scan_interval)
                 
                 _LOGGER.debug("Running periodic discovery scan")
-                found_miners = await discover_miners(
-                    subnet=self.subnet,
-                    concurrency=self.concurrency,
-                    timeout=self.timeout,
-                )
+                await self._verify_known_miners()
                 
-                found_set = set(found_miners)
-                
-                # Check for new miners
-                new_miners = found_set - self.active_miners
-                if new_miners:
-                    _LOGGER.info("Found new miners: %s", new_miners)
-                    for ip in new_miners:
-                        self.hass.bus.async_fire(
-                            EVENT_MINER_DISCOVERED,
-                            {"miner_ip": ip},
-                        )
-                        self.active_miners.add(ip)
+                slice_index = self.cache.sweep_cursor % DISCOVERY_SWEEP_SLICES
+                self.cache.async_set_sweep_cursor(
+                    (slice_index + 1) % DISCOVERY_SWEEP_SLICES
+                )
                 
-                # Check for lost miners
-                lost_miners = self.active_miners - found_set - self.configured_miners
-                if lost_miners:
-                    _LOGGER.info("Lost miners: %s", lost_miners)
-                    for ip in lost_miners:
-                        self.hass.bus.async_fire(
-                            EVENT_MINER_LOST,
-                            {"miner_ip": ip},
-                        )
-                        self.active_miners.discard(ip)
+                # Act on each miner as soon as the sweep finds it
+                discovery = self._create_discovery()
+                async for ip in discovery.discover_iter(
+                    slice_index, DISCOVERY_SWEEP_SLICES
+                ):
+                    if ip not in self.active_miners:
+                        await self.async_add_miner(ip)
+                self._finish_discovery(discovery, "sweep")
             
             except asyncio.CancelledError:
                 _LOGGER.debug("Periodic scan task cancelled")
@@ -256,14 +1094,94 @@ class BitaxeCoordinator(DataUpdateCoordinator):
                 _LOGGER.error("Error in periodic scan: %s", err)
                 # Continue scanning even if there's an error
 
+    async def _verify_known_miners(self) -> None:
+        """Re-check cached and discovered miners without a subnet sweep.
+        
+        Miners that answered a poll since the last scan need no probe.
+        Discovered miners that fail the probe are reported lost; they stay
+        in the cache and are re-checked on later scans.
+        """
+        now = time.monotonic()
+        polled_recently = {
+            ip
+            for ip, last in self._last_success.items()
+            if now - last < self.scan_interval
+        }
+        candidates = (
+            (self.active_miners | self.cache.ips)
+            - self.configured_miners
+            - polled_recently
+        )
+        if not candidates:
+            return
+        
+        _LOGGER.debug("Re-verifying %d known miner(s)", len(candidates))
+        discovery = self._create_discovery()
+        alive = set(await discovery.verify(candidates))
+        self._finish_discovery(discovery, "verify")
+        
+        for ip in sorted(alive - self.active_miners):
+            await self.async_add_miner(ip)
+        
+        # Check for lost miners
+        lost_miners = (self.active_miners & candidates) - alive
+        if lost_miners:
+            _LOGGER.info("Lost miners: %s", lost_miners)
+            for ip in lost_miners:
+                self.hass.bus.async_fire(
+                    EVENT_MINER_LOST,
+                    {"miner_ip": ip},
+                )
+                self.active_miners.discard(ip)
+                self.fleet.remove(ip)
+
+    def _create_discovery(self) -> BitaxeDiscovery:
+        """Return a discovery scanner using the pooled session."""
+        # Hosts expected to answer, whose connect timeouts mean congestion
+        known_hosts = set(self.active_miners)
+        if self.cache is not None:
+            known_hosts |= self.cache.ips
+        return BitaxeDiscovery(
+            subnet=self.subnet,
+            concurrency=self.concurrency,
+            timeout=self.timeout,
+            session=self.session,
+            strategy=self.discovery_strategy,
+            espressif_only=self.espressif_only,
+            known_hosts=known_hosts,
+            connect_concurrency=self.connect_concurrency,
+        )
+
+    def _finish_discovery(self, discovery: BitaxeDiscovery, kind: str) -> None:
+        """Keep the concurrency the scan tuned itself to, and its stats."""
+        self.concurrency = discovery.concurrency
+        self.connect_concurrency = discovery.connect_concurrency
+        if discovery.last_scan is not None:
+            self.discovery_stats[kind] = discovery.last_scan
+
+    async def async_add_miner(self, ip: str) -> None:
+        """Start polling a newly found miner."""
+        _LOGGER.info("Found new miner: %s", ip)
+        self.hass.bus.async_fire(
+            EVENT_MINER_DISCOVERED,
+            {"miner_ip": ip},
+        )
+        self.active_miners.add(ip)
+        await self.async_request_refresh()
+
     async def _register_devices(self) -> None:
         """Register miners as devices in Home Assistant."""
         device_registry = async_get_device_registry(self.hass)
         
         for ip in self.configured_miners:
+            miner_id = self.ip_to_mac.get(ip, ip)
+            connections = (
+                {(CONNECTION_NETWORK_MAC, miner_id)} if miner_id != ip else set()
+            )
             device_registry.async_get_or_create(
                 config_entry_id=self.config_entry_id,
-                identifiers={(DOMAIN, ip)},
+                identifiers={(DOMAIN, miner_id)},
+                connections=connections,
                 name=f"Bitaxe {ip}",
                 manufacturer=MANUFACTURER,
                 model=MODEL_BITAXE,
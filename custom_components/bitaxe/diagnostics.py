@@ -0,0 +1,56 @@
+"""Diagnostics support for Bitaxe."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import BitaxeCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: BitaxeCoordinator = hass.data[DOMAIN][entry.entry_id]
+    
+    return {
+        "config": {**entry.data, **entry.options},
+        "miners": {
+            "configured": sorted(coordinator.configured_miners),
+            "active": sorted(coordinator.active_miners),
+            # Why a miner is unavailable, or how old its served data is
+            "state": {
+                ip: {
+                    "available": snapshot.available,
+                    "error": snapshot.error,
+                    "stale_seconds": snapshot.stale_seconds,
+                }
+                for ip, snapshot in sorted(coordinator.miners.items())
+            },
+        },
+        "polling": coordinator.poll_stats.as_dict(),
+        "push": {
+            ip: stream.as_dict() for ip, stream in sorted(coordinator.streams.items())
+        },
+        "capture": (
+            {
+                "path": coordinator.capture.path,
+                "bytes": coordinator.capture.written,
+                "stopped": coordinator.capture.stopped,
+            }
+            if coordinator.capture is not None
+            else None
+        ),
+        "anomalies": {
+            "scores": coordinator.anomalies.scores,
+            "health": coordinator.anomalies.health,
+        },
+        "discovery": {
+            "concurrency": coordinator.concurrency,
+            "connect_concurrency": coordinator.connect_concurrency,
+            **coordinator.discovery_stats,
+        },
+    }
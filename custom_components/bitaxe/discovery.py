@@ -2,16 +2,250 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator
 import ipaddress
+from itertools import chain, islice
 import logging
+from pathlib import Path
+import time
 from typing import Any
 
 import aiohttp
 
-from .const import API_INFO_ENDPOINT
+from .api import async_read_json
+from .const import (
+    AIMD_DECREASE,
+    AIMD_ERROR_THRESHOLD,
+    AIMD_MIN_WINDOW,
+    AIMD_TIMELINE_MAX,
+    API_INFO_ENDPOINT,
+    DEFAULT_DISCOVERY_STRATEGY,
+    DISCOVERY_CONCURRENCY_MAX,
+    DISCOVERY_CONNECT_CONCURRENCY_MAX,
+    DISCOVERY_PORT,
+    ESPRESSIF_OUIS,
+    NEIGHBOR_TABLE_PATH,
+    STRATEGY_FULL,
+    STRATEGY_QUICK,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_EMPTY_MAC = "00:00:00:00:00:00"
+
+
+def parse_neighbor_table(text: str) -> dict[str, str]:
+    """Parse /proc/net/arp or `ip neigh` output into {ip: mac}.
+    
+    Incomplete and failed entries are skipped. MACs are lower-cased.
+    """
+    neighbors: dict[str, str] = {}
+    
+    for line in text.splitlines():
+        fields = line.split()
+        if not fields or fields[0] == "IP":
+            continue
+        
+        if len(fields) > 1 and fields[1] == "dev":
+            # ip neigh: "<ip> dev <if> lladdr <mac> <STATE>"
+            if "lladdr" not in fields or fields[-1] == "FAILED":
+                continue
+            mac = fields[fields.index("lladdr") + 1]
+        elif len(fields) >= 4:
+            # /proc/net/arp: "<ip> <hw type> <flags> <mac> <mask> <device>"
+            mac = fields[3]
+            if fields[2] == "0x0":
+                continue
+        else:
+            continue
+        
+        mac = mac.lower()
+        if mac != _EMPTY_MAC:
+            neighbors[fields[0]] = mac
+    
+    return neighbors
+
+
+def parse_scan_targets(targets: str) -> list[tuple[int, int]]:
+    """Parse a list of CIDRs, address ranges and single addresses.
+    
+    Entries are separated by commas or whitespace. Ranges are written
+    "10.0.6.10-10.0.6.50" or "10.0.6.10-50". Returns the host addresses
+    as sorted, disjoint (first, last) ranges of integers; overlapping
+    entries are merged. Network and broadcast addresses of CIDRs are
+    left out, as in IPv4Network.hosts().
+    
+    Raises ValueError if an entry is invalid or nothing is given.
+    """
+    ranges: list[tuple[int, int]] = []
+    
+    for entry in targets.replace(",", " ").split():
+        if "-" in entry:
+            first_text, last_text = entry.split("-", 1)
+            if "." not in last_text:
+                # Short form, only the last octet is given
+                last_text = f"{first_text.rsplit('.', 1)[0]}.{last_text}"
+            first = int(ipaddress.IPv4Address(first_text))
+            last = int(ipaddress.IPv4Address(last_text))
+            if last < first:
+                raise ValueError(f"Range {entry} ends before it starts")
+        else:
+            network = ipaddress.IPv4Network(entry, strict=False)
+            first = int(network.network_address)
+            last = int(network.broadcast_address)
+            if network.prefixlen < 31:
+                first += 1
+                last -= 1
+        ranges.append((first, last))
+    
+    if not ranges:
+        raise ValueError("No subnet given")
+    
+    merged: list[tuple[int, int]] = []
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    return merged
+
+
+def is_espressif_mac(mac: str) -> bool:
+    """Return True if a MAC address belongs to an Espressif OUI."""
+    return mac[:8].lower() in ESPRESSIF_OUIS
+
+
+async def async_read_neighbor_table(
+    path: str = NEIGHBOR_TABLE_PATH,
+) -> dict[str, str]:
+    """Read the neighbor table, falling back to `ip neigh` if the file is missing.
+    
+    Returns an empty dict if neither source is available.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        text = await loop.run_in_executor(None, Path(path).read_text)
+    except OSError:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ip",
+                "neigh",
+                "show",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await process.communicate()
+        except OSError as err:
+            _LOGGER.debug("Neighbor table is not available: %s", err)
+            return {}
+        text = stdout.decode(errors="replace")
+    
+    return parse_neighbor_table(text)
+
+
+class AimdLimiter:
+    """In-flight limit tuned by additive increase, multiplicative decrease.
+    
+    Probe outcomes are judged in windows of at least AIMD_MIN_WINDOW and
+    at least the current limit. A window whose share of timeouts and
+    connection errors passes AIMD_ERROR_THRESHOLD multiplies the limit by
+    AIMD_DECREASE; a clean window raises it by one. Outcomes that say
+    nothing about congestion free their slot without being judged.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        maximum: int = DISCOVERY_CONCURRENCY_MAX,
+        name: str = "probe",
+    ) -> None:
+        """Initialize the limiter."""
+        self.name = name
+        self.maximum = maximum
+        self.limit = max(1, min(initial, maximum))
+        self.timeline: deque[dict[str, Any]] = deque(maxlen=AIMD_TIMELINE_MAX)
+        self.probes = 0
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._started = time.monotonic()
+        self._window_started = self._started
+        self._window_total = 0
+        self._window_errors = 0
+        self._record_point(0.0, 0.0)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+
+    def release(self, clean: bool | None) -> None:
+        """Free a slot and record whether the probe got an answer.
+        
+        clean is None for outcomes that are not judged.
+        """
+        self._in_flight -= 1
+        self.probes += 1
+        if clean is not None:
+            self._window_total += 1
+            if not clean:
+                self._window_errors += 1
+            
+            if self._window_total >= max(AIMD_MIN_WINDOW, self.limit):
+                self._adjust()
+        
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def _adjust(self) -> None:
+        """Close the current window and move the limit."""
+        now = time.monotonic()
+        error_rate = self._window_errors / self._window_total
+        rate = self._window_total / max(now - self._window_started, 1e-3)
+        
+        if error_rate > AIMD_ERROR_THRESHOLD:
+            limit = max(1, int(self.limit * AIMD_DECREASE))
+        else:
+            limit = min(self.maximum, self.limit + 1)
+        
+        if limit != self.limit:
+            _LOGGER.debug(
+                "Discovery %s concurrency %d -> %d (%.0f/s, %.0f%% errors)",
+                self.name,
+                self.limit,
+                limit,
+                rate,
+                error_rate * 100,
+            )
+            self.limit = limit
+            self._record_point(rate, error_rate)
+        
+        self._window_started = now
+        self._window_total = 0
+        self._window_errors = 0
+
+    def _record_point(self, rate: float, error_rate: float) -> None:
+        """Add the current limit to the timeline."""
+        self.timeline.append(
+            {
+                "elapsed": round(time.monotonic() - self._started, 3),
+                "concurrency": self.limit,
+                "probes_per_second": round(rate, 1),
+                "error_rate": round(error_rate, 3),
+            }
+        )
+
 
 class BitaxeDiscovery:
     """Scan subnet for Bitaxe miners."""
@@ -21,18 +255,79 @@ class BitaxeDiscovery:
         subnet: str,
         concurrency: int = 20,
         timeout: float = 1.5,
+        session: aiohttp.ClientSession | None = None,
+        strategy: str = DEFAULT_DISCOVERY_STRATEGY,
+        espressif_only: bool = False,
+        neighbor_table: str = NEIGHBOR_TABLE_PATH,
+        known_hosts: Iterable[str] = (),
+        connect_concurrency: int | None = None,
     ) -> None:
-        """Initialize discovery."""
+        """Initialize discovery.
+        
+        If no session is given, one is created for the duration of each
+        scan and closed afterwards. Unless strategy is full, hosts from the
+        neighbor table are probed first; quick mode probes only those.
+        espressif_only limits the neighbor hosts to Espressif MACs.
+        concurrency is the starting number of HTTP probes in flight; it is
+        tuned during each scan and carried over to the next one. subnet may
+        list several CIDRs, address ranges and addresses (see
+        parse_scan_targets); they are swept as one pool of hosts under one
+        concurrency budget.
+        
+        The TCP connect stage of a sweep has its own limiter, starting at
+        connect_concurrency (DISCOVERY_CONNECT_CONCURRENCY_MAX if not
+        given). Connects to known_hosts, such as cached or configured
+        miners, and to neighbor table hosts are expected to succeed, so
+        their timeouts are taken as dropped SYNs and back it off.
+        """
         self.subnet = subnet
         self.concurrency = concurrency
         self.timeout = timeout
-        self.sem = asyncio.Semaphore(concurrency)
+        self.session = session
+        self.strategy = strategy
+        self.espressif_only = espressif_only
+        self.neighbor_table = neighbor_table
+        self.known_hosts = set(known_hosts)
+        self.connect_concurrency = (
+            connect_concurrency or DISCOVERY_CONNECT_CONCURRENCY_MAX
+        )
+        
+        # Limiters of the running scan, and stats of the last one
+        self._limiter: AimdLimiter | None = None
+        self._connect_limiter: AimdLimiter | None = None
+        # Addresses whose connect timeouts count as congestion
+        self._live_hosts: set[str] = set()
+        self.last_scan: dict[str, Any] | None = None
+        self._addresses_tried = 0
 
     async def discover(self) -> list[str]:
         """Scan subnet for Bitaxe miners.
         
         Returns list of IPs of discovered miners.
         """
+        return [ip async for ip in self.discover_iter()]
+
+    async def discover_iter(
+        self,
+        slice_index: int = 0,
+        slice_count: int = 1,
+    ) -> AsyncIterator[str]:
+        """Scan subnet for Bitaxe miners, yielding each one as it is found.
+        
+        The scan runs in two stages. A pool of workers pulls addresses
+        lazily from the subnet and tries a plain TCP connect to port 80.
+        Hosts that accept are handed to a second pool that checks the API
+        signature over HTTP. Memory use does not grow with the subnet
+        size. Breaking out of the iteration stops the scan. Each stage's
+        in-flight limit follows its own AimdLimiter: the connect stage
+        backs off on timeouts to hosts expected to be up, the probe stage
+        on any timeout or connection error.
+        
+        With slice_count > 1 only every slice_count-th address of the
+        subnet, starting at slice_index, is swept (neighbor table hosts
+        are always included), so repeated scans can cover the subnet
+        a slice at a time.
+        """
         _LOGGER.info(
             "Starting discovery scan: subnet=%s, concurrency=%s, timeout=%s",
             self.subnet,
@@ -41,64 +336,351 @@ class BitaxeDiscovery:
         )
         
         try:
-            network = ipaddress.IPv4Network(self.subnet, strict=False)
+            ranges = parse_scan_targets(self.subnet)
         except ValueError as err:
             _LOGGER.error("Invalid subnet format: %s", err)
+            return
+        
+        owns_session = self.session is None
+        session = self.session or aiohttp.ClientSession()
+        
+        # Shared by all connect workers; each next() hands out one address
+        hosts = await self._hosts(ranges, slice_index, slice_count)
+        open_hosts: asyncio.Queue[str | None] = asyncio.Queue(
+            DISCOVERY_CONCURRENCY_MAX * 4
+        )
+        found: asyncio.Queue[str | None] = asyncio.Queue()
+        self._limiter = AimdLimiter(self.concurrency)
+        self._connect_limiter = AimdLimiter(
+            self.connect_concurrency, DISCOVERY_CONNECT_CONCURRENCY_MAX, "connect"
+        )
+        self._addresses_tried = 0
+        started = time.monotonic()
+        
+        size = sum(last - first + 1 for first, last in ranges)
+        connect_workers = [
+            asyncio.create_task(self._connect_worker(hosts, open_hosts))
+            for _ in range(max(1, min(DISCOVERY_CONNECT_CONCURRENCY_MAX, size)))
+        ]
+        probe_workers = [
+            asyncio.create_task(self._probe_worker(session, open_hosts, found))
+            for _ in range(max(1, min(DISCOVERY_CONCURRENCY_MAX, size)))
+        ]
+        workers = [
+            *connect_workers,
+            *probe_workers,
+            asyncio.create_task(
+                self._close_stage(connect_workers, open_hosts, len(probe_workers))
+            ),
+        ]
+        
+        found_count = 0
+        try:
+            running = len(probe_workers)
+            while running:
+                ip = await found.get()
+                if ip is None:
+                    # One probe worker ran out of hosts
+                    running -= 1
+                    continue
+                found_count += 1
+                yield ip
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if owns_session:
+                await session.close()
+            self._finish_scan(started, found_count)
+        
+        _LOGGER.info("Discovery complete: found %d miner(s)", found_count)
+
+    async def verify(self, ips: Iterable[str]) -> list[str]:
+        """Probe known addresses directly and return those that are miners.
+        
+        Skips the subnet sweep and the connect stage, so re-checking a
+        handful of cached miners costs one request each.
+        """
+        ips = list(ips)
+        if not ips:
             return []
         
-        # Create probe task for each IP
-        tasks = [self._probe_ip(str(ip)) for ip in network.hosts()]
+        owns_session = self.session is None
+        session = self.session or aiohttp.ClientSession()
+        self._limiter = AimdLimiter(self.concurrency)
+        started = time.monotonic()
+        
+        results: list[str | None] = []
+        try:
+            results = await asyncio.gather(
+                *(self._probe_ip(session, ip) for ip in ips)
+            )
+        finally:
+            if owns_session:
+                await session.close()
+            self._finish_scan(started, sum(ip is not None for ip in results))
+        
+        return [ip for ip in results if ip is not None]
+
+    async def locate(self, mac: str, ips: Iterable[str]) -> str | None:
+        """Return the address among ips whose miner reports the given MAC.
+        
+        Used to find a miner again after it changed address. The MAC is
+        compared case-insensitively.
+        """
+        ips = list(ips)
+        if not ips:
+            return None
+        
+        owns_session = self.session is None
+        session = self.session or aiohttp.ClientSession()
+        self._limiter = AimdLimiter(self.concurrency)
+        started = time.monotonic()
+        
+        found: str | None = None
+        try:
+            infos = await asyncio.gather(
+                *(self._probe_info(session, ip) for ip in ips)
+            )
+            for ip, info in zip(ips, infos):
+                if info is None:
+                    continue
+                if str(info.get("macAddr", "")).lower() == mac.lower():
+                    found = ip
+                    break
+        finally:
+            if owns_session:
+                await session.close()
+            self._finish_scan(started, int(found is not None))
+        
+        return found
+
+    def _finish_scan(self, started: float, found_count: int) -> None:
+        """Keep the tuned concurrency and record stats of the scan."""
+        limiter = self._limiter
+        connect_limiter = self._connect_limiter
+        self._limiter = None
+        self._connect_limiter = None
+        self._live_hosts = set()
+        if limiter is None:
+            return
+        
+        self.concurrency = limiter.limit
+        if connect_limiter is not None:
+            self.connect_concurrency = connect_limiter.limit
+        # Sweeps try every address; verify and locate probe theirs directly
+        tried = max(self._addresses_tried, limiter.probes)
+        self._addresses_tried = 0
+        self.last_scan = {
+            "duration": round(time.monotonic() - started, 3),
+            "addresses": tried,
+            "probes": limiter.probes,
+            "found": found_count,
+            "hit_rate": round(found_count / tried, 4) if tried else None,
+            "final_concurrency": limiter.limit,
+            "concurrency_timeline": list(limiter.timeline),
+        }
+        if connect_limiter is not None:
+            self.last_scan["final_connect_concurrency"] = connect_limiter.limit
+            self.last_scan["connect_timeline"] = list(connect_limiter.timeline)
+        _LOGGER.debug(
+            "Discovery concurrency timeline: %s", self.last_scan["concurrency_timeline"]
+        )
+
+    async def _hosts(
+        self,
+        ranges: list[tuple[int, int]],
+        slice_index: int = 0,
+        slice_count: int = 1,
+    ) -> Iterator[str]:
+        """Return the addresses to scan, in order, for the strategy.
+        
+        The ranges are disjoint, so no address is handed out twice.
+        """
+        all_hosts = (
+            str(ipaddress.IPv4Address(ip))
+            for ip in islice(
+                chain.from_iterable(range(first, last + 1) for first, last in ranges),
+                slice_index,
+                None,
+                slice_count,
+            )
+        )
+        self._live_hosts = set(self.known_hosts)
+        if self.strategy == STRATEGY_FULL:
+            return all_hosts
+        
+        neighbors: dict[str, str] = {}
+        for ip, mac in (await async_read_neighbor_table(self.neighbor_table)).items():
+            try:
+                address = int(ipaddress.IPv4Address(ip))
+            except ValueError:
+                # IPv6 neighbors from `ip neigh`
+                continue
+            if not any(first <= address <= last for first, last in ranges):
+                continue
+            if not self.espressif_only or is_espressif_mac(mac):
+                neighbors[ip] = mac
+        
+        self._live_hosts.update(neighbors)
+        
+        # Espressif hosts are the likeliest miners, try them first
+        seeds = sorted(neighbors, key=lambda ip: not is_espressif_mac(neighbors[ip]))
+        _LOGGER.debug(
+            "Seeding discovery with %d neighbor table host(s)", len(seeds)
+        )
         
-        # Gather all results (ignore exceptions)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if self.strategy == STRATEGY_QUICK:
+            return iter(seeds)
+        return chain(seeds, (ip for ip in all_hosts if ip not in neighbors))
+
+    async def _connect_worker(
+        self,
+        hosts: Iterator[str],
+        open_hosts: asyncio.Queue[str | None],
+    ) -> None:
+        """Pass on addresses that accept a TCP connection on port 80."""
+        for ip in hosts:
+            self._addresses_tried += 1
+            if await self._connect_ip(ip):
+                await open_hosts.put(ip)
+
+    async def _close_stage(
+        self,
+        connect_workers: list[asyncio.Task],
+        open_hosts: asyncio.Queue[str | None],
+        probe_count: int,
+    ) -> None:
+        """Tell the probe workers to stop once every address was tried."""
+        await asyncio.gather(*connect_workers, return_exceptions=True)
+        for _ in range(probe_count):
+            await open_hosts.put(None)
+
+    async def _probe_worker(
+        self,
+        session: aiohttp.ClientSession,
+        open_hosts: asyncio.Queue[str | None],
+        found: asyncio.Queue[str | None],
+    ) -> None:
+        """Check the API signature of hosts that passed the connect stage."""
+        try:
+            while (ip := await open_hosts.get()) is not None:
+                if await self._probe_ip(session, ip) is not None:
+                    found.put_nowait(ip)
+        finally:
+            found.put_nowait(None)
+
+    async def _connect_ip(self, ip: str) -> bool:
+        """Return True if the host accepts a TCP connection on port 80.
         
-        # Filter out None values and exceptions
-        found_miners = [ip for ip in results if isinstance(ip, str)]
+        Silence from most addresses is normal, so only answers (accepted
+        or refused) and timeouts to hosts expected to be up are judged by
+        the connect limiter.
+        """
+        limiter = self._connect_limiter
+        if limiter is not None:
+            await limiter.acquire()
+        outcome: bool | None = None
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, DISCOVERY_PORT),
+                timeout=self.timeout / 2,
+            )
+        except asyncio.TimeoutError:
+            if ip in self._live_hosts:
+                outcome = False
+            return False
+        except ConnectionRefusedError:
+            outcome = True
+            return False
+        except OSError:
+            return False
+        finally:
+            if limiter is not None:
+                limiter.release(outcome)
         
-        _LOGGER.info("Discovery complete: found %d miner(s)", len(found_miners))
-        return found_miners
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
 
-    async def _probe_ip(self, ip: str) -> str | None:
+    async def _probe_ip(
+        self,
+        session: aiohttp.ClientSession,
+        ip: str,
+    ) -> str | None:
         """Probe single IP for Bitaxe miner.
         
         Returns IP if miner found, None otherwise.
         """
-        async with self.sem:
-            try:
-                # Direct API probe - much simpler than homepage parsing
-                url = f"http://{ip}{API_INFO_ENDPOINT}"
-                
-                timeout = aiohttp.ClientTimeout(
-                    total=self.timeout,
-                    connect=self.timeout / 2,
-                )
-                
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            # Check for expected fields in Bitaxe API response
-                            if "deviceModel" in data and "hashRate" in data:
-                                _LOGGER.debug("Found Bitaxe miner at %s: %s", ip, data.get("deviceModel"))
-                                return ip
-                        
-            except asyncio.TimeoutError:
-                # Expected for non-responsive hosts
-                pass
-            except aiohttp.ClientError as err:
-                _LOGGER.debug("Connection error to %s: %s", ip, type(err).__name__)
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.debug("Unexpected error probing %s: %s", ip, err)
+        if await self._probe_info(session, ip) is not None:
+            return ip
+        return None
+
+    async def _probe_info(
+        self,
+        session: aiohttp.ClientSession,
+        ip: str,
+    ) -> dict[str, Any] | None:
+        """Probe single IP and return its system info if it is a miner.
+        
+        Timeouts and connection errors count against the scan's
+        concurrency limit.
+        """
+        limiter = self._limiter
+        if limiter is not None:
+            await limiter.acquire()
+        answered = False
+        
+        try:
+            # Direct API probe - much simpler than homepage parsing
+            url = f"http://{ip}{API_INFO_ENDPOINT}"
             
-            return None
+            timeout = aiohttp.ClientTimeout(
+                total=self.timeout,
+                connect=self.timeout / 2,
+            )
+            
+            async with session.get(url, timeout=timeout) as response:
+                answered = True
+                if response.status == 200:
+                    data = await async_read_json(response)
+                    
+                    # Check for expected fields in Bitaxe API response
+                    if (
+                        isinstance(data, dict)
+                        and "deviceModel" in data
+                        and "hashRate" in data
+                    ):
+                        _LOGGER.debug("Found Bitaxe miner at %s: %s", ip, data.get("deviceModel"))
+                        return data
+                    
+        except asyncio.TimeoutError:
+            # Expected for non-responsive hosts
+            pass
+        except aiohttp.ClientError as err:
+            _LOGGER.debug("Connection error to %s: %s", ip, type(err).__name__)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Unexpected error probing %s: %s", ip, err)
+        finally:
+            if limiter is not None:
+                limiter.release(answered)
+        
+        return None
 
 
 async def discover_miners(
     subnet: str,
     concurrency: int = 20,
     timeout: float = 1.5,
+    session: aiohttp.ClientSession | None = None,
+    strategy: str = DEFAULT_DISCOVERY_STRATEGY,
+    espressif_only: bool = False,
 ) -> list[str]:
     """Convenience function for discovery."""
-    discovery = BitaxeDiscovery(subnet, concurrency, timeout)
-    return await discovery.discover()
\ No newline at end of file
+    discovery = BitaxeDiscovery(
+        subnet, concurrency, timeout, session, strategy, espressif_only
+    )
+    return await discovery.discover()
@@ -0,0 +1,343 @@
+"""Data models for the Bitaxe integration."""
+from __future__ import annotations
+
+from typing import Any
+
+
+# Top-level /api/system/info keys read by MinerSnapshot.from_api. Usable as
+# a decode_json whitelist where raw responses are kept around.
+INFO_FIELDS: frozenset[str] = frozenset(
+    {
+        "asicCount",
+        "autofanspeed",
+        "bestDiff",
+        "coreVoltage",
+        "coreVoltageActual",
+        "deviceModel",
+        "fanrpm",
+        "fanspeed",
+        "foundBlocks",
+        "frequency",
+        "hashRate",
+        "hostname",
+        "macAddr",
+        "poolDifficulty",
+        "power",
+        "sharesAccepted",
+        "sharesRejected",
+        "ssid",
+        "stratum",
+        "stratumPort",
+        "stratumURL",
+        "temp",
+        "totalBestDiff",
+        "totalFoundBlocks",
+        "uptimeSeconds",
+        "version",
+        "vrTemp",
+        "wifiRSSI",
+    }
+)
+
+
+def _as_float(value: Any, default: float = 0.0) -> float:
+    """Convert an API value to float, falling back to default."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_int(value: Any, default: int = 0) -> int:
+    """Convert an API value to int, falling back to default."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_str(value: Any, default: str = "Unknown") -> str:
+    """Convert an API value to str, falling back to default."""
+    if value is None or value == "":
+        return default
+    return str(value)
+
+
+class MinerSnapshot:
+    """Parsed view of one miner poll.
+
+    Holds only the fields the integration reads, already converted, so
+    entities read attributes instead of walking the raw API JSON.
+    """
+
+    __slots__ = (
+        "asic_count",
+        "autofanspeed",
+        "available",
+        "best_diff",
+        "core_voltage",
+        "core_voltage_actual",
+        "device_model",
+        "error",
+        "fan_rpm",
+        "fan_speed",
+        "firmware",
+        "found_blocks",
+        "frequency",
+        "hashrate",
+        "hashrate_1h",
+        "hashrate_1m",
+        "hashrate_10m",
+        "health_score",
+        "hostname",
+        "ip",
+        "latency",
+        "mac",
+        "pool_connected",
+        "pool_difficulty",
+        "power",
+        "reject_ratio",
+        "share_rate",
+        "shares_accepted",
+        "shares_rejected",
+        "ssid",
+        "stale_seconds",
+        "stratum_port",
+        "stratum_url",
+        "temperature",
+        "total_best_diff",
+        "total_found_blocks",
+        "uptime",
+        "vr_temperature",
+        "wifi_rssi",
+    )
+
+    def __init__(
+        self,
+        ip: str,
+        available: bool = False,
+        error: str | None = None,
+    ) -> None:
+        """Initialize an empty snapshot."""
+        self.ip = ip
+        self.available = available
+        self.error = error
+        self.stale_seconds: float | None = None
+        self.firmware: str | None = None
+        self.mac: str | None = None
+        self.hostname: str | None = None
+        self.device_model = "Unknown"
+        self.asic_count = 0
+        self.hashrate = 0.0
+        self.shares_accepted = 0
+        self.shares_rejected = 0
+        self.best_diff: Any = 0
+        self.total_best_diff: Any = 0
+        self.pool_difficulty = 0.0
+        self.found_blocks = 0
+        self.total_found_blocks = 0
+        self.temperature = 0.0
+        self.vr_temperature = 0.0
+        self.power = 0.0
+        self.core_voltage = 0.0
+        self.core_voltage_actual = 0.0
+        self.fan_speed = 0.0
+        self.fan_rpm = 0
+        self.autofanspeed = 0
+        self.uptime = 0
+        self.frequency = 0.0
+        self.wifi_rssi = 0
+        self.ssid = "Unknown"
+        self.stratum_url = "Unknown"
+        self.stratum_port = 0
+        self.pool_connected = False
+        # Milliseconds the poll that produced this snapshot took
+        self.latency: float | None = None
+        # Filled in by the coordinator from the miner's rolling window
+        self.hashrate_1m: float | None = None
+        self.hashrate_10m: float | None = None
+        self.hashrate_1h: float | None = None
+        self.share_rate: float | None = None
+        self.reject_ratio: float | None = None
+        # Filled in by the coordinator's anomaly detector, 0-100
+        self.health_score: int | None = None
+
+    @classmethod
+    def unavailable(cls, ip: str, error: str | None = None) -> MinerSnapshot:
+        """Return a snapshot for a miner that could not be polled."""
+        return cls(ip, available=False, error=error)
+
+    @classmethod
+    def from_api(
+        cls,
+        ip: str,
+        info: dict[str, Any],
+    ) -> MinerSnapshot:
+        """Parse /api/system/info into a snapshot."""
+        snapshot = cls(ip, available=True)
+
+        stratum = info.get("stratum")
+        if not isinstance(stratum, dict):
+            stratum = {}
+        pools = stratum.get("pools")
+        first_pool = pools[0] if isinstance(pools, list) and pools else {}
+        if not isinstance(first_pool, dict):
+            first_pool = {}
+
+        snapshot.firmware = info.get("version")
+        snapshot.mac = info.get("macAddr")
+        snapshot.hostname = info.get("hostname")
+        snapshot.device_model = _as_str(info.get("deviceModel"))
+        snapshot.asic_count = _as_int(info.get("asicCount"))
+        snapshot.hashrate = _as_float(info.get("hashRate"))
+        snapshot.shares_accepted = _as_int(info.get("sharesAccepted"))
+        snapshot.shares_rejected = _as_int(info.get("sharesRejected"))
+        # Difficulties are strings like "4.29G" on some firmware, keep as-is
+        snapshot.best_diff = info.get("bestDiff", 0)
+        snapshot.total_best_diff = stratum.get(
+            "totalBestDiff", info.get("totalBestDiff", 0)
+        )
+        snapshot.pool_difficulty = _as_float(info.get("poolDifficulty"))
+        snapshot.found_blocks = _as_int(info.get("foundBlocks"))
+        snapshot.total_found_blocks = _as_int(info.get("totalFoundBlocks"))
+        snapshot.temperature = _as_float(info.get("temp"))
+        snapshot.vr_temperature = _as_float(info.get("vrTemp"))
+        snapshot.power = _as_float(info.get("power"))
+        snapshot.core_voltage = _as_float(info.get("coreVoltage"))
+        snapshot.core_voltage_actual = _as_float(info.get("coreVoltageActual"))
+        snapshot.fan_speed = _as_float(info.get("fanspeed"))
+        snapshot.fan_rpm = _as_int(info.get("fanrpm"))
+        snapshot.autofanspeed = _as_int(info.get("autofanspeed"))
+        snapshot.uptime = _as_int(info.get("uptimeSeconds"))
+        snapshot.frequency = _as_float(info.get("frequency"))
+        snapshot.wifi_rssi = _as_int(info.get("wifiRSSI"))
+        snapshot.ssid = _as_str(info.get("ssid"))
+        snapshot.stratum_url = _as_str(info.get("stratumURL"))
+        snapshot.stratum_port = _as_int(info.get("stratumPort"))
+        snapshot.pool_connected = bool(first_pool.get("connected", False))
+
+        return snapshot
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as a JSON-serializable dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MinerSnapshot:
+        """Rebuild a snapshot saved with as_dict."""
+        snapshot = cls(data["ip"])
+        for name in cls.__slots__:
+            if name in data:
+                setattr(snapshot, name, data[name])
+        return snapshot
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        if not self.available:
+            return f"MinerSnapshot({self.ip}, unavailable: {self.error})"
+        return (
+            f"MinerSnapshot({self.ip}, {self.device_model}, "
+            f"hashrate={self.hashrate}, temp={self.temperature}, "
+            f"power={self.power}, uptime={self.uptime})"
+        )
+
+
+class FleetStats:
+    """Running totals across the fleet.
+
+    Updated from the difference between a miner's previous and new
+    snapshot, so each poll result costs O(1) instead of a pass over the
+    whole fleet. Only the maximum temperatures need a rescan, and only
+    when the hottest miner cools down.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty fleet."""
+        self.hashrate = 0.0
+        self.power = 0.0
+        self.online = 0
+        self.offline = 0
+        self.max_temperature: float | None = None
+        self.max_vr_temperature: float | None = None
+        # (available, hashrate, power) each miner currently contributes
+        self._contributions: dict[str, tuple[bool, float, float]] = {}
+        self._temperatures: dict[str, float] = {}
+        self._vr_temperatures: dict[str, float] = {}
+
+    def update(self, ip: str, snapshot: MinerSnapshot) -> None:
+        """Replace a miner's contribution with its new snapshot."""
+        self._subtract(ip)
+
+        if snapshot.available:
+            self.online += 1
+            self.hashrate += snapshot.hashrate
+            self.power += snapshot.power
+            self._contributions[ip] = (True, snapshot.hashrate, snapshot.power)
+            self.max_temperature = self._set_max(
+                self._temperatures, ip, snapshot.temperature, self.max_temperature
+            )
+            self.max_vr_temperature = self._set_max(
+                self._vr_temperatures,
+                ip,
+                snapshot.vr_temperature,
+                self.max_vr_temperature,
+            )
+        else:
+            self.offline += 1
+            self._contributions[ip] = (False, 0.0, 0.0)
+
+    def remove(self, ip: str) -> None:
+        """Drop a miner that left the fleet."""
+        self._subtract(ip)
+
+    def _subtract(self, ip: str) -> None:
+        """Take a miner's current contribution out of the totals."""
+        previous = self._contributions.pop(ip, None)
+        if previous is None:
+            return
+
+        available, hashrate, power = previous
+        if not available:
+            self.offline -= 1
+            return
+
+        self.online -= 1
+        if self.online == 0:
+            # Clear rounding error left by the running sums
+            self.hashrate = 0.0
+            self.power = 0.0
+        else:
+            self.hashrate -= hashrate
+            self.power -= power
+        self.max_temperature = self._drop_max(
+            self._temperatures, ip, self.max_temperature
+        )
+        self.max_vr_temperature = self._drop_max(
+            self._vr_temperatures, ip, self.max_vr_temperature
+        )
+
+    @staticmethod
+    def _set_max(
+        values: dict[str, float],
+        ip: str,
+        value: float,
+        current: float | None,
+    ) -> float:
+        """Record a miner's value and return the new maximum."""
+        values[ip] = value
+        if current is None or value >= current:
+            return value
+        return current
+
+    @staticmethod
+    def _drop_max(
+        values: dict[str, float],
+        ip: str,
+        current: float | None,
+    ) -> float | None:
+        """Forget a miner's value and return the new maximum."""
+        value = values.pop(ip, None)
+        if value is None or current is None or value < current:
+            return current
+        # The hottest miner changed, rescan
+        return max(values.values(), default=None)
@@ -0,0 +1,224 @@
+"""Push updates from the AxeOS websocket log stream."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import random
+import re
+
+import aiohttp
+
+from .const import (
+    PUSH_ENDPOINT,
+    PUSH_HEARTBEAT,
+    PUSH_MAX_LINE,
+    PUSH_RECONNECT_BASE,
+    PUSH_RECONNECT_MAX,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Event kinds
+EVENT_SHARE_ACCEPTED = "share_accepted"
+EVENT_SHARE_REJECTED = "share_rejected"
+EVENT_TEMPERATURE = "temperature"
+EVENT_VR_TEMPERATURE = "vr_temperature"
+EVENT_BLOCK = "block"
+
+# ANSI color codes ESP-IDF wraps log lines in
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+
+# Start of an ESP-IDF log line: optional color, level and uptime in ms
+_LINE_START = re.compile(r"(?:\x1b\[[0-9;]*m)?[EWIDV] \(\d+\)")
+
+# A whole log line: level, uptime, component tag and message
+_LINE = re.compile(r"[EWIDV] \(\d+\) (?P<tag>[\w.-]+): (?P<message>.*)")
+
+_NUMBER = r"-?\d+(?:\.\d+)?"
+
+# Telemetry messages of the ESP-Miner firmware, by the tag of the component
+# logging them. Each pattern is matched at the start of the message. Named
+# groups are valued events of that kind; a pattern without groups is one
+# event of its listed kind.
+_SHARE_PATTERNS = (
+    (EVENT_SHARE_ACCEPTED, re.compile(r"message result accepted\b")),
+    (EVENT_SHARE_REJECTED, re.compile(r"message result rejected\b")),
+)
+_BLOCK_PATTERNS = ((EVENT_BLOCK, re.compile(r"FOUND BLOCK\b")),)
+_PATTERNS: dict[str, tuple[tuple[str | None, re.Pattern[str]], ...]] = {
+    "stratum_task": _SHARE_PATTERNS,
+    "system": _BLOCK_PATTERNS,
+    # Tag of the system module in older firmware
+    "SystemModule": _BLOCK_PATTERNS,
+    "power_management": (
+        # Fan PID loop: "Temp: 58.2 °C, SetPoint: 60.0 °C, Output: ..."
+        (None, re.compile(rf"Temp: (?P<{EVENT_TEMPERATURE}>{_NUMBER}) ?°?C\b")),
+        (
+            None,
+            re.compile(
+                rf"OVERHEAT! VR: (?P<{EVENT_VR_TEMPERATURE}>{_NUMBER}) ?C "
+                rf"ASIC (?P<{EVENT_TEMPERATURE}>{_NUMBER}) ?C\b"
+            ),
+        ),
+    ),
+}
+
+
+@dataclass
+class LogEvent:
+    """Telemetry parsed from one log line."""
+
+    kind: str
+    value: float | None = None
+
+
+def parse_log_line(line: str) -> list[LogEvent]:
+    """Return the telemetry in a log line."""
+    line = _LINE.match(_ANSI.sub("", line).strip())
+    if line is None:
+        return []
+
+    events = []
+    for kind, pattern in _PATTERNS.get(line["tag"], ()):
+        match = pattern.match(line["message"])
+        if match is None:
+            continue
+        if kind is not None:
+            events.append(LogEvent(kind))
+        events.extend(
+            LogEvent(name, float(value))
+            for name, value in match.groupdict().items()
+            if value is not None
+        )
+    return events
+
+
+class LogStreamParser:
+    """Splits websocket frames into log lines and parses them.
+
+    Frames need not end on a line boundary, so the tail of each frame is
+    kept until the rest of its line arrives, or until a frame starting a
+    new log line shows it was complete. Lines longer than PUSH_MAX_LINE
+    are dropped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with an empty buffer."""
+        self._partial = ""
+        self.lines = 0
+
+    def feed(self, text: str) -> list[LogEvent]:
+        """Parse the complete lines in a frame."""
+        if self._partial and _LINE_START.match(text):
+            text = "\n" + text
+        *lines, self._partial = (self._partial + text).split("\n")
+        if len(self._partial) > PUSH_MAX_LINE:
+            self._partial = ""
+
+        events = []
+        for line in lines:
+            if line.strip():
+                self.lines += 1
+                events.extend(parse_log_line(line))
+        return events
+
+
+class MinerStream:
+    """Websocket log stream of one miner.
+
+    Reconnects with exponential backoff while running. Miners whose
+    firmware has no websocket are retried at the longest backoff, in
+    case it is updated.
+    """
+
+    def __init__(
+        self,
+        ip: str,
+        session: aiohttp.ClientSession,
+        on_event: Callable[[str, LogEvent], None],
+    ) -> None:
+        """Initialize the stream; call start to connect."""
+        self.ip = ip
+        self._session = session
+        self._on_event = on_event
+        self._task: asyncio.Task | None = None
+        self._failures = 0
+        self.connected = False
+        self.connects = 0
+        self.events = 0
+        self.parser = LogStreamParser()
+
+    def start(self) -> None:
+        """Start streaming in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop streaming and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.connected = False
+
+    async def async_stop(self) -> None:
+        """Stop streaming and wait for the connection to close."""
+        task = self._task
+        self.stop()
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+
+    def as_dict(self) -> dict[str, int | bool]:
+        """Return the stream's state for diagnostics."""
+        return {
+            "connected": self.connected,
+            "connects": self.connects,
+            "lines": self.parser.lines,
+            "events": self.events,
+        }
+
+    async def _run(self) -> None:
+        """Stream until stopped, reconnecting after failures."""
+        url = f"ws://{self.ip}{PUSH_ENDPOINT}"
+        while True:
+            try:
+                await self._stream(url)
+            except aiohttp.WSServerHandshakeError as err:
+                _LOGGER.debug("Miner %s has no log stream (%s)", self.ip, err.status)
+                self._failures = max(self._failures, 16)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.debug(
+                    "Log stream of %s failed: %s", self.ip, type(err).__name__
+                )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected error in log stream of %s", self.ip)
+            finally:
+                self.connected = False
+
+            self._failures += 1
+            delay = min(
+                PUSH_RECONNECT_MAX,
+                PUSH_RECONNECT_BASE * 2 ** min(self._failures - 1, 16),
+            )
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+
+    async def _stream(self, url: str) -> None:
+        """Read one connection until it closes."""
+        async with self._session.ws_connect(
+            url, heartbeat=PUSH_HEARTBEAT
+        ) as websocket:
+            self.connected = True
+            self.connects += 1
+            self._failures = 0
+            _LOGGER.debug("Streaming logs from %s", self.ip)
+            async for message in websocket:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    text = message.data
+                elif message.type == aiohttp.WSMsgType.BINARY:
+                    text = message.data.decode("utf-8", "replace")
+                else:
+                    break
+                for event in self.parser.feed(text):
+                    self.events += 1
+                    self._on_event(self.ip, event)
@@ -15,15 +15,18 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     UnitOfTemperature,
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import BitaxeCoordinator
+from .const import DOMAIN, TIER_FAST, TIER_STATIC
+from .coordinator import BitaxeCoordinator, unique_id_prefix
+from .models import FleetStats, MinerSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +35,7 @@ _LOGGER = logging.getLogger(__name__)
 class BitaxeSensorEntityDescriptionMixin:
     """Mixin for required keys."""
 
-    value_fn: Callable[[dict[str, Any]], Any]
+    value_fn: Callable[[MinerSnapshot], Any]
 
 
 @dataclass
@@ -41,40 +44,62 @@ class BitaxeSensorEntityDescription(
 ):
     """Describes Bitaxe sensor entity."""
 
-    attr_fn: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+    attr_fn: Callable[[MinerSnapshot], dict[str, Any]] | None = None
+    tier: str = TIER_FAST
+    # Relative change below which a new numeric value is not written
+    deadband: float = 0
 
 
-def _calculate_efficiency(data: dict[str, Any]) -> float:
-    """Calculate J/GH from power and hashrate."""
-    try:
-        power = data.get("power", 0)
-        hashrate = data.get("hashRate", 0)
-        
-        if hashrate > 0:
-            # Efficiency = Power (W) / Hashrate (GH/s)
-            # hashRate is in H/s, need to convert to GH/s
-            hashrate_gh = hashrate / 1_000_000_000
-            efficiency = power / hashrate_gh
-            return round(efficiency, 2)
-    except (ValueError, ZeroDivisionError):
-        pass
+@dataclass
+class BitaxeFleetSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor of fleet-wide totals."""
+
+    value_fn: Callable[[BitaxeCoordinator], Any] = lambda coordinator: None
+
+
+def _calculate_efficiency(
+    data: MinerSnapshot | FleetStats, hashrate_unit: int = 1_000_000_000
+) -> float:
+    """Calculate J/GH (or J per hashrate_unit) from power and hashrate."""
+    if data.hashrate > 0:
+        # Efficiency = Power (W) / Hashrate (GH/s, or TH/s for the fleet)
+        # hashRate is in H/s, need to convert
+        hashrate_scaled = data.hashrate / hashrate_unit
+        efficiency = data.power / hashrate_scaled
+        return round(efficiency, 2)
     return 0
 
 
-# Sensor descriptions (25 sensors)
+def _freshness(data: MinerSnapshot) -> dict[str, Any]:
+    """Return how old a miner's data is, if it missed its last poll."""
+    if data.stale_seconds is None:
+        return {}
+    return {"stale_seconds": data.stale_seconds}
+
+
+def _percent(fraction: float | None) -> float | None:
+    """Return a fraction as a percentage."""
+    if fraction is None:
+        return None
+    return round(fraction * 100, 2)
+
+
+# Sensor descriptions
 SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
     # Device Info
     BitaxeSensorEntityDescription(
         key="device_model",
         name="Device Model",
         icon="mdi:information",
-        value_fn=lambda data: data.get("deviceModel", "Unknown"),
+        tier=TIER_STATIC,
+        value_fn=lambda data: data.device_model,
     ),
     BitaxeSensorEntityDescription(
         key="connected",
         name="Connected",
         icon="mdi:lan-connect",
-        value_fn=lambda data: "Yes" if data.get("stratum", {}).get("pools", [{}])[0].get("connected", False) else "No",
+        value_fn=lambda data: "Yes" if data.pool_connected else "No",
+        attr_fn=_freshness,
     ),
     
     # Mining Stats
@@ -84,42 +109,87 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         native_unit_of_measurement="H/s",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:chip",
-        value_fn=lambda data: data.get("hashRate", 0),
+        deadband=0.005,
+        value_fn=lambda data: data.hashrate,
+        attr_fn=_freshness,
+    ),
+    BitaxeSensorEntityDescription(
+        key="hashrate_1m",
+        name="Hashrate (1m Average)",
+        native_unit_of_measurement="H/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chip",
+        deadband=0.005,
+        value_fn=lambda data: data.hashrate_1m,
+    ),
+    BitaxeSensorEntityDescription(
+        key="hashrate_10m",
+        name="Hashrate (10m Average)",
+        native_unit_of_measurement="H/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chip",
+        deadband=0.005,
+        value_fn=lambda data: data.hashrate_10m,
+    ),
+    BitaxeSensorEntityDescription(
+        key="hashrate_1h",
+        name="Hashrate (1h Average)",
+        native_unit_of_measurement="H/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chip",
+        deadband=0.005,
+        value_fn=lambda data: data.hashrate_1h,
     ),
     BitaxeSensorEntityDescription(
         key="shares_accepted",
         name="Shares Accepted",
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:check-circle",
-        value_fn=lambda data: data.get("sharesAccepted", 0),
+        value_fn=lambda data: data.shares_accepted,
     ),
     BitaxeSensorEntityDescription(
         key="shares_rejected",
         name="Shares Rejected",
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:close-circle",
-        value_fn=lambda data: data.get("sharesRejected", 0),
+        value_fn=lambda data: data.shares_rejected,
+    ),
+    BitaxeSensorEntityDescription(
+        key="share_rate",
+        name="Share Rate (1h)",
+        native_unit_of_measurement="shares/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:check-circle-outline",
+        value_fn=lambda data: data.share_rate,
+    ),
+    BitaxeSensorEntityDescription(
+        key="reject_ratio",
+        name="Reject Ratio (1h)",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:close-circle-outline",
+        value_fn=lambda data: data.reject_ratio,
     ),
     BitaxeSensorEntityDescription(
         key="best_diff",
         name="Best Share Difficulty",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:star",
-        value_fn=lambda data: data.get("bestDiff", 0),
+        value_fn=lambda data: data.best_diff,
     ),
     BitaxeSensorEntityDescription(
         key="total_best_diff",
         name="Total Best Difficulty",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:star-circle",
-        value_fn=lambda data: data.get("stratum", {}).get("totalBestDiff", 0),
+        value_fn=lambda data: data.total_best_diff,
     ),
     BitaxeSensorEntityDescription(
         key="pool_difficulty",
         name="Pool Difficulty",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:target",
-        value_fn=lambda data: data.get("poolDifficulty", 0),
+        value_fn=lambda data: data.pool_difficulty,
     ),
     
     # Block Detection
@@ -128,14 +198,14 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         name="Blocks Found (This Pool)",
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:diamond",
-        value_fn=lambda data: data.get("foundBlocks", 0),
+        value_fn=lambda data: data.found_blocks,
     ),
     BitaxeSensorEntityDescription(
         key="total_blocks_found",
         name="Total Blocks Found (All Time)",
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:diamond-multiple",
-        value_fn=lambda data: data.get("totalFoundBlocks", 0),
+        value_fn=lambda data: data.total_found_blocks,
     ),
     
     # Temperature
@@ -145,7 +215,9 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temp", 0),
+        deadband=0.005,
+        value_fn=lambda data: data.temperature,
+        attr_fn=_freshness,
     ),
     BitaxeSensorEntityDescription(
         key="vr_temperature",
@@ -153,7 +225,8 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("vrTemp", 0),
+        deadband=0.005,
+        value_fn=lambda data: data.vr_temperature,
     ),
     
     # Power
@@ -163,7 +236,9 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         native_unit_of_measurement="W",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("power", 0),
+        deadband=0.005,
+        value_fn=lambda data: data.power,
+        attr_fn=_freshness,
     ),
     
     # Voltage
@@ -173,7 +248,8 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         native_unit_of_measurement="mV",
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("coreVoltage", 0),
+        tier=TIER_STATIC,
+        value_fn=lambda data: data.core_voltage,
     ),
     BitaxeSensorEntityDescription(
         key="core_voltage_actual",
@@ -181,7 +257,7 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         native_unit_of_measurement="mV",
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("coreVoltageActual", 0),
+        value_fn=lambda data: data.core_voltage_actual,
     ),
     
     # Cooling
@@ -191,21 +267,22 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:fan",
-        value_fn=lambda data: data.get("fanspeed", 0),
+        value_fn=lambda data: data.fan_speed,
     ),
     BitaxeSensorEntityDescription(
         key="fan_rpm",
         name="Fan RPM",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:fan",
-        value_fn=lambda data: data.get("fanrpm", 0),
+        value_fn=lambda data: data.fan_rpm,
     ),
     BitaxeSensorEntityDescription(
         key="autofanspeed",
         name="Auto Fan Speed Mode",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:fan-auto",
-        value_fn=lambda data: data.get("autofanspeed", 0),
+        tier=TIER_STATIC,
+        value_fn=lambda data: data.autofanspeed,
     ),
     
     # System
@@ -215,7 +292,7 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.SECONDS,
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:clock-outline",
-        value_fn=lambda data: data.get("uptimeSeconds", 0),
+        value_fn=lambda data: data.uptime,
     ),
     BitaxeSensorEntityDescription(
         key="frequency",
@@ -223,14 +300,16 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         native_unit_of_measurement="MHz",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:speedometer",
-        value_fn=lambda data: data.get("frequency", 0),
+        tier=TIER_STATIC,
+        value_fn=lambda data: data.frequency,
     ),
     BitaxeSensorEntityDescription(
         key="asic_count",
         name="ASIC Count",
         icon="mdi:chip",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("asicCount", 0),
+        tier=TIER_STATIC,
+        value_fn=lambda data: data.asic_count,
     ),
     
     # Efficiency
@@ -243,6 +322,28 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         value_fn=lambda data: _calculate_efficiency(data),
     ),
     
+    # Health
+    BitaxeSensorEntityDescription(
+        key="health_score",
+        name="Health Score",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:heart-pulse",
+        value_fn=lambda data: data.health_score,
+    ),
+    
+    # Diagnostics, disabled by default
+    BitaxeSensorEntityDescription(
+        key="poll_latency",
+        name="Poll Latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda data: data.latency,
+    ),
+    
     # Network & Pool
     BitaxeSensorEntityDescription(
         key="wifi_rssi",
@@ -251,25 +352,142 @@ SENSOR_TYPES: tuple[BitaxeSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:wifi",
-        value_fn=lambda data: data.get("wifiRSSI", 0),
+        value_fn=lambda data: data.wifi_rssi,
     ),
     BitaxeSensorEntityDescription(
         key="ssid",
         name="WiFi SSID",
         icon="mdi:wifi",
-        value_fn=lambda data: data.get("ssid", "Unknown"),
+        tier=TIER_STATIC,
+        value_fn=lambda data: data.ssid,
     ),
     BitaxeSensorEntityDescription(
         key="stratum_url",
         name="Stratum URL",
         icon="mdi:server",
-        value_fn=lambda data: data.get("stratumURL", "Unknown"),
+        tier=TIER_STATIC,
+        value_fn=lambda data: data.stratum_url,
     ),
     BitaxeSensorEntityDescription(
         key="stratum_port",
         name="Stratum Port",
         icon="mdi:server-network",
-        value_fn=lambda data: data.get("stratumPort", 0),
+        tier=TIER_STATIC,
+        value_fn=lambda data: data.stratum_port,
+    ),
+)
+
+# Fleet-wide totals, shown on one "Bitaxe Fleet" device per entry
+FLEET_SENSOR_TYPES: tuple[BitaxeFleetSensorEntityDescription, ...] = (
+    BitaxeFleetSensorEntityDescription(
+        key="total_hashrate",
+        name="Total Hashrate",
+        native_unit_of_measurement="H/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chip",
+        value_fn=lambda coordinator: round(coordinator.fleet.hashrate, 2),
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="total_power",
+        name="Total Power Consumption",
+        native_unit_of_measurement="W",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: round(coordinator.fleet.power, 2),
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="efficiency",
+        name="Efficiency",
+        native_unit_of_measurement="J/TH",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:leaf",
+        value_fn=lambda coordinator: _calculate_efficiency(
+            coordinator.fleet, 1_000_000_000_000
+        ),
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="miners_online",
+        name="Miners Online",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:server",
+        value_fn=lambda coordinator: coordinator.fleet.online,
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="miners_offline",
+        name="Miners Offline",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:server-off",
+        value_fn=lambda coordinator: coordinator.fleet.offline,
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="max_temperature",
+        name="Max Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.fleet.max_temperature,
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="max_vr_temperature",
+        name="Max Voltage Regulator Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.fleet.max_vr_temperature,
+    ),
+    
+    # Polling and discovery performance, disabled by default
+    BitaxeFleetSensorEntityDescription(
+        key="poll_cycle_time",
+        name="Poll Cycle Time",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.poll_stats.last_cycle_ms,
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="poll_timeouts",
+        name="Poll Timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:timer-alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.poll_stats.timeouts,
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="poll_errors",
+        name="Poll Errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:alert-circle-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.poll_stats.errors,
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="discovery_duration",
+        name="Discovery Sweep Duration",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.discovery_stats.get(
+            "sweep", {}
+        ).get("duration"),
+    ),
+    BitaxeFleetSensorEntityDescription(
+        key="discovery_hit_rate",
+        name="Discovery Sweep Hit Rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:radar",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _percent(
+            coordinator.discovery_stats.get("sweep", {}).get("hit_rate")
+        ),
     ),
 )
 
@@ -282,26 +500,40 @@ async def async_setup_entry(
     """Set up Bitaxe sensor based on a config entry."""
     coordinator: BitaxeCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Track which miners we've created entities for
-    created_miners: set[str] = set()
+    # Entities created for each miner identity
+    created_miners: dict[str, list[BitaxeSensor]] = {}
 
     @callback
     def async_add_miner_sensors() -> None:
-        """Add sensors for miners."""
-        new_entities: list[BitaxeSensor] = []
+        """Add sensors for miners.
         
-        if not coordinator.data:
-            return
+        Miners are added once their MAC (or, failing that, a first
+        answer) is known, so a later IP change keeps the same entities.
+        Configured miners are added right away under their IP, and follow
+        their MAC once it is learned.
+        """
+        new_entities: list[BitaxeSensor] = []
         
         for miner_ip in coordinator.active_miners:
-            if miner_ip not in created_miners:
-                _LOGGER.info("Creating sensors for miner %s", miner_ip)
-                created_miners.add(miner_ip)
-                
-                for description in SENSOR_TYPES:
-                    new_entities.append(
-                        BitaxeSensor(coordinator, miner_ip, description)
-                    )
+            miner_id = coordinator.miner_id(miner_ip)
+            if miner_id is None or miner_id in created_miners:
+                continue
+            
+            if miner_ip in created_miners:
+                # The registry was re-keyed to the MAC when it was learned
+                entities = created_miners.pop(miner_ip)
+                created_miners[miner_id] = entities
+                for entity in entities:
+                    entity.set_miner_id(miner_id)
+                continue
+            
+            _LOGGER.info("Creating sensors for miner %s", miner_ip)
+            entities = [
+                BitaxeSensor(coordinator, miner_id, description)
+                for description in SENSOR_TYPES
+            ]
+            created_miners[miner_id] = entities
+            new_entities.extend(entities)
         
         if new_entities:
             async_add_entities(new_entities)
@@ -311,55 +543,148 @@ async def async_setup_entry(
     
     # Add any existing miners
     async_add_miner_sensors()
+    
+    async_add_entities(
+        BitaxeFleetSensor(coordinator, entry, description)
+        for description in FLEET_SENSOR_TYPES
+    )
 
 
 class BitaxeSensor(CoordinatorEntity[BitaxeCoordinator], SensorEntity):
-    """Representation of a Bitaxe sensor."""
+    """Representation of a Bitaxe sensor.
+    
+    Last-known values after a restart come from the coordinator, which
+    restores each miner's snapshot before the first poll.
+    """
 
     entity_description: BitaxeSensorEntityDescription
 
     def __init__(
         self,
         coordinator: BitaxeCoordinator,
-        miner_ip: str,
+        miner_id: str,
         description: BitaxeSensorEntityDescription,
     ) -> None:
-        """Initialize the sensor."""
+        """Initialize the sensor.
+        
+        miner_id is the miner's MAC, or its IP while no MAC is known.
+        """
         super().__init__(coordinator)
         self.entity_description = description
-        self._miner_ip = miner_ip
+        self.set_miner_id(miner_id)
+        miner_ip = coordinator.ip_for(miner_id)
+        
+        # Entity name
+        self._attr_name = f"Bitaxe {miner_ip} {description.name}"
         
-        # Entity ID - replace dots with underscores
-        safe_ip = miner_ip.replace(".", "_")
-        self._attr_unique_id = f"bitaxe_{safe_ip}_{description.key}"
+        # Last state written, see _handle_coordinator_update
+        self._static_generation: int | None = None
+        self._written: tuple[bool, Any, dict[str, Any] | None] | None = None
+
+    @callback
+    def set_miner_id(self, miner_id: str) -> None:
+        """Key the sensor by a miner identity, such as its learned MAC."""
+        self._miner_id = miner_id
+        miner_ip = self.coordinator.ip_for(miner_id)
+        
+        # Entity ID - keyed by MAC so it survives IP changes
+        self._attr_unique_id = (
+            f"{unique_id_prefix(miner_id)}_{self.entity_description.key}"
+        )
         
         # Device info
         self._attr_device_info = {
-            "identifiers": {(DOMAIN, miner_ip)},
+            "identifiers": {(DOMAIN, miner_id)},
             "name": f"Bitaxe {miner_ip}",
         }
+        if miner_id != miner_ip:
+            self._attr_device_info["connections"] = {
+                (CONNECTION_NETWORK_MAC, miner_id)
+            }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
         
-        # Entity name
-        self._attr_name = f"Bitaxe {miner_ip} {description.name}"
+        The state is only written when availability, attributes or the
+        value changed, with numeric values allowed to drift within the
+        description's deadband. Static tier sensors are not even evaluated
+        until the coordinator refreshes the miner's static tier.
+        """
+        available = self.available
+        last = self._written
+        
+        if self.entity_description.tier == TIER_STATIC:
+            generation = self.coordinator.static_generation.get(self._miner_ip, 0)
+            if (
+                last is not None
+                and generation == self._static_generation
+                and available == last[0]
+            ):
+                return
+            self._static_generation = generation
+        
+        value = self.native_value
+        attributes = self.extra_state_attributes
+        if (
+            last is not None
+            and available == last[0]
+            and attributes == last[2]
+            and self._within_deadband(last[1], value)
+        ):
+            return
+        
+        self._written = (available, value, attributes)
+        self.async_write_ha_state()
+
+    def _within_deadband(self, old: Any, new: Any) -> bool:
+        """Return True if new is close enough to old to skip a write."""
+        if old == new:
+            return True
+        
+        deadband = self.entity_description.deadband
+        if (
+            not deadband
+            or not isinstance(old, (int, float))
+            or not isinstance(new, (int, float))
+            or isinstance(old, bool)
+            or isinstance(new, bool)
+        ):
+            return False
+        
+        return abs(new - old) <= deadband * abs(old)
+
+    async def async_update(self) -> None:
+        """Update the entity on demand.
+        
+        Only used by the homeassistant.update_entity service. Polls this
+        entity's miner right away, even if its poll slot is not up. For
+        static tier sensors this also forces the miner's static tier to
+        refresh.
+        """
+        if not self.enabled:
+            return
+        
+        if self.entity_description.tier == TIER_STATIC:
+            self.coordinator.async_request_static_refresh(self._miner_ip)
+        await self.coordinator.async_refresh_miner(self._miner_ip)
+
+    @property
+    def _miner_ip(self) -> str:
+        """Return the miner's current IP."""
+        return self.coordinator.ip_for(self._miner_id)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if self._miner_ip not in self.coordinator.miners:
-            return False
-        
-        data = self.coordinator.miners[self._miner_ip]
-        return data.get("available", True)
+        data = self.coordinator.miners.get(self._miner_ip)
+        return data is not None and data.available
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self._miner_ip not in self.coordinator.miners:
-            return None
-        
-        data = self.coordinator.miners[self._miner_ip]
-        
-        if not data.get("available", True):
+        data = self.coordinator.miners.get(self._miner_ip)
+        if data is None or not data.available:
             return None
         
         return self.entity_description.value_fn(data)
@@ -374,4 +699,49 @@ class BitaxeSensor(CoordinatorEntity[BitaxeCoordinator], SensorEntity):
             return None
         
         data = self.coordinator.miners[self._miner_ip]
-        return self.entity_description.attr_fn(data)
\ No newline at end of file
+        return self.entity_description.attr_fn(data)
+
+
+class BitaxeFleetSensor(CoordinatorEntity[BitaxeCoordinator], SensorEntity):
+    """Sensor of a total across all miners of a config entry.
+    
+    Totals come from the coordinator's running FleetStats, so each update
+    reads a number instead of walking the fleet.
+    """
+
+    entity_description: BitaxeFleetSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BitaxeCoordinator,
+        entry: ConfigEntry,
+        description: BitaxeFleetSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        
+        self._attr_unique_id = f"bitaxe_fleet_{entry.entry_id}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, f"fleet_{entry.entry_id}")},
+            "name": "Bitaxe Fleet",
+        }
+        self._attr_name = f"Bitaxe Fleet {description.name}"
+        
+        # Last value written, so unchanged totals are not written again
+        self._written: Any = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the total changed."""
+        value = self.native_value
+        if value == self._written:
+            return
+        
+        self._written = value
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
@@ -0,0 +1,442 @@
+"""Rolling statistics for the Bitaxe integration."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+import math
+from typing import Any
+
+
+class RollingStats:
+    """One miner's recent samples in preallocated ring buffers.
+
+    Timestamps, hashrates and share counters live in parallel arrays of
+    doubles sized once, so memory per miner is fixed however long Home
+    Assistant runs. Each window keeps a running hashrate sum and the
+    number of its oldest sample; adding a sample adds it to every sum and
+    moves each window past the samples that aged out, which is O(1)
+    amortized.
+
+    Share counters are kept as running totals that carry on across
+    counter resets (a miner reboot), so a window's share counts are the
+    difference between its newest and oldest sample.
+    """
+
+    def __init__(self, capacity: int, windows: tuple[int, ...]) -> None:
+        """Initialize empty buffers for capacity samples.
+        
+        windows are the window lengths in seconds. The longest should fit
+        in capacity samples at the expected sample rate; if samples come
+        faster, the oldest are dropped and that window covers less time.
+        """
+        self._capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._hashrates = array("d", bytes(8 * capacity))
+        self._accepted = array("d", bytes(8 * capacity))
+        self._rejected = array("d", bytes(8 * capacity))
+        
+        # Samples added so far; sample n is stored at n % capacity
+        self._count = 0
+        
+        # Per window: number of its oldest sample and its hashrate sum
+        self._windows = {window: index for index, window in enumerate(windows)}
+        self._starts = [0] * len(windows)
+        self._sums = [0.0] * len(windows)
+        
+        # Raw counters of the previous sample and the running totals
+        self._last_accepted: int | None = None
+        self._last_rejected: int | None = None
+        self._accepted_total = 0.0
+        self._rejected_total = 0.0
+
+    def add(
+        self, now: float, hashrate: float, accepted: int, rejected: int
+    ) -> None:
+        """Add a sample taken at monotonic time now."""
+        self._accepted_total += _counter_delta(self._last_accepted, accepted)
+        self._rejected_total += _counter_delta(self._last_rejected, rejected)
+        self._last_accepted = accepted
+        self._last_rejected = rejected
+        
+        # A full buffer overwrites the oldest sample, so windows still
+        # holding it have to let go of it first
+        overwritten = self._count - self._capacity
+        slot = self._count % self._capacity
+        if overwritten >= 0:
+            for index, start in enumerate(self._starts):
+                if start <= overwritten:
+                    self._sums[index] -= self._hashrates[slot]
+                    self._starts[index] = overwritten + 1
+        
+        self._times[slot] = now
+        self._hashrates[slot] = hashrate
+        self._accepted[slot] = self._accepted_total
+        self._rejected[slot] = self._rejected_total
+        self._count += 1
+        
+        for window, index in self._windows.items():
+            total = self._sums[index] + hashrate
+            start = self._starts[index]
+            cutoff = now - window
+            while self._times[start % self._capacity] < cutoff:
+                total -= self._hashrates[start % self._capacity]
+                start += 1
+            if start == self._count - 1:
+                # Only the new sample is left; drop accumulated rounding
+                total = hashrate
+            self._starts[index] = start
+            self._sums[index] = total
+
+    def average(self, window: int) -> float | None:
+        """Return the mean hashrate over a window."""
+        if not self._count:
+            return None
+        index = self._windows[window]
+        return self._sums[index] / (self._count - self._starts[index])
+
+    def share_rate(self, window: int) -> float | None:
+        """Return accepted shares per minute over a window."""
+        oldest, newest = self._span(window)
+        elapsed = self._times[newest] - self._times[oldest]
+        if elapsed <= 0:
+            return None
+        return (self._accepted[newest] - self._accepted[oldest]) * 60 / elapsed
+
+    def reject_ratio(self, window: int) -> float | None:
+        """Return the share of submitted shares rejected over a window."""
+        oldest, newest = self._span(window)
+        accepted = self._accepted[newest] - self._accepted[oldest]
+        rejected = self._rejected[newest] - self._rejected[oldest]
+        if accepted + rejected <= 0:
+            return None
+        return rejected / (accepted + rejected)
+
+    def _span(self, window: int) -> tuple[int, int]:
+        """Return the buffer slots of a window's oldest and newest sample."""
+        if not self._count:
+            return 0, 0
+        start = self._starts[self._windows[window]]
+        return start % self._capacity, (self._count - 1) % self._capacity
+
+
+def _counter_delta(previous: int | None, current: int) -> int:
+    """Return how much a counter grew, treating a drop as a reset."""
+    if previous is None:
+        return 0
+    if current < previous:
+        return current
+    return current - previous
+
+
+# Metrics watched for anomalies: (compared as a fraction of the miner's own
+# baseline, direction that is worse, smallest spread used for z-scores)
+ANOMALY_METRICS: dict[str, tuple[bool, int, float]] = {
+    "hashrate": (True, -1, 0.02),
+    "efficiency": (True, 1, 0.02),
+    "temperature": (False, 1, 1.0),
+    "vr_temperature": (False, 1, 1.0),
+    "reject_ratio": (False, 1, 0.5),
+}
+
+
+class MetricBaseline:
+    """Fast and slow exponentially weighted averages of one metric.
+
+    The slow average is the miner's baseline; the fast average is its
+    current level with most of the poll-to-poll noise smoothed out. The
+    noise is tracked separately, as the slow average of each sample's
+    squared distance from the current level, so a drift away from the
+    baseline does not widen the spread it is measured against.
+    """
+
+    __slots__ = ("fast", "mean", "noise", "samples")
+
+    def __init__(self) -> None:
+        """Initialize an empty baseline."""
+        self.fast = 0.0
+        self.mean = 0.0
+        self.noise = 0.0
+        self.samples = 0
+
+    def add(self, value: float, fast_alpha: float, slow_alpha: float) -> None:
+        """Fold a sample into the averages."""
+        if not self.samples:
+            self.fast = self.mean = value
+        else:
+            residual = value - self.fast
+            self.noise += slow_alpha * (residual * residual - self.noise)
+            self.fast += fast_alpha * residual
+            self.mean += slow_alpha * (value - self.mean)
+        self.samples += 1
+
+    def deviation(self, relative: bool) -> float:
+        """Return how far the current level is from the baseline."""
+        if not relative:
+            return self.fast - self.mean
+        if not self.mean:
+            return 0.0
+        return (self.fast - self.mean) / abs(self.mean)
+
+    def spread(self, relative: bool) -> float:
+        """Return the noise's standard deviation, on the deviation's scale."""
+        spread = math.sqrt(self.noise)
+        if not relative:
+            return spread
+        return spread / abs(self.mean) if self.mean else 0.0
+
+
+class AnomalyDetector:
+    """Streaming anomaly scores for every miner of a fleet.
+
+    add folds each poll result into the miner's baselines in O(1).
+    evaluate then scores the fleet in one batched pass per poll: every
+    metric's deviation from its own baseline is compared with the same
+    deviation across the rest of the fleet, so a pool outage that drags
+    all miners down is not flagged while one miner drifting on its own
+    is. The rest of the fleet is the batch sums minus the miner itself,
+    which keeps an outlier from hiding in its own spread. Fleets too small
+    for a meaningful comparison fall back to each miner's own noise.
+    """
+
+    def __init__(
+        self,
+        fast_alpha: float,
+        slow_alpha: float,
+        warmup: int,
+        threshold: float,
+        min_fleet: int,
+    ) -> None:
+        """Initialize the detector."""
+        self._fast_alpha = fast_alpha
+        self._slow_alpha = slow_alpha
+        self._warmup = warmup
+        self._threshold = threshold
+        self._min_fleet = min_fleet
+        self._baselines: dict[str, dict[str, MetricBaseline]] = {}
+        
+        # Latest result per miner, and the metrics currently flagged
+        self.scores: dict[str, dict[str, float]] = {}
+        self.health: dict[str, int] = {}
+        self._flagged: dict[str, set[str]] = {}
+
+    def add(self, ip: str, values: dict[str, float | None]) -> None:
+        """Fold a miner's latest values into its baselines."""
+        baselines = self._baselines.setdefault(ip, {})
+        for metric, value in values.items():
+            if value is None:
+                continue
+            baseline = baselines.get(metric)
+            if baseline is None:
+                baseline = baselines[metric] = MetricBaseline()
+            baseline.add(value, self._fast_alpha, self._slow_alpha)
+
+    def remove(self, ip: str) -> None:
+        """Forget a miner."""
+        for state in (self._baselines, self.scores, self.health, self._flagged):
+            state.pop(ip, None)
+
+    def evaluate(self, ips: Iterable[str]) -> list[dict[str, Any]]:
+        """Score the given miners against the fleet.
+        
+        Returns the anomalies that started with this pass; a metric is
+        flagged again only after it has settled below half the threshold.
+        """
+        # Deviations of warmed-up baselines, plus fleet sums for each metric
+        deviations: dict[str, dict[str, tuple[float, MetricBaseline]]] = {}
+        sums = dict.fromkeys(ANOMALY_METRICS, 0.0)
+        squares = dict.fromkeys(ANOMALY_METRICS, 0.0)
+        counts = dict.fromkeys(ANOMALY_METRICS, 0)
+        for ip in ips:
+            miner: dict[str, tuple[float, MetricBaseline]] = {}
+            for metric, baseline in self._baselines.get(ip, {}).items():
+                if baseline.samples < self._warmup:
+                    continue
+                deviation = baseline.deviation(ANOMALY_METRICS[metric][0])
+                miner[metric] = (deviation, baseline)
+                sums[metric] += deviation
+                squares[metric] += deviation * deviation
+                counts[metric] += 1
+            deviations[ip] = miner
+        
+        started: list[dict[str, Any]] = []
+        for ip, miner in deviations.items():
+            scores: dict[str, float] = {}
+            health = 100.0
+            flagged = self._flagged.setdefault(ip, set())
+            for metric, (deviation, baseline) in miner.items():
+                relative, worse, min_spread = ANOMALY_METRICS[metric]
+                others = counts[metric] - 1
+                if fleet := others + 1 >= self._min_fleet:
+                    center = (sums[metric] - deviation) / others
+                    variance = (
+                        squares[metric] - deviation * deviation
+                    ) / others - center * center
+                    spread = math.sqrt(max(0.0, variance))
+                else:
+                    center, spread = 0.0, baseline.spread(relative)
+                z_score = (deviation - center) / max(spread, min_spread)
+                scores[metric] = round(z_score, 2)
+                
+                # Penalize only the bad direction, past a z-score of 1; health
+                # reaches zero at 2 * threshold + 1, above twice the threshold
+                badness = worse * z_score
+                health *= 1 - min(1.0, max(0.0, badness - 1) / (2 * self._threshold))
+                
+                if badness >= self._threshold and metric not in flagged:
+                    flagged.add(metric)
+                    started.append(
+                        {
+                            "miner_ip": ip,
+                            "metric": metric,
+                            "value": round(baseline.fast, 4),
+                            "baseline": round(baseline.mean, 4),
+                            "z_score": round(z_score, 2),
+                            "basis": "fleet" if fleet else "self",
+                        }
+                    )
+                elif badness < self._threshold / 2:
+                    flagged.discard(metric)
+            
+            self.scores[ip] = scores
+            if scores:
+                self.health[ip] = round(health)
+        
+        return started
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in milliseconds."""
+
+    __slots__ = ("_bounds", "count", "counts", "max", "total")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize with the buckets' upper bounds, in ascending order."""
+        self._bounds = bounds
+        # One more bucket for everything above the last bound
+        self.counts = array("L", bytes(array("L").itemsize * (len(bounds) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, milliseconds: float) -> None:
+        """Record one duration."""
+        self.counts[bisect_left(self._bounds, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        self.max = max(self.max, milliseconds)
+
+    def quantile(self, fraction: float) -> float | None:
+        """Return the upper bound of the bucket holding a quantile."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                break
+        return self._bounds[index] if index < len(self._bounds) else self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"<={bound:g}" for bound in self._bounds]
+        labels.append(f">{self._bounds[-1]:g}")
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 1) if self.count else None,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "max_ms": round(self.max, 1),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class MinerTimings:
+    """Request latencies and failures of one miner."""
+
+    __slots__ = ("connect", "decode", "errors", "first_byte", "timeouts")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize empty histograms."""
+        # Opening a new connection; pooled keep-alive requests skip it
+        self.connect = LatencyHistogram(bounds)
+        # Request sent (connection included) until response headers
+        self.first_byte = LatencyHistogram(bounds)
+        # Reading and decoding the body
+        self.decode = LatencyHistogram(bounds)
+        self.timeouts = 0
+        self.errors = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings for diagnostics."""
+        return {
+            "connect": self.connect.as_dict(),
+            "first_byte": self.first_byte.as_dict(),
+            "decode": self.decode.as_dict(),
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
+
+
+class PollStats:
+    """Latency and failure counts of polling, per miner and per cycle."""
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize empty stats."""
+        self._bounds = bounds
+        self.miners: dict[str, MinerTimings] = {}
+        self.cycles = LatencyHistogram(bounds)
+        self.last_cycle_ms: float | None = None
+        self.timeouts = 0
+        self.errors = 0
+
+    def _miner(self, ip: str) -> MinerTimings:
+        """Return a miner's timings, creating them on first use."""
+        timings = self.miners.get(ip)
+        if timings is None:
+            timings = self.miners[ip] = MinerTimings(self._bounds)
+        return timings
+
+    def record_request(
+        self,
+        ip: str,
+        connect: float | None,
+        first_byte: float,
+        decode: float,
+    ) -> None:
+        """Record the phases of a successful request, in seconds."""
+        timings = self._miner(ip)
+        if connect is not None:
+            timings.connect.add(connect * 1000)
+        timings.first_byte.add(first_byte * 1000)
+        timings.decode.add(decode * 1000)
+
+    def record_timeout(self, ip: str) -> None:
+        """Count a request that timed out."""
+        self._miner(ip).timeouts += 1
+        self.timeouts += 1
+
+    def record_error(self, ip: str) -> None:
+        """Count a request that failed otherwise."""
+        self._miner(ip).errors += 1
+        self.errors += 1
+
+    def record_cycle(self, seconds: float) -> None:
+        """Record the wall time of a poll cycle."""
+        self.last_cycle_ms = round(seconds * 1000, 1)
+        self.cycles.add(seconds * 1000)
+
+    def remove(self, ip: str) -> None:
+        """Forget a miner's timings."""
+        self.miners.pop(ip, None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats for diagnostics."""
+        return {
+            "cycle": self.cycles.as_dict(),
+            "last_cycle_ms": self.last_cycle_ms,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "miners": {ip: timings.as_dict() for ip, timings in self.miners.items()},
+        }
@@ -0,0 +1,201 @@
+"""Persistent storage for the Bitaxe integration."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CACHE_MAX_AGE,
+    CACHE_SAVE_DELAY,
+    CACHE_SEEN_RESOLUTION,
+    DOMAIN,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .models import MinerSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DiscoveryCache:
+    """Miners seen by discovery or polling, kept across restarts.
+
+    Each entry holds the IP's last-seen time (wall clock) and the MAC,
+    hostname and firmware it last reported. The cache also remembers
+    which slice of the subnet the rolling sweep covers next.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache for one config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.discovery"
+        )
+        self.miners: dict[str, dict[str, Any]] = {}
+        self.sweep_cursor = 0
+
+    async def async_load(self) -> None:
+        """Load the cache, dropping miners not seen for CACHE_MAX_AGE."""
+        data = await self._store.async_load() or {}
+        
+        cutoff = time.time() - CACHE_MAX_AGE
+        self.miners = {
+            ip: entry
+            for ip, entry in data.get("miners", {}).items()
+            if entry.get("last_seen", 0) >= cutoff
+        }
+        self.sweep_cursor = data.get("sweep_cursor", 0)
+        
+        _LOGGER.debug("Loaded %d cached miner(s)", len(self.miners))
+
+    @property
+    def ips(self) -> set[str]:
+        """Return the cached miner IPs."""
+        return set(self.miners)
+
+    @callback
+    def async_seen(
+        self,
+        ip: str,
+        mac: str | None = None,
+        hostname: str | None = None,
+        firmware: str | None = None,
+    ) -> None:
+        """Record that a miner answered.
+        
+        Only new miners, changed device details or a last-seen time older
+        than CACHE_SEEN_RESOLUTION schedule a write, so steady polling
+        does not touch the disk. A MAC seen at a new IP replaces the entry
+        of its old IP.
+        """
+        now = time.time()
+        entry = self.miners.get(ip)
+        details = {"mac": mac, "hostname": hostname, "firmware": firmware}
+        
+        if entry is not None:
+            details = {
+                key: value if value is not None else entry.get(key)
+                for key, value in details.items()
+            }
+            unchanged = all(entry.get(key) == value for key, value in details.items())
+            if unchanged and now - entry["last_seen"] < CACHE_SEEN_RESOLUTION:
+                return
+        
+        if mac is not None and (entry is None or entry.get("mac") != mac):
+            for old_ip in [
+                other
+                for other, other_entry in self.miners.items()
+                if other != ip and other_entry.get("mac") == mac
+            ]:
+                del self.miners[old_ip]
+        
+        self.miners[ip] = {"last_seen": now, **details}
+        self._async_schedule_save()
+
+    @callback
+    def async_remove(self, ip: str) -> None:
+        """Forget an address a miner moved away from."""
+        if self.miners.pop(ip, None) is not None:
+            self._async_schedule_save()
+
+    @callback
+    def async_set_sweep_cursor(self, cursor: int) -> None:
+        """Remember the next slice for the rolling sweep."""
+        self.sweep_cursor = cursor
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Write the cache after CACHE_SAVE_DELAY, batching changes."""
+        self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"miners": self.miners, "sweep_cursor": self.sweep_cursor}
+
+
+class SnapshotStore:
+    """Last good snapshot and block count of each miner, kept across restarts.
+
+    Lets setup show last-known values right away instead of waiting for
+    the first poll. Writes happen at most every SNAPSHOT_SAVE_DELAY
+    seconds and when Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for one config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshots"
+        )
+        self._snapshots: dict[str, tuple[float, MinerSnapshot]] = {}
+        self.block_counts: dict[str, int] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> dict[str, MinerSnapshot]:
+        """Load the stored snapshots, aged by the time since they were taken."""
+        data = await self._store.async_load() or {}
+        self.block_counts = data.get("block_counts", {})
+        
+        now = time.time()
+        snapshots: dict[str, MinerSnapshot] = {}
+        for ip, stored in data.get("miners", {}).items():
+            try:
+                snapshot = MinerSnapshot.from_dict(stored["snapshot"])
+            except (KeyError, TypeError) as err:
+                _LOGGER.debug("Ignoring stored snapshot of %s: %s", ip, err)
+                continue
+            snapshot.stale_seconds = round(now - stored["taken_at"], 1)
+            snapshots[ip] = snapshot
+            self._snapshots[ip] = (stored["taken_at"], snapshot)
+        
+        _LOGGER.debug("Restored %d miner snapshot(s)", len(snapshots))
+        return snapshots
+
+    @callback
+    def async_update(
+        self,
+        snapshot: MinerSnapshot,
+        block_counts: dict[str, int],
+    ) -> None:
+        """Record a miner's latest good snapshot and the fleet's block counts."""
+        self._snapshots[snapshot.ip] = (time.time(), snapshot)
+        self.block_counts = block_counts
+        self._async_schedule_save()
+
+    @callback
+    def async_remove(self, ip: str) -> None:
+        """Forget the snapshot of an address a miner moved away from."""
+        if self._snapshots.pop(ip, None) is not None:
+            self._async_schedule_save()
+
+    async def async_save(self) -> None:
+        """Write the snapshots now."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a write unless one is already pending.
+        
+        Store.async_delay_save pushes a pending write back on every call,
+        so steady polling would otherwise keep postponing it.
+        """
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._save_pending = False
+        return {
+            "miners": {
+                ip: {"taken_at": taken_at, "snapshot": snapshot.as_dict()}
+                for ip, (taken_at, snapshot) in self._snapshots.items()
+            },
+            "block_counts": self.block_counts,
+        }
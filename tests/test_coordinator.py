@@ -0,0 +1,187 @@
+"""Tests for polling and miner state in the coordinator."""
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from aiohttp import web
+from homeassistant.core import HomeAssistant
+
+from custom_components.bitaxe import coordinator as coordinator_module
+from custom_components.bitaxe.const import (
+    BREAKER_BACKOFF_MAX,
+    BREAKER_FAILURE_THRESHOLD,
+    DOMAIN,
+)
+from custom_components.bitaxe.coordinator import BitaxeCoordinator, MinerBreaker
+from custom_components.bitaxe.diagnostics import async_get_config_entry_diagnostics
+from custom_components.bitaxe.sensor import SENSOR_TYPES
+
+PAYLOADS = Path(__file__).parent.parent / "benchmarks" / "payloads"
+INFO = json.loads((PAYLOADS / "bitaxe_gamma_info.json").read_text())
+
+
+@asynccontextmanager
+async def miner_server(state: dict[str, Any]) -> AsyncIterator[str]:
+    """Serve /api/system/info on a local port, after state["delay"] seconds.
+
+    state["info"], if set, overrides fields of the payload.
+    """
+
+    async def info(request: web.Request) -> web.Response:
+        await asyncio.sleep(state["delay"])
+        return web.json_response({**INFO, **state.get("info", {})})
+
+    app = web.Application()
+    app.router.add_get("/api/system/info", info)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+def _coordinator(
+    hass: HomeAssistant, miners: list[str], poll_slots: int = 1
+) -> BitaxeCoordinator:
+    """Return a coordinator polling miners, waiting at most 0.2 s per cycle."""
+    return BitaxeCoordinator(
+        hass,
+        {
+            "miners": miners,
+            "scan_interval": 0,
+            "poll_deadline": 0.2,
+            "poll_slots": poll_slots,
+        },
+    )
+
+
+def test_stale_and_failed_miners_are_reported(tmp_path: Path) -> None:
+    """Late miners carry their data's age, failed ones the reason."""
+
+    async def run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        state = {"delay": 0.0}
+        async with miner_server(state) as late:
+            # Nothing listens on port 1, so connecting fails
+            down = "127.0.0.1:1"
+            coordinator = _coordinator(hass, [late, down])
+            hass.data[DOMAIN] = {"entry": coordinator}
+
+            await coordinator._async_update_data()
+            assert coordinator.miners[late].stale_seconds is None
+
+            state["delay"] = 1.0
+            await asyncio.sleep(0.05)
+            await coordinator._async_update_data()
+            snapshot = coordinator.miners[late]
+            assert snapshot.available
+            assert snapshot.stale_seconds is not None
+
+            hashrate = next(d for d in SENSOR_TYPES if d.key == "hashrate")
+            assert hashrate.attr_fn(snapshot) == {
+                "stale_seconds": snapshot.stale_seconds
+            }
+
+            entry = SimpleNamespace(entry_id="entry", data={}, options={})
+            diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+            assert diagnostics["miners"]["state"][down] == {
+                "available": False,
+                "error": "ClientConnectorError",
+                "stale_seconds": None,
+            }
+            assert diagnostics["miners"]["state"][late]["stale_seconds"] == (
+                snapshot.stale_seconds
+            )
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    asyncio.run(run())
+
+
+def test_refresh_miner_outside_its_slot(tmp_path: Path) -> None:
+    """A miner can be polled on demand while another slot is up."""
+
+    async def run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        other_mac = {"macAddr": "24:58:7C:D1:8E:41"}
+        async with miner_server({"delay": 0.0}) as first, miner_server(
+            {"delay": 0.0, "info": other_mac}
+        ) as second:
+            coordinator = _coordinator(hass, [first, second], poll_slots=2)
+            updates = []
+            coordinator.async_add_listener(lambda: updates.append(True))
+            await coordinator._async_update_data()
+            assert len(coordinator.miners) == 1
+            (polled,) = coordinator.miners
+            other = second if polled == first else first
+
+            await coordinator.async_refresh_miner(other)
+            assert coordinator.miners[other].available
+            assert updates
+
+            # Unknown miners are not polled
+            await coordinator.async_refresh_miner("127.0.0.1:1")
+            assert "127.0.0.1:1" not in coordinator.miners
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    asyncio.run(run())
+
+
+def test_breaker_opens_backs_off_and_closes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The breaker opens at the threshold and doubles its backoff."""
+    monkeypatch.setattr(coordinator_module.random, "uniform", lambda low, high: 1.0)
+    breaker = MinerBreaker()
+    now = 1000.0
+
+    # Closed below the threshold
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        assert breaker.record_failure(now, 30) is None
+        assert breaker.allow(now)
+
+    # Open, starting at twice the poll interval and doubling per failed probe
+    delays = []
+    for _ in range(6):
+        delay = breaker.record_failure(now, 30)
+        delays.append(delay)
+        assert breaker.retry_at == now + delay
+        assert not breaker.allow(now + delay - 1)
+        # Half-open once the backoff is over
+        now += delay
+        assert breaker.allow(now)
+    assert delays == [60, 120, 240, 480, BREAKER_BACKOFF_MAX, BREAKER_BACKOFF_MAX]
+
+    # A successful probe closes it
+    breaker.reacquiring = True
+    breaker.record_success()
+    assert breaker == MinerBreaker()
+    assert breaker.allow(now)
+    assert breaker.record_failure(now, 30) is None
+
+
+def test_session_is_not_recreated_after_shutdown(tmp_path: Path) -> None:
+    """Requests after shutdown fail instead of opening a new session."""
+
+    async def run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        coordinator = _coordinator(hass, ["127.0.0.1:1"])
+        session = coordinator.session
+        assert not session.closed
+        await coordinator.async_shutdown()
+        assert coordinator.session is session
+        assert session.closed
+        assert await coordinator._fetch_miner_data("127.0.0.1:1") is None
+        await hass.async_stop(force=True)
+
+    asyncio.run(run())
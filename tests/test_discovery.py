@@ -0,0 +1,235 @@
+"""Tests for discovery targets and the neighbor table that seeds it."""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+from pathlib import Path
+
+import pytest
+
+from custom_components.bitaxe import discovery
+from custom_components.bitaxe.const import STRATEGY_QUICK
+from custom_components.bitaxe.discovery import (
+    AimdLimiter,
+    BitaxeDiscovery,
+    async_read_neighbor_table,
+    parse_neighbor_table,
+    parse_scan_targets,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PROC_NET_ARP = FIXTURES / "proc_net_arp.txt"
+IP_NEIGH = FIXTURES / "ip_neigh.txt"
+
+NEIGHBORS = {
+    "192.168.1.1": "a0:63:91:2e:7b:10",
+    "192.168.1.42": "24:58:7c:d1:8e:40",
+    "192.168.1.43": "ec:da:3b:55:02:9c",
+    "192.168.1.80": "3c:22:fb:91:0a:6e",
+}
+
+
+async def _window(limiter: AimdLimiter, outcomes: list[bool | None]) -> None:
+    """Run one probe per outcome through the limiter."""
+    for clean in outcomes:
+        await limiter.acquire()
+        limiter.release(clean)
+
+
+def _ranges(*ranges: tuple[str, str]) -> list[tuple[int, int]]:
+    """Return (first, last) address pairs as parse_scan_targets gives them."""
+    return [
+        (int(ipaddress.IPv4Address(first)), int(ipaddress.IPv4Address(last)))
+        for first, last in ranges
+    ]
+
+
+class _Process:
+    """Finished `ip neigh` process."""
+
+    def __init__(self, stdout: bytes) -> None:
+        self._stdout = stdout
+
+    async def communicate(self) -> tuple[bytes, None]:
+        return self._stdout, None
+
+
+@pytest.mark.parametrize(
+    ("targets", "ranges"),
+    [
+        # Network and broadcast addresses are left out, except for /31 and /32
+        ("10.0.6.0/24", [("10.0.6.1", "10.0.6.254")]),
+        ("10.0.6.8/31", [("10.0.6.8", "10.0.6.9")]),
+        ("10.0.6.7", [("10.0.6.7", "10.0.6.7")]),
+        ("10.0.6.10-10.0.6.50", [("10.0.6.10", "10.0.6.50")]),
+        ("10.0.6.10-50", [("10.0.6.10", "10.0.6.50")]),
+        # A CIDR covering a range, a short range and a single address
+        (
+            "10.0.6.0/24, 10.0.6.20-10.0.6.30 10.0.6.40-45,10.0.6.9",
+            [("10.0.6.1", "10.0.6.254")],
+        ),
+        # Overlapping and adjacent entries merge, duplicates collapse
+        (
+            "10.0.6.10-20 10.0.6.15-10.0.6.30 10.0.6.31 10.0.6.31",
+            [("10.0.6.10", "10.0.6.31")],
+        ),
+        # Disjoint entries are sorted by address, whatever their order
+        (
+            "192.168.1.5 10.0.7.0/30 10.0.6.10-12",
+            [
+                ("10.0.6.10", "10.0.6.12"),
+                ("10.0.7.1", "10.0.7.2"),
+                ("192.168.1.5", "192.168.1.5"),
+            ],
+        ),
+    ],
+)
+def test_parse_scan_targets(targets: str, ranges: list[tuple[str, str]]) -> None:
+    """Entries are parsed into sorted, disjoint host ranges."""
+    assert parse_scan_targets(targets) == _ranges(*ranges)
+
+
+@pytest.mark.parametrize(
+    ("targets", "message"),
+    [
+        ("", "No subnet given"),
+        (" , ", "No subnet given"),
+        ("10.0.6.50-10", "Range 10.0.6.50-10 ends before it starts"),
+        ("10.0.6.50-10.0.6.49", "Range 10.0.6.50-10.0.6.49 ends before it starts"),
+        ("10.0.6.300", "Octet 300"),
+        ("10.0.6.0/33", "'33' is not a valid netmask"),
+        ("10.0.6.1-abc", "Only decimal digits"),
+        ("fe80::1", "Expected 4 octets"),
+    ],
+)
+def test_parse_scan_targets_invalid(targets: str, message: str) -> None:
+    """Invalid or missing entries raise ValueError saying what is wrong."""
+    with pytest.raises(ValueError, match=message):
+        parse_scan_targets(targets)
+
+
+def test_parse_proc_net_arp() -> None:
+    """Complete entries are read with lower-cased MACs."""
+    assert parse_neighbor_table(PROC_NET_ARP.read_text()) == {
+        **NEIGHBORS,
+        "10.0.6.5": "24:0a:c4:11:22:33",
+    }
+
+
+def test_parse_ip_neigh() -> None:
+    """Failed and incomplete entries are skipped, IPv6 ones kept."""
+    assert parse_neighbor_table(IP_NEIGH.read_text()) == {
+        **NEIGHBORS,
+        "fe80::a263:91ff:fe2e:7b10": "a0:63:91:2e:7b:10",
+    }
+
+
+def test_read_neighbor_table_file() -> None:
+    """The table is read from the given path."""
+    neighbors = asyncio.run(async_read_neighbor_table(str(PROC_NET_ARP)))
+    assert neighbors["192.168.1.42"] == "24:58:7c:d1:8e:40"
+
+
+def test_read_neighbor_table_falls_back_to_ip_neigh(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Without the file, the table comes from `ip neigh show`."""
+    calls = []
+
+    async def create_subprocess_exec(*args: str, **kwargs: object) -> _Process:
+        calls.append(args)
+        return _Process(IP_NEIGH.read_bytes())
+
+    monkeypatch.setattr(
+        discovery.asyncio, "create_subprocess_exec", create_subprocess_exec
+    )
+    neighbors = asyncio.run(async_read_neighbor_table(str(tmp_path / "arp")))
+    assert calls == [("ip", "neigh", "show")]
+    assert neighbors["192.168.1.43"] == "ec:da:3b:55:02:9c"
+
+
+def test_read_neighbor_table_unavailable(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Without the file or the ip command, the table is empty."""
+
+    async def create_subprocess_exec(*args: str, **kwargs: object) -> _Process:
+        raise FileNotFoundError("ip")
+
+    monkeypatch.setattr(
+        discovery.asyncio, "create_subprocess_exec", create_subprocess_exec
+    )
+    assert asyncio.run(async_read_neighbor_table(str(tmp_path / "arp"))) == {}
+
+
+def test_neighbor_seeds_espressif_first() -> None:
+    """Quick discovery tries in-range neighbors, Espressif MACs first."""
+    scanner = BitaxeDiscovery(
+        "192.168.1.0/24",
+        strategy=STRATEGY_QUICK,
+        neighbor_table=str(PROC_NET_ARP),
+    )
+    ranges = parse_scan_targets(scanner.subnet)
+    hosts = asyncio.run(scanner._hosts(ranges))
+    assert list(hosts) == [
+        "192.168.1.42",
+        "192.168.1.43",
+        "192.168.1.1",
+        "192.168.1.80",
+    ]
+
+
+def test_aimd_limiter_increase_and_halving() -> None:
+    """Clean windows add one up to the maximum, congested ones halve."""
+    limiter = AimdLimiter(10, maximum=12)
+
+    async def run() -> list[int]:
+        limits = []
+        for outcomes in (
+            # Windows span the current limit; one error in ten is not
+            # above the 10% threshold
+            [False] + [True] * 9,
+            [True] * 11,
+            [True] * 12,
+            # Two errors in twelve are
+            [False, False] + [True] * 10,
+            # Windows span at least 8 outcomes, however low the limit
+            [False] * 8,
+            [False] * 8,
+            [False] * 8,
+            [True] * 8,
+        ):
+            await _window(limiter, outcomes)
+            limits.append(limiter.limit)
+        return limits
+
+    assert asyncio.run(run()) == [11, 12, 12, 6, 3, 1, 1, 2]
+    timeline = [point["concurrency"] for point in limiter.timeline]
+    assert timeline == [10, 11, 12, 6, 3, 1, 2]
+    assert limiter.probes == 77
+
+
+def test_aimd_limiter_ignores_unjudged_outcomes() -> None:
+    """Outcomes that say nothing about congestion do not close a window."""
+    limiter = AimdLimiter(8)
+    asyncio.run(_window(limiter, [None] * 8))
+    asyncio.run(_window(limiter, [None] * 8))
+    assert limiter.limit == 8
+    asyncio.run(_window(limiter, [True] * 7 + [None]))
+    assert limiter.limit == 8
+
+
+def test_aimd_limiter_waits_for_a_slot() -> None:
+    """Probes beyond the limit wait until a slot is released."""
+
+    async def run() -> None:
+        limiter = AimdLimiter(1)
+        await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiting.done()
+        limiter.release(None)
+        await asyncio.wait_for(waiting, 1)
+        limiter.release(None)
+
+    asyncio.run(run())
@@ -0,0 +1,76 @@
+"""Tests for miner snapshots and fleet totals."""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from custom_components.bitaxe.models import FleetStats, MinerSnapshot
+
+PAYLOADS = Path(__file__).parent.parent / "benchmarks" / "payloads"
+INFO = json.loads((PAYLOADS / "bitaxe_gamma_info.json").read_text())
+
+
+def _snapshot(ip: str, rng: random.Random) -> MinerSnapshot:
+    """Return an online miner's snapshot with random readings."""
+    return MinerSnapshot.from_api(
+        ip,
+        {
+            **INFO,
+            "hashRate": rng.uniform(400, 1200),
+            "power": rng.uniform(10, 20),
+            "temp": rng.choice([55.0, 58.5, 62.0, 65.25]),
+            "vrTemp": rng.choice([48.0, 51.0, 60.0]),
+        },
+    )
+
+
+def test_fleet_stats_match_recompute() -> None:
+    """Totals agree with recomputing them from every miner's snapshot."""
+    rng = random.Random(1)
+    ips = [f"192.168.1.{host}" for host in range(10, 18)]
+    fleet = FleetStats()
+    snapshots: dict[str, MinerSnapshot] = {}
+    for _ in range(500):
+        ip = rng.choice(ips)
+        action = rng.random()
+        if action < 0.15:
+            fleet.remove(ip)
+            snapshots.pop(ip, None)
+        elif action < 0.35:
+            snapshots[ip] = MinerSnapshot.unavailable(ip)
+            fleet.update(ip, snapshots[ip])
+        else:
+            snapshots[ip] = _snapshot(ip, rng)
+            fleet.update(ip, snapshots[ip])
+
+        online = [s for s in snapshots.values() if s.available]
+        assert fleet.online == len(online)
+        assert fleet.offline == len(snapshots) - len(online)
+        assert fleet.hashrate == pytest.approx(sum(s.hashrate for s in online))
+        assert fleet.power == pytest.approx(sum(s.power for s in online))
+        assert fleet.max_temperature == max(
+            (s.temperature for s in online), default=None
+        )
+        assert fleet.max_vr_temperature == max(
+            (s.vr_temperature for s in online), default=None
+        )
+
+
+def test_fleet_stats_empty_after_removing_all() -> None:
+    """Removing every miner leaves exact zeros behind."""
+    rng = random.Random(2)
+    fleet = FleetStats()
+    for host in range(5):
+        fleet.update(f"10.0.6.{host}", _snapshot(f"10.0.6.{host}", rng))
+    fleet.update("10.0.6.9", MinerSnapshot.unavailable("10.0.6.9"))
+    for host in (*range(5), 9):
+        fleet.remove(f"10.0.6.{host}")
+    # Removing an unknown miner changes nothing
+    fleet.remove("10.0.6.99")
+    assert (fleet.online, fleet.offline) == (0, 0)
+    assert (fleet.hashrate, fleet.power) == (0.0, 0.0)
+    assert fleet.max_temperature is None
+    assert fleet.max_vr_temperature is None
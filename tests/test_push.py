@@ -0,0 +1,145 @@
+"""Tests for the AxeOS log stream parser."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.bitaxe import push
+from custom_components.bitaxe.push import (
+    EVENT_BLOCK,
+    EVENT_SHARE_ACCEPTED,
+    EVENT_SHARE_REJECTED,
+    EVENT_TEMPERATURE,
+    EVENT_VR_TEMPERATURE,
+    LogEvent,
+    LogStreamParser,
+    MinerStream,
+    parse_log_line,
+)
+
+# Lines as ESP-Miner streams them on /api/ws, color codes included
+TELEMETRY_LINES = [
+    (
+        "\x1b[0;32mI (1254833) stratum_task: message result accepted\x1b[0m",
+        [LogEvent(EVENT_SHARE_ACCEPTED)],
+    ),
+    (
+        (
+            "\x1b[0;33mW (1263544) stratum_task: message result rejected: "
+            "Above target\x1b[0m"
+        ),
+        [LogEvent(EVENT_SHARE_REJECTED)],
+    ),
+    (
+        "W (98312) stratum_task: message result rejected: Stale",
+        [LogEvent(EVENT_SHARE_REJECTED)],
+    ),
+    (
+        (
+            "\x1b[0;32mI (8841221) system: FOUND BLOCK!!!!!!!!!!!!!!!!!!!!!! "
+            "118232645827.104 > 117000000000.000000\x1b[0m"
+        ),
+        [LogEvent(EVENT_BLOCK)],
+    ),
+    (
+        (
+            "I (8841221) SystemModule: FOUND BLOCK!!!!!!!!!!!!!!!!!!!!!! "
+            "118232645827.104 > 117000000000.000000"
+        ),
+        [LogEvent(EVENT_BLOCK)],
+    ),
+    (
+        (
+            "\x1b[0;32mI (301542) power_management: Temp: 58.4 °C, SetPoint: "
+            "60.0 °C, Output: 38.2% (P:-1.6 I:39.8 D_val:0.0) D_start:0.0\x1b[0m"
+        ),
+        [LogEvent(EVENT_TEMPERATURE, 58.4)],
+    ),
+    (
+        (
+            "\x1b[0;31mE (4123301) power_management: OVERHEAT! "
+            "VR: 105.000000C ASIC 76.500000C\x1b[0m"
+        ),
+        [
+            LogEvent(EVENT_VR_TEMPERATURE, 105.0),
+            LogEvent(EVENT_TEMPERATURE, 76.5),
+        ],
+    ),
+]
+
+# Lines that mention shares, blocks or temperatures without reporting one
+QUIET_LINES = [
+    "I (1012) power_management: Target temp: 60 C",
+    "W (22145) asic: overheat: temp_limit=70",
+    "I (530981) stratum_task: Found block template change",
+    "I (530982) stratum_api: rx: {\"id\":null,\"method\":\"mining.notify\"}",
+    "I (530990) stratum_task: Set stratum difficulty: 1000",
+    "I (531122) asic_result: Ver: 20C8A000 Nonce 3A7C01F2 diff 1843.2 of 1000.",
+    "I (4012) system: Found blocks: 0",
+    "I (4013) stratum_task: block height 871234",
+    "I (4100) power_management: Fan RPM: 4200",
+    "I (99) http_server: Temp: 58.4 °C",
+    "message result accepted",
+    "",
+]
+
+
+@pytest.mark.parametrize(("line", "events"), TELEMETRY_LINES)
+def test_parse_telemetry(line: str, events: list[LogEvent]) -> None:
+    """Telemetry lines yield their events."""
+    assert parse_log_line(line) == events
+
+
+@pytest.mark.parametrize("line", QUIET_LINES)
+def test_parse_ignores_other_lines(line: str) -> None:
+    """Lines that report no telemetry yield nothing."""
+    assert parse_log_line(line) == []
+
+
+def test_stream_parser_joins_split_frames() -> None:
+    """A line split across frames is parsed once it is complete."""
+    parser = LogStreamParser()
+    assert parser.feed("\x1b[0;32mI (1254833) stratum_task: message res") == []
+    assert parser.feed("ult accepted\x1b[0m\n") == [LogEvent(EVENT_SHARE_ACCEPTED)]
+    assert parser.lines == 1
+
+
+def test_stream_parser_frame_starting_a_line() -> None:
+    """A frame starting a new log line completes the buffered one."""
+    parser = LogStreamParser()
+    assert parser.feed("I (1) stratum_task: message result accepted") == []
+    assert parser.feed("I (2) stratum_task: message result rejected\n") == [
+        LogEvent(EVENT_SHARE_ACCEPTED),
+        LogEvent(EVENT_SHARE_REJECTED),
+    ]
+
+
+class _BrokenSession:
+    """Session whose websocket connects fail with an unexpected error."""
+
+    def __init__(self) -> None:
+        self.attempts = 0
+
+    def ws_connect(self, url: str, **kwargs: object) -> None:
+        self.attempts += 1
+        raise RuntimeError("unexpected")
+
+
+def test_stream_retries_after_unexpected_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An unexpected error is logged and retried with backoff."""
+    monkeypatch.setattr(push, "PUSH_RECONNECT_BASE", 0.001)
+    session = _BrokenSession()
+
+    async def run() -> None:
+        stream = MinerStream("192.0.2.10", session, lambda ip, event: None)
+        stream.start()
+        await asyncio.sleep(0.1)
+        assert not stream.connected
+        assert stream._task is not None and not stream._task.done()
+        await stream.async_stop()
+
+    asyncio.run(run())
+    assert session.attempts > 1
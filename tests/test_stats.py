@@ -0,0 +1,148 @@
+"""Tests for the rolling statistics and anomaly detection."""
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from custom_components.bitaxe.stats import AnomalyDetector, RollingStats
+
+CAPACITY = 20
+WINDOWS = (30, 120, 600)
+
+
+def test_rolling_stats_match_brute_force() -> None:
+    """Windows agree with recomputing them from a list of all samples."""
+    rng = random.Random(1)
+    rolling = RollingStats(CAPACITY, WINDOWS)
+    samples: list[tuple[float, float, float, float]] = []
+    now = 0.0
+    accepted = rejected = 0
+    accepted_total = rejected_total = 0.0
+    for count in range(200):
+        now += rng.uniform(1, 15)
+        hashrate = rng.uniform(400, 600)
+        if count == 90:
+            # The miner rebooted and its counters start over
+            accepted, rejected = 3, 1
+            accepted_total += 3
+            rejected_total += 1
+        elif count:
+            new_accepted = rng.randint(0, 5)
+            new_rejected = rng.randint(0, 1)
+            accepted += new_accepted
+            rejected += new_rejected
+            accepted_total += new_accepted
+            rejected_total += new_rejected
+        else:
+            accepted, rejected = 1000, 10
+        rolling.add(now, hashrate, accepted, rejected)
+        samples.append((now, hashrate, accepted_total, rejected_total))
+
+        # Only the last CAPACITY samples are kept
+        kept = samples[-CAPACITY:]
+        for window in WINDOWS:
+            inside = [sample for sample in kept if sample[0] >= now - window]
+            oldest, newest = inside[0], inside[-1]
+            assert rolling.average(window) == pytest.approx(
+                sum(sample[1] for sample in inside) / len(inside)
+            )
+
+            elapsed = newest[0] - oldest[0]
+            shares = newest[2] - oldest[2]
+            if elapsed > 0:
+                assert rolling.share_rate(window) == pytest.approx(
+                    shares * 60 / elapsed
+                )
+            else:
+                assert rolling.share_rate(window) is None
+
+            rejects = newest[3] - oldest[3]
+            if shares + rejects > 0:
+                assert rolling.reject_ratio(window) == pytest.approx(
+                    rejects / (shares + rejects)
+                )
+            else:
+                assert rolling.reject_ratio(window) is None
+
+
+def test_rolling_stats_empty() -> None:
+    """Without samples there is nothing to report."""
+    rolling = RollingStats(CAPACITY, WINDOWS)
+    assert rolling.average(30) is None
+    assert rolling.share_rate(30) is None
+    assert rolling.reject_ratio(30) is None
+
+
+def _detector() -> AnomalyDetector:
+    """Return a detector with a 5 poll warm-up and a 3 sigma threshold."""
+    return AnomalyDetector(0.5, 0.1, 5, 3.0, 5)
+
+
+def test_anomaly_warmup() -> None:
+    """Metrics are scored only once their baseline has enough samples."""
+    detector = _detector()
+    for _ in range(4):
+        detector.add("10.0.6.1", {"temperature": 50.0, "hashrate": None})
+        assert detector.evaluate(["10.0.6.1"]) == []
+        assert detector.scores["10.0.6.1"] == {}
+        assert "10.0.6.1" not in detector.health
+
+    detector.add("10.0.6.1", {"temperature": 50.0})
+    detector.evaluate(["10.0.6.1"])
+    assert detector.scores["10.0.6.1"] == {"temperature": 0.0}
+    assert detector.health["10.0.6.1"] == 100
+
+
+def test_anomaly_score_against_own_noise() -> None:
+    """A miner alone is scored against the noise of its own baseline."""
+    detector = _detector()
+    for _ in range(5):
+        detector.add("10.0.6.1", {"temperature": 50.0})
+    detector.add("10.0.6.1", {"temperature": 60.0})
+    assert detector.evaluate(["10.0.6.1"]) == []
+
+    # Level 55, baseline 51, noise 0.1 * 10 ** 2
+    z_score = (55 - 51) / math.sqrt(10)
+    assert detector.scores["10.0.6.1"] == {"temperature": round(z_score, 2)}
+    penalty = (z_score - 1) / (2 * 3.0)
+    assert detector.health["10.0.6.1"] == round(100 * (1 - penalty))
+
+
+def test_anomaly_fleet_wide_drop_is_not_flagged() -> None:
+    """Only a miner drifting apart from the fleet is flagged."""
+    detector = _detector()
+    ips = [f"10.0.6.{host}" for host in range(1, 7)]
+    for _ in range(5):
+        for ip in ips:
+            detector.add(ip, {"hashrate": 500.0})
+        detector.evaluate(ips)
+
+    # A pool outage drags every miner down alike
+    for ip in ips:
+        detector.add(ip, {"hashrate": 250.0})
+    assert detector.evaluate(ips) == []
+    assert all(detector.health[ip] == 100 for ip in ips)
+
+    # One miner keeps dropping while the rest recover
+    for _ in range(3):
+        for ip in ips:
+            detector.add(ip, {"hashrate": 100.0 if ip == ips[0] else 500.0})
+    started = detector.evaluate(ips)
+    assert [(event["miner_ip"], event["metric"]) for event in started] == [
+        (ips[0], "hashrate")
+    ]
+    assert started[0]["basis"] == "fleet"
+    assert started[0]["z_score"] < -3.0
+    assert detector.health[ips[0]] == 0
+    assert all(detector.health[ip] == 100 for ip in ips[1:])
+
+    # Still anomalous, but the event already fired
+    for ip in ips:
+        detector.add(ip, {"hashrate": 100.0 if ip == ips[0] else 500.0})
+    assert detector.evaluate(ips) == []
+
+    detector.remove(ips[0])
+    assert ips[0] not in detector.scores
+    assert ips[0] not in detector.health